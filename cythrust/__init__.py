@@ -1,6 +1,10 @@
 # coding: utf-8
+import os
 import sys
+import json
 import hashlib
+import operator
+import functools
 from collections import OrderedDict, Container
 from ConfigParser import NoOptionError, NoSectionError
 
@@ -19,7 +23,23 @@ from .template import (SORT_TEMPLATE, BASE_TEMPLATE, REDUCE_BY_KEY_TEMPLATE,
                        COUNT_TEMPLATE, TRANSFORM_SETUP_TEMPLATE,
                        TRANSFORM_TEMPLATE, SCATTER_SETUP_TEMPLATE,
                        SCATTER_TEMPLATE, REDUCE_SETUP_TEMPLATE,
-                       REDUCE_TEMPLATE)
+                       REDUCE_TEMPLATE, TRANSFORM_REDUCE_BY_KEY_SETUP_TEMPLATE,
+                       TRANSFORM_REDUCE_BY_KEY_TEMPLATE,
+                       FUSED_TRANSFORM_HEADER_TEMPLATE,
+                       FUSED_TRANSFORM_PXD_TEMPLATE,
+                       FUSED_TRANSFORM_SETUP_TEMPLATE,
+                       FUSED_TRANSFORM_TEMPLATE,
+                       FILTER_SETUP_TEMPLATE, FILTER_TEMPLATE,
+                       GATHER_SETUP_TEMPLATE, GATHER_TEMPLATE,
+                       HOST_REDUCE_BY_KEY_SETUP_TEMPLATE,
+                       HOST_REDUCE_BY_KEY_TEMPLATE,
+                       PACKED_SORT_SETUP_TEMPLATE, PACKED_SORT_TEMPLATE,
+                       JOIN_SETUP_TEMPLATE, JOIN_COUNT_TEMPLATE,
+                       RANGE_COUNT_TEMPLATE, JOIN_EXPAND_TEMPLATE,
+                       REPLACE_WHERE_SETUP_TEMPLATE, REPLACE_WHERE_TEMPLATE,
+                       ZONE_MAP_SETUP_TEMPLATE, ZONE_MAP_TEMPLATE,
+                       AGG_REDUCE_BY_KEY_SETUP_TEMPLATE,
+                       AGG_REDUCE_BY_KEY_TEMPLATE)
 
 
 NP_TYPE_TO_CTYPE = OrderedDict([('int8', 'int8_t'),
@@ -34,9 +54,35 @@ NP_TYPE_TO_CTYPE = OrderedDict([('int8', 'int8_t'),
                                 ('float', 'double'),
                                 ('float64', 'double')])
 
+# `numpy` data types supported by `DeviceVector`.
+DEVICE_VECTOR_DTYPES = (np.int8, np.uint8, np.int16, np.uint16, np.int32,
+                        np.uint32, np.int64, np.uint64, np.float32,
+                        np.float64)
+
+DEVICE_SYSTEMS = ('THRUST_DEVICE_SYSTEM_CPP', 'THRUST_DEVICE_SYSTEM_OMP',
+                  'THRUST_DEVICE_SYSTEM_TBB', 'THRUST_DEVICE_SYSTEM_CUDA')
+
 PANDAS_TO_THRUST = {'sum': 'plus', 'product': 'multiplies',
                     'min': 'minimum', 'max': 'maximum'}
 
+# Operations supported by `GroupBy.agg` in addition to `PANDAS_TO_THRUST`,
+# which are computed from accumulators reduced in a single pass *(see
+# `GroupBy.agg_accumulated`)*.
+ACCUMULATED_AGG_OPS = ('count', 'mean', 'var', 'std', 'first', 'last',
+                       'argmin', 'argmax')
+
+# Maximum number of compiled kernels kept by each in-process kernel cache.
+KERNEL_CACHE_SIZE = 128
+
+# Extensions of the C++ headers and Cython declarations compiled kernels may
+# depend on *(see `Context.kernel_hash`)*.
+KERNEL_HEADER_EXTENSIONS = ('.h', '.hpp', '.pxd')
+
+# Name and format version of the metadata file of an on-disk frame *(see
+# `DeviceDataFrame.to_directory`)*.
+FRAME_METADATA_NAME = 'frame.json'
+FRAME_METADATA_VERSION = 1
+
 NAMED_POSITIONS = ['first', 'second', 'third', 'fourth', 'fifth', 'sixth',
                    'seventh', 'eighth', 'ninth']
 
@@ -52,6 +98,249 @@ TRANSFORM_IDENTITIES = {'plus': 0, 'multiplies': 1,
                         'minimum': lambda t: type_info(t).max,
                         'maximum': lambda t: type_info(t).min}
 
+# Binary functions to combine partial results of each reduce operation, e.g.,
+# the results for consecutive chunks of rows *(see `stream_reduce`)*.
+REDUCE_COMBINERS = {'plus': operator.add, 'multiplies': operator.mul,
+                    'minimum': min, 'maximum': max}
+
+
+def _fused_floor_div(a, t):
+    # Floor division, rounding towards negative infinity like Python and
+    # `theano` *(C++ integer division truncates towards zero)*.
+    if t in ('float', 'double'):
+        return 'floor((double)%s / (double)%s)' % tuple(a)
+    x, y = ['((%s)%s)' % (t, v) for v in a]
+    return ('(%s / %s - (%s %% %s != 0 && ((%s %% %s < 0) != (%s < 0))))' %
+            (x, y, x, y, x, y, y))
+
+
+def _fused_floor_mod(a, t):
+    # Remainder with the sign of the divisor, like Python and `theano`
+    # *(C++ `%` and `fmod` take the sign of the dividend)*.
+    if t in ('float', 'double'):
+        x, y = ['((double)%s)' % v for v in a]
+        r = 'fmod(%s, %s)' % (x, y)
+    else:
+        x, y = ['((%s)%s)' % (t, v) for v in a]
+        r = '(%s %% %s)' % (x, y)
+    return '(%s + ((%s != 0 && ((%s < 0) != (%s < 0))) ? %s : 0))' % (
+        r, r, r, y, y)
+
+
+# C++ expression for each `theano` scalar operation supported by
+# `FusedTransform`, given the argument expressions and the C type of the
+# result.
+FUSED_SCALAR_OPS = {
+    'Add': lambda a, t: ' + '.join(a),
+    'Mul': lambda a, t: ' * '.join(a),
+    'Sub': lambda a, t: '%s - %s' % tuple(a),
+    'TrueDiv': lambda a, t: '(%s)%s / (%s)%s' % (t, a[0], t, a[1]),
+    'IntDiv': _fused_floor_div,
+    'Mod': _fused_floor_mod,
+    'Pow': lambda a, t: 'pow((double)%s, (double)%s)' % tuple(a),
+    'Neg': lambda a, t: '-%s' % a[0],
+    'Abs': lambda a, t: '(%s < 0 ? -%s : %s)' % (a[0], a[0], a[0]),
+    'Sqr': lambda a, t: '%s * %s' % (a[0], a[0]),
+    'Sqrt': lambda a, t: 'sqrt((double)%s)' % a[0],
+    'Exp': lambda a, t: 'exp((double)%s)' % a[0],
+    'Log': lambda a, t: 'log((double)%s)' % a[0],
+    'Inv': lambda a, t: '1. / %s' % a[0],
+    'Minimum': lambda a, t: '(%s < %s ? %s : %s)' % (a[0], a[1], a[0], a[1]),
+    'Maximum': lambda a, t: '(%s > %s ? %s : %s)' % (a[0], a[1], a[0], a[1]),
+    'LT': lambda a, t: '%s < %s' % tuple(a),
+    'GT': lambda a, t: '%s > %s' % tuple(a),
+    'LE': lambda a, t: '%s <= %s' % tuple(a),
+    'GE': lambda a, t: '%s >= %s' % tuple(a),
+    'EQ': lambda a, t: '%s == %s' % tuple(a),
+    'NEQ': lambda a, t: '%s != %s' % tuple(a),
+    'Identity': lambda a, t: a[0],
+    'Cast': lambda a, t: a[0],
+    'Second': lambda a, t: a[1]}
+
+# Largest supported `thrust::tuple`, i.e., the maximum number of iterators
+# in a single zip iterator.
+MAX_ZIP_ARITY = 9
+
+# Maximum number of inputs/outputs of a `FusedTransform`.
+FUSED_MAX_ARITY = MAX_ZIP_ARITY
+
+# Type of the row positions of a `SelectionViewGroup` index.
+SELECTION_INDEX_DTYPE = np.uint32
+
+# Aggregation engines supported by `GroupBy`.
+GROUPBY_ENGINES = ('sort', 'argsort', 'hash', 'dense')
+
+# Maximum range of key values *(i.e., `max - min + 1`)* supported by the
+# `dense` `GroupBy` engine.
+DENSE_MAX_KEY_RANGE = 1 << 16
+
+# Default number of rows per block of a `ZoneMap`.
+ZONE_MAP_BLOCK_SIZE = 1 << 16
+
+# Key-based join types supported by `merge`.
+JOIN_TYPES = ('inner', 'left', 'semi')
+
+# Maximum combined width of integer key columns which are packed into a
+# single key for sorting *(see `get_packed_sort_func`)*.
+PACKED_SORT_MAX_BITS = 64
+
+# Reduce operations applied to the transforms of each column by `describe`
+# *(see `get_describe_transforms`)*.
+DESCRIBE_REDUCE_OPS = ['plus', 'plus', 'minimum', 'maximum']
+
+# Statistics computed for each value column by `GroupBy.describe`, in order.
+GROUPBY_DESCRIBE_OPS = ('count', 'sum', 'mean', 'std', 'min', 'max')
+
+
+def graph_fingerprint(operation_graph):
+    '''
+    Return a hex digest identifying the structure of a `theano` operation
+    graph.
+
+    Unlike `hash`, the fingerprint only depends on the operations in the
+    graph, the names and types of the graph inputs, and the values of any
+    constants.  Structurally identical graphs therefore have the same
+    fingerprint, even when created in different processes.
+    '''
+    memo = {}
+
+    def _fingerprint(variable):
+        if id(variable) in memo:
+            return memo[id(variable)]
+        owner = variable.owner
+        if owner is None:
+            data = getattr(variable, 'data', None)
+            if data is not None:
+                data = np.asarray(data)
+                signature = 'constant(%s, %s, %s)' % (variable.type,
+                                                      data.shape,
+                                                      data.tostring()
+                                                      .encode('hex'))
+            else:
+                signature = 'input(%s, %s)' % (variable.name, variable.type)
+        else:
+            signature = '%s[%d](%s)' % (owner.op,
+                                        owner.outputs.index(variable),
+                                        ', '.join(_fingerprint(v)
+                                                  for v in owner.inputs))
+        memo[id(variable)] = hashlib.sha1(signature).hexdigest()
+        return memo[id(variable)]
+
+    return _fingerprint(operation_graph)
+
+
+def transform_name(prefix, operation_graph):
+    '''
+    Return a functor name for the specified operation graph that is stable
+    across processes *(see `graph_fingerprint`)*.
+    '''
+    return '%s_%s' % (prefix, graph_fingerprint(operation_graph)[:16])
+
+
+def _stable_repr(obj):
+    '''
+    Return a representation of `obj` that does not depend on dictionary
+    ordering, suitable for hashing across processes.
+    '''
+    if isinstance(obj, dict):
+        return '{%s}' % ', '.join('%s: %s' % (_stable_repr(k),
+                                              _stable_repr(v))
+                                  for k, v in sorted(obj.items()))
+    elif isinstance(obj, (list, tuple)):
+        return '(%s)' % ', '.join(_stable_repr(v) for v in obj)
+    return repr(obj)
+
+
+@functools32.lru_cache()
+def _package_header_digest():
+    '''
+    Return a hash of the contents of the C++ headers and Cython declarations
+    shipped with `cythrust` *(e.g., `src/*.hpp`, `thrust/*.pxd`)*.
+
+    Computed once per process, since package files do not change at runtime.
+    '''
+    package_dir = path(get_includes()[0]).abspath()
+    return _header_digest(sorted(f for f in package_dir.walkfiles()
+                                 if f.ext in KERNEL_HEADER_EXTENSIONS),
+                          package_dir)
+
+
+def _header_digest(file_paths, root):
+    # Hash of the names *(relative to `root`)* and contents of `file_paths`.
+    digest = hashlib.sha1()
+    for file_path in file_paths:
+        digest.update(root.relpathto(file_path))
+        digest.update(file_path.bytes())
+    return digest.hexdigest()
+
+
+@functools32.lru_cache()
+def _toolchain_version(compiler):
+    '''
+    Return a string identifying the versions of `cythrust`, Cython, and the
+    `compiler` command *(first line of `<compiler> --version`)*.
+    '''
+    import subprocess
+    import Cython
+
+    try:
+        cythrust_version = pkg_resources.get_distribution('cythrust').version
+    except pkg_resources.DistributionNotFound:
+        cythrust_version = None
+    try:
+        compiler_version = (subprocess.check_output([compiler, '--version'],
+                                                    stderr=subprocess.STDOUT)
+                            .splitlines()[0])
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        compiler_version = compiler
+    return 'cythrust %s; Cython %s; %s' % (cythrust_version,
+                                          Cython.__version__,
+                                          compiler_version)
+
+
+class LRUCache(OrderedDict):
+    '''
+    Dictionary holding at most `maxsize` items *(`KERNEL_CACHE_SIZE` by
+    default)*.  When full, the least recently used item is discarded, as for
+    `functools32.lru_cache`.
+
+    Used for in-process caches keyed on values which are not arguments of a
+    single function *(e.g., `DeviceViewGroup.TRANSFORM_CACHE`)*.
+
+    Use `lookup` to read an item and mark it as most recently used.  Plain
+    item access does not reorder items, since `OrderedDict` accessors
+    *(e.g., `values`, `items`, `copy`)* read items while iterating over keys.
+    '''
+    def __init__(self, maxsize=KERNEL_CACHE_SIZE):
+        super(LRUCache, self).__init__()
+        self.maxsize = maxsize
+
+    def lookup(self, key):
+        '''
+        Return the item for `key`, and mark it as most recently used.
+
+        Raises `KeyError` if `key` is not in the cache.
+        '''
+        value = OrderedDict.__getitem__(self, key)
+        # Move the item to the end, i.e., mark it as most recently used.
+        OrderedDict.__delitem__(self, key)
+        OrderedDict.__setitem__(self, key, value)
+        return value
+
+    def copy(self):
+        # `OrderedDict.copy` passes the items as the first argument, which is
+        # `maxsize` here.
+        cache = self.__class__(self.maxsize)
+        cache.update(self)
+        return cache
+
+    def __setitem__(self, key, value):
+        if key in self:
+            OrderedDict.__delitem__(self, key)
+        OrderedDict.__setitem__(self, key, value)
+        while len(self) > self.maxsize:
+            del self[next(iter(self))]
+
 
 class Functor(object):
     def __init__(self, code, func):
@@ -129,26 +418,195 @@ class Transform(object):
 
         self.dfg = DataFlowGraph(operation_graph)
         self.thrust_code = ThrustCode(self.dfg)
+        self.fingerprint = graph_fingerprint(operation_graph)
 
         code = self.thrust_code.header_code(functor_name)
         hash_label = hashlib.sha1(code).hexdigest()[:12]
+        cyheader_code = self.thrust_code.cython_header_code(
+            functor_name, '"%s.hpp"' % hash_label)
+        _write_functor_module(output_dir, functor_name, hash_label, code,
+                              cyheader_code)
+
+        self.__doc__ = str(theano.pp(operation_graph))
+        self.output_dir = path(output_dir).expand().abspath()
+        self.functor_name = functor_name
+
+        if not self.output_dir.parent in sys.path:
+            sys.path.insert(0, str(self.output_dir.parent))
 
-        output_dir.makedirs_p()
+    def get_includes(self):
+        return [self.output_dir]
 
-        py_init_path = output_dir.joinpath('__init__.py')
-        cy_init_path = output_dir.joinpath('__init__.pxd')
-        header_path = output_dir.joinpath('%s.hpp' % hash_label)
-        cyheader_path = output_dir.joinpath('%s.pxd' % functor_name)
 
-        with header_path.open('wb') as output:
-            output.write(code)
-        with cyheader_path.open('wb') as output:
-            output.write(self.thrust_code.cython_header_code(
-                functor_name, '"%s.hpp"' % hash_label))
-        py_init_path.touch()
-        cy_init_path.touch()
+def _write_functor_module(output_dir, functor_name, hash_label, code,
+                          cyheader_code):
+    # Write C++ header, Cython header, and `__init__` files of a functor
+    # module *(see `Transform`)*.
+    output_dir.makedirs_p()
 
-        self.__doc__ = str(theano.pp(operation_graph))
+    py_init_path = output_dir.joinpath('__init__.py')
+    cy_init_path = output_dir.joinpath('__init__.pxd')
+    header_path = output_dir.joinpath('%s.hpp' % hash_label)
+    cyheader_path = output_dir.joinpath('%s.pxd' % functor_name)
+
+    # Only write files that are missing or out of date.  Leaving identical
+    # files untouched avoids needless filesystem writes, and keeps timestamps
+    # stable for modules already compiled against them.
+    for file_path, file_code in ((header_path, code),
+                                 (cyheader_path, cyheader_code)):
+        if not file_path.isfile() or file_path.bytes() != file_code:
+            with file_path.open('wb') as output:
+                output.write(file_code)
+    for init_path in (py_init_path, cy_init_path):
+        if not init_path.isfile():
+            init_path.touch()
+
+
+def fused_transform_code(operation_graphs):
+    '''
+    Return `(inputs, temporaries, outputs)` describing C++ code computing
+    the outputs of all `operation_graphs` for one row *(see
+    `FusedTransform`)*, where:
+
+     - `inputs` lists `(column name, dtype)` for each input column.
+     - `temporaries` lists `(name, C type, expression)` for each computed
+       value, in evaluation order.  Structurally identical subexpressions
+       *(see `graph_fingerprint`)* are only computed once.
+     - `outputs` lists the C++ expression of each graph output.
+
+    Input column `i` is referred to as `_in<i>` in expressions.
+
+    Raises `NotImplementedError` if a graph contains an unsupported
+    operation *(see `FUSED_SCALAR_OPS`)*, or uses `arange` other than as the
+    indices of an identity `take`, i.e., `take(arange(0, n, 1))`.
+    '''
+    from theano.gof.graph import inputs as graph_inputs, io_toposort
+    from theano.tensor.basic import ARange
+    from theano.tensor.elemwise import DimShuffle, Elemwise
+    from theano.tensor.subtensor import AdvancedSubtensor1
+
+    def _ctype(dtype):
+        if dtype not in NP_TYPE_TO_CTYPE:
+            raise NotImplementedError('Unsupported type: %s' % dtype)
+        return NP_TYPE_TO_CTYPE[dtype]
+
+    def _name(variable):
+        # `ARange` outputs have no expression, since they are only
+        # supported as identity `take` indices *(see below)*.
+        if id(variable) not in names:
+            raise NotImplementedError('Unsupported use of: %s' % variable)
+        return names[id(variable)]
+
+    def _is_identity_arange(variable):
+        # `True` if `variable` is `arange(0, n, 1)`, i.e., `take` with
+        # `variable` as indices selects the rows of the column in order.
+        if variable.owner is None or not isinstance(variable.owner.op,
+                                                    ARange):
+            return False
+        start, stop, step = [getattr(v, 'data', None)
+                             for v in variable.owner.inputs]
+        return (start is not None and step is not None and
+                np.asarray(start).item() == 0 and
+                np.asarray(step).item() == 1)
+
+    graphs = list(operation_graphs)
+    variables = graph_inputs(graphs)
+    inputs = OrderedDict()
+    names = {}
+    temporaries = OrderedDict()
+
+    for variable in variables:
+        data = getattr(variable, 'data', None)
+        if data is not None:
+            data = np.asarray(data)
+            if data.size != 1 or not np.isfinite(data).all():
+                raise NotImplementedError('Only finite scalar constants are '
+                                          'supported.')
+            value = data.item()
+            names[id(variable)] = '(%s)%s' % (_ctype(variable.dtype),
+                                              repr(value)
+                                              if isinstance(value, float)
+                                              else int(value))
+        else:
+            # Inputs with the same name refer to the same column.
+            if variable.name not in inputs:
+                inputs[variable.name] = variable.dtype
+            names[id(variable)] = '_in%d' % inputs.keys().index(variable
+                                                                .name)
+
+    for node in io_toposort(variables, graphs):
+        if isinstance(node.op, ARange):
+            # Only supported as identity `take` indices *(see below)*.  Any
+            # other use raises `NotImplementedError` *(see `_name`)*.
+            continue
+        elif isinstance(node.op, DimShuffle) or (
+                isinstance(node.op, AdvancedSubtensor1) and
+                _is_identity_arange(node.inputs[1])):
+            # Broadcast of scalar, or identity `take` of a column *(see
+            # `DeviceViewGroup.get_transforms`)*.
+            names[id(node.outputs[0])] = _name(node.inputs[0])
+        elif isinstance(node.op, Elemwise):
+            op_name = type(node.op.scalar_op).__name__
+            if op_name not in FUSED_SCALAR_OPS:
+                raise NotImplementedError('Unsupported operation: %s' %
+                                          node.op)
+            output = node.outputs[0]
+            key = graph_fingerprint(output)
+            if key not in temporaries:
+                ctype = _ctype(output.dtype)
+                expression = FUSED_SCALAR_OPS[op_name](
+                    [_name(v) for v in node.inputs], ctype)
+                temporaries[key] = ('_t%d' % len(temporaries), ctype,
+                                    expression)
+            names[id(output)] = temporaries[key][0]
+        else:
+            raise NotImplementedError('Unsupported operation: %s' % node.op)
+
+    return (inputs.items(), temporaries.values(),
+            [_name(g) for g in graphs])
+
+
+class FusedTransform(object):
+    '''
+    Generate a single Thrust functor computing the outputs of _several_
+    operation graphs for each row, along with the Cython header declaring
+    it *(see `Transform`)*.
+
+    Each input column is read once per row, and subexpressions shared by
+    several outputs *(e.g., `a * b` in `a * b + c` and `(a * b) ** 2`)* are
+    computed once per row *(see `fused_transform_code`)*.  This lets
+    `DeviceViewGroup.transform` write all outputs through one zip iterator in
+    a single pass.
+
+    Raises `NotImplementedError` if a graph contains an unsupported
+    operation, or there are more than `FUSED_MAX_ARITY` inputs or outputs.
+    '''
+    def __init__(self, operation_graphs, functor_name, output_dir):
+        import theano
+
+        operation_graphs = list(operation_graphs)
+        inputs, temporaries, outputs = fused_transform_code(operation_graphs)
+        if max(len(inputs), len(outputs)) > FUSED_MAX_ARITY:
+            raise NotImplementedError('At most %d inputs/outputs are '
+                                      'supported.' % FUSED_MAX_ARITY)
+        self.input_columns = [c for c, dtype in inputs]
+        self.output_dtypes = [np.dtype(g.dtype) for g in operation_graphs]
+
+        code = (jinja2.Template(FUSED_TRANSFORM_HEADER_TEMPLATE)
+                .render(functor_name=functor_name,
+                        inputs=[('_in%d' % i, NP_TYPE_TO_CTYPE[dtype])
+                                for i, (c, dtype) in enumerate(inputs)],
+                        temporaries=temporaries, outputs=outputs,
+                        output_ctypes=[NP_TYPE_TO_CTYPE[d.name]
+                                       for d in self.output_dtypes]))
+        hash_label = hashlib.sha1(code).hexdigest()[:12]
+        cyheader_code = (jinja2.Template(FUSED_TRANSFORM_PXD_TEMPLATE)
+                         .render(functor_name=functor_name,
+                                 header='%s.hpp' % hash_label))
+        _write_functor_module(output_dir, functor_name, hash_label, code,
+                              cyheader_code)
+
+        self.__doc__ = '\n'.join(str(theano.pp(g)) for g in operation_graphs)
         self.output_dir = path(output_dir).expand().abspath()
         self.functor_name = functor_name
 
@@ -170,6 +628,8 @@ class Context(_Context):
     LIB_PATH = path('~/.cache/cythrust/lib').expand()
     if str(LIB_PATH) not in sys.path:
         sys.path.insert(0, str(LIB_PATH))
+    # Number of compile pool worker processes (`None` means one per core).
+    COMPILE_WORKERS = None
 
     def __init__(self, device_system='THRUST_DEVICE_SYSTEM_CPP', tag='',
                  include_dirs=None, **kwargs):
@@ -187,6 +647,13 @@ class Context(_Context):
 
         [1]: https://github.com/thrust/thrust/wiki/Device-Backends
         '''
+        # Keep constructor arguments so an equivalent context can be created
+        # in compile pool worker processes *(see `submit_pyx_module`)*.
+        self._init_args = (device_system, tag, include_dirs, kwargs.copy())
+        self._compile_executor = None
+        # Transforms and fused transforms built by this context, keyed on
+        # functor name and graph fingerprint.
+        self._transforms = LRUCache()
         if device_system == 'THRUST_DEVICE_SYSTEM_CUDA':
             if 'builder' not in kwargs:
                 kwargs['builder'] = NvccBuilder()
@@ -245,12 +712,38 @@ class Context(_Context):
          - Add files to a directory with the specified `module_name` within the
            current context library path root.  This should place the module on
            the Python path.
+
+        Transforms are cached by name and graph fingerprint, so repeated
+        calls for a structurally identical graph return the existing
+        `Transform` instance.
         '''
         if module_name is None:
             module_name = transform_name
-        output_dir = self.LIB_PATH.joinpath(module_name)
-        transform = Transform(operation_graph, transform_name, output_dir)
-        return transform
+        key = (module_name, transform_name, graph_fingerprint(operation_graph))
+        if key not in self._transforms:
+            output_dir = self.LIB_PATH.joinpath(module_name)
+            self._transforms[key] = Transform(operation_graph, transform_name,
+                                              output_dir)
+        return self._transforms.lookup(key)
+
+    def build_fused_transform(self, operation_graphs):
+        '''
+        Return a `FusedTransform` computing all of `operation_graphs` in a
+        single functor.  Like `build_transform`, instances are cached by graph
+        fingerprints.
+
+        Raises `NotImplementedError` if the graphs cannot be fused *(see
+        `FusedTransform`)*.
+        '''
+        fingerprint = hashlib.sha1('|'.join(graph_fingerprint(g)
+                                            for g in operation_graphs))
+        functor_name = 'fused_%s' % fingerprint.hexdigest()[:16]
+        key = (functor_name, functor_name, fingerprint.hexdigest())
+        if key not in self._transforms:
+            output_dir = self.LIB_PATH.joinpath(functor_name)
+            self._transforms[key] = FusedTransform(operation_graphs,
+                                                   functor_name, output_dir)
+        return self._transforms.lookup(key)
 
     def inline_pyx_module(self, *args, **kwargs):
         _kwargs = self.kwargs.copy()
@@ -258,12 +751,242 @@ class Context(_Context):
 
         return super(Context, self).inline_pyx_module(*args, **_kwargs)
 
+    @property
+    def system_key(self):
+        '''
+        Name identifying the Thrust device backend (and tag, if set) of this
+        context, e.g., `cpp`, `omp`, or `cuda_debug`.
+        '''
+        system_key = self.device_system.split('_')[-1].lower()
+        if self.tag:
+            system_key += '_%s' % self.tag
+        return system_key
+
+    @property
+    def host_memory(self):
+        '''
+        `True` if device vector data resides in host memory, i.e., for all
+        Thrust device backends other than CUDA.
+        '''
+        return self.device_system != 'THRUST_DEVICE_SYSTEM_CUDA'
+
+    @property
+    def compiler(self):
+        '''
+        Command of the C++ compiler used to build extension modules *(see
+        `kernel_hash`)*.
+        '''
+        if self.device_system == 'THRUST_DEVICE_SYSTEM_CUDA':
+            return 'nvcc'
+        from distutils.sysconfig import get_config_var
+
+        return (os.environ.get('CXX') or get_config_var('CXX') or
+                'c++').split()[0]
+
+    def kernel_hash(self, code, **kwargs):
+        '''
+        Return a content hash identifying the extension module built from
+        `code` using this context.
+
+        The hash covers:
+
+         - The rendered code.
+         - The Thrust device backend and the context tag.
+         - The compile arguments *(including any overrides provided through
+           `kwargs`)*.
+         - The contents of the headers and Cython declarations included by
+           the code, i.e., those shipped with `cythrust` *(see
+           `_package_header_digest`)*, and those of transform modules within
+           `LIB_PATH` *(see `build_transform`)*.
+         - The versions of `cythrust`, Cython, and the C++ compiler *(see
+           `_toolchain_version`)*.
+        '''
+        _kwargs = self.kwargs.copy()
+        _kwargs.update(kwargs)
+        header_digests = [_package_header_digest()]
+        for include_dir in _kwargs.get('include_dirs', []):
+            include_dir = path(include_dir).expand().abspath()
+            if include_dir.startswith(self.LIB_PATH) and include_dir.isdir():
+                header_digests.append(_header_digest(
+                    sorted(f for f in include_dir.files()
+                           if f.ext in KERNEL_HEADER_EXTENSIONS),
+                    include_dir))
+        signature = _stable_repr((code, self.device_system, self.tag,
+                                  _kwargs, header_digests,
+                                  _toolchain_version(self.compiler)))
+        return hashlib.sha1(signature).hexdigest()
+
+    def inline_cached_pyx_module(self, code, **kwargs):
+        '''
+        Equivalent to `inline_pyx_module`, but compiled modules are stored in
+        a content-addressed cache within `LIB_PATH`, i.e.:
+
+            <LIB_PATH>/kernels/<system_key>/kernel_<hash>.pyx
+
+        where `<hash>` is computed by `kernel_hash`.  If a module with the
+        same hash was already built *(e.g., by a previous process)*, it is
+        imported directly without invoking Cython or the C++ compiler.
+
+        Modules are built in a temporary directory and then renamed into
+        place, so concurrent processes never import a partially written
+        module.
+
+        Returns
+        -------
+
+        (module_dir, module_name) : `tuple`
+         * Directory containing the compiled module, and the full dotted name
+           of the module *(importable from `LIB_PATH`)*.
+        '''
+        module_name = 'kernel_%s' % self.kernel_hash(code, **kwargs)
+        full_module_name = '.'.join(['kernels', self.system_key, module_name])
+        pyx_dir = self.LIB_PATH.joinpath('kernels', self.system_key)
+
+        try:
+            exec('import %s' % full_module_name)
+            return pyx_dir, full_module_name
+        except ImportError:
+            pass
+
+        pyx_dir.makedirs_p()
+
+        for d in (pyx_dir.parent, pyx_dir):
+            for init_name in ('__init__.pxd', '__init__.py'):
+                init_path = d.joinpath(init_name)
+                if not init_path.isfile():
+                    init_path.write_bytes('')
+
+        import tempfile
+
+        build_dir = path(tempfile.mkdtemp(prefix='temp_%s__' % module_name,
+                                          dir=pyx_dir))
+        try:
+            pyx_source_path = build_dir.joinpath('%s.pyx' % module_name)
+            pyx_source_path.write_bytes(code)
+            self.build_pyx(pyx_source_path, module_dir=build_dir, **kwargs)
+            # Move the source into place before the extension module, since
+            # the module is importable as soon as it is in place.
+            os.rename(pyx_source_path, pyx_dir.joinpath(pyx_source_path.name))
+            for built_path in build_dir.files('%s.*' % module_name):
+                os.rename(built_path, pyx_dir.joinpath(built_path.name))
+        finally:
+            if build_dir in sys.path:
+                sys.path.remove(build_dir)
+            build_dir.rmtree_p()
+        return pyx_dir, full_module_name
+
+    @property
+    def compile_executor(self):
+        '''
+        Process pool used to compile independent extension modules in
+        parallel.  The pool is created on first use, with `COMPILE_WORKERS`
+        worker processes *(or one per CPU core, if `None`)*.
+        '''
+        if self._compile_executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._compile_executor = ProcessPoolExecutor(
+                max_workers=self.COMPILE_WORKERS)
+        return self._compile_executor
+
+    def shutdown_compile_pool(self, wait=True):
+        '''
+        Shut down the compile pool *(if running)*.  A new pool is created if
+        another build is submitted afterwards.
+        '''
+        if self._compile_executor is not None:
+            self._compile_executor.shutdown(wait=wait)
+            self._compile_executor = None
+
+    def submit_pyx_module(self, code, **kwargs):
+        '''
+        Schedule `inline_cached_pyx_module(code, **kwargs)` to run in the
+        compile pool.
+
+        Since compiled modules are stored in the content-addressed kernel
+        cache, the module may be imported in this process once the returned
+        future has completed.
+
+        __NB__ Any device vector modules cimported by `code` must already be
+        built *(see `submit_device_vector_modules`)*.
+
+        Returns
+        -------
+
+        `concurrent.futures.Future` resolving to the `(module_dir,
+        module_name)` tuple returned by `inline_cached_pyx_module`.
+        '''
+        return self.compile_executor.submit(_build_pyx_module_task,
+                                            self._init_args, code, kwargs)
+
+    def submit_device_vector_modules(self, dtypes=None):
+        '''
+        Schedule the device vector module for each of the specified data
+        types to be built in the compile pool.
+
+        Arguments
+        ---------
+
+         - `dtypes` : `list`-like *(optional)*
+          * `numpy` data types to build.  By default, all types in
+            `DEVICE_VECTOR_DTYPES` are built.
+
+        Returns
+        -------
+
+        `list` of `concurrent.futures.Future`, each resolving to the name of
+        the device vector module for the respective data type.
+        '''
+        if dtypes is None:
+            dtypes = DEVICE_VECTOR_DTYPES
+        return [self.compile_executor.submit(_device_vector_module_task,
+                                             self._init_args,
+                                             np.dtype(dtype).name)
+                for dtype in dtypes]
+
     def from_array(self, array, dtype=None):
         if dtype is None:
             dtype = array.dtype
         vector_class = self.get_device_vector_class(dtype)
         return vector_class.from_array(array)
 
+    def borrow_array(self, array):
+        '''
+        Return a `DeviceVectorView` of the memory of `array` *(e.g., a
+        `numpy.memmap`)*, _without_ copying.
+
+        Only supported for host backends *(see `host_memory`)*.  See
+        `DeviceVectorView.from_array` for details.
+        '''
+        if not self.host_memory:
+            raise ValueError('Borrowed memory is only supported for host '
+                             'backends, not `%s`.' % self.device_system)
+        view_class = self.get_device_vector_view_class(array.dtype)
+        return view_class.from_array(array)
+
+    def prebuild_device_vectors(self, dtypes=None):
+        '''
+        Build *(or import, if already built)* the device vector module for
+        each of the specified data types, so that later calls to `from_array`,
+        etc. do not trigger compilation.
+
+        Arguments
+        ---------
+
+         - `dtypes` : `list`-like *(optional)*
+          * `numpy` data types to build.  By default, all types in
+            `DEVICE_VECTOR_DTYPES` are built.
+
+        Returns
+        -------
+
+        `list` of device vector module names, one per data type.
+        '''
+        if dtypes is None:
+            dtypes = DEVICE_VECTOR_DTYPES
+        return [self.get_device_vector_module(np.dtype(dtype).type)
+                for dtype in dtypes]
+
     def clear_cache(self):
         self.get_device_vector_class.cache_clear()
         self.get_device_vector_module.cache_clear()
@@ -289,19 +1012,40 @@ class Context(_Context):
             dtype = dtype.type
         np_dtype = 'np.' + dtype.__name__
         c_dtype = NP_TYPE_TO_CTYPE[dtype.__name__]
-        system_key = self.device_system.split('_')[-1].lower()
-        if self.tag:
-            system_key += '_%s' % self.tag
-        full_module_name = '.'.join(['device_vector', system_key,
-                                     np_dtype[3:]])
+        system_key = self.system_key
+
+        # Prefer device vector modules shipped as package extensions *(see
+        # `pavement.py`)*, since they never require compilation at runtime.
+        packaged_module_name = '.'.join(['cythrust', 'device_vector',
+                                         system_key, np_dtype[3:]])
+        try:
+            exec('import %s' % packaged_module_name)
+            return packaged_module_name
+        except ImportError:
+            pass
+
+        # Render the templates first, since the module name includes a hash
+        # of the rendered sources.  A module compiled from outdated templates
+        # *(e.g., by an earlier version of `cythrust`)* is never imported.
+        sources = OrderedDict()
+        for template_name in ('device_vector.pyxt', 'device_vector.pxdt'):
+            template = jinja2.Template(self.template_path
+                                       .joinpath(template_name).bytes())
+            sources[template_name[:-1]] = template.render(
+                C_DTYPE=c_dtype, NP_DTYPE=np_dtype,
+                HOST_MEMORY=self.host_memory)
+        source_hash = hashlib.sha1(''.join(sources.values())).hexdigest()[:12]
+        dtype_key = '%s_%s' % (np_dtype[3:], source_hash)
+
+        full_module_name = '.'.join(['device_vector', system_key, dtype_key])
         try:
             exec('import %s' % full_module_name)
             return full_module_name
         except ImportError:
             pass
 
-        pyx_dir = self.LIB_PATH.joinpath('device_vector',
-                                         system_key, np_dtype[3:])
+        pyx_dir = self.LIB_PATH.joinpath('device_vector', system_key,
+                                         dtype_key)
         pyx_dir.makedirs_p()
 
         for d in (pyx_dir.parent.parent.parent,
@@ -309,23 +1053,9 @@ class Context(_Context):
             d.joinpath('__init__.pxd').write_bytes('')
             d.joinpath('__init__.py').write_bytes('')
 
-        pyx_template_path = self.template_path.joinpath(
-            'device_vector.pyxt')
-        pyx_source_path = pyx_dir.joinpath(pyx_template_path.name[:-1])
-
-        with pyx_source_path.open('wb') as output:
-            template = jinja2.Template(pyx_template_path.bytes())
-            output.write(template.render(C_DTYPE=c_dtype,
-                                         NP_DTYPE=np_dtype))
-
-        pxd_template_path = self.template_path.joinpath(
-            'device_vector.pxdt')
-        pxd_source_path = pyx_dir.joinpath(pxd_template_path.name[:-1])
-
-        with pxd_source_path.open('wb') as output:
-            template = jinja2.Template(pxd_template_path.bytes())
-            output.write(template.render(C_DTYPE=c_dtype,
-                                         NP_DTYPE=np_dtype))
+        for source_name, source in sources.iteritems():
+            pyx_dir.joinpath(source_name).write_bytes(source)
+        pyx_source_path = pyx_dir.joinpath('device_vector.pyx')
 
         pyx_dir.joinpath('__init__.py').write_bytes(
             'from device_vector import *')
@@ -335,110 +1065,1395 @@ class Context(_Context):
         return full_module_name
 
 
-class DeviceViewGroup(object):
+def _context_from_args(init_args):
+    device_system, tag, include_dirs, kwargs = init_args
+    return Context(device_system=device_system, tag=tag,
+                   include_dirs=include_dirs, **kwargs)
+
+
+def _build_pyx_module_task(init_args, code, kwargs):
+    # Compile pool task *(see `Context.submit_pyx_module`)*.
+    return _context_from_args(init_args).inline_cached_pyx_module(code,
+                                                                  **kwargs)
+
+
+def _device_vector_module_task(init_args, dtype_name):
+    # Compile pool task *(see `Context.submit_device_vector_modules`)*.
+    return (_context_from_args(init_args)
+            .get_device_vector_module(np.dtype(dtype_name).type))
+
+
+def _import_future(module_future, attribute, wrap=None):
     '''
-    Base class to group together references to device vector views that belong
-    to a common `Context`.  This is useful, for example, to create `Transform`
-    instances using views from different columns of `DeviceDataFrame` and
-    `DeviceVectorCollection` instances.
+    Return a future resolving to `attribute` of the module named by the
+    `(module_dir, module_name)` result of `module_future`.
 
-    This class also acts as a mixin for the `DeviceDataFrame` and
-    `DeviceVectorCollection` classes, to provide shared functionality.
+    If `wrap` is provided, the future resolves to `wrap(attribute_value)`.
+    '''
+    from concurrent.futures import Future
+    from importlib import import_module
 
-    Note that a `DeviceViewGroup` does *not necessarily* own the underlying
-    device vectors.
+    future = Future()
+
+    def _on_done(f):
+        try:
+            module_path, module_name = f.result()
+            value = getattr(import_module(module_name), attribute)
+            future.set_result(value if wrap is None else wrap(value))
+        except Exception, exception:
+            future.set_exception(exception)
+    module_future.add_done_callback(_on_done)
+    return future
+
+
+def build_inline_func(context, columns, dtypes, code='', setup='',
+                      template_context=None, verbose=False,
+                      include_dirs=None, background=False, **kwargs):
     '''
-    TRANSFORM_CACHE = {}
+    Return a dynamically compiled Cython function, based on the
+    `BASE_TEMPLATE` template, taking one `DeviceVectorView` argument per
+    column.
 
-    @classmethod
-    def from_device_vectors(self, device_vectors):
-        group = DeviceViewGroup()
-        group._context = device_vectors._context
-        group._view_dict = device_vectors.v.copy()
-        if len(set([v.size for v in group._view_dict.itervalues()])) > 1:
-            # Device vector views are of different sizes.
-            group._jagged = True
-        else:
-            # All vector views are of the same length.
-            group._jagged = True
-        return group
+    See `DeviceViewGroup.inline_func`, which infers `dtypes` from the views
+    of a group.
+    '''
+    template = jinja2.Template('\n'.join([setup, BASE_TEMPLATE, code]))
+
+    if template_context is None:
+        template_context = {}
+    all_code = template.render(
+        module_names=[context.get_device_vector_module(d) for d in dtypes],
+        dtypes=dtypes, view_names=columns, **template_context)
+    if include_dirs is None:
+        include_dirs = context.kwargs['include_dirs']
+    else:
+        include_dirs = list(include_dirs) + context.kwargs['include_dirs']
+    if background:
+        return _import_future(context.submit_pyx_module(
+                                  all_code, include_dirs=include_dirs,
+                                  **kwargs), '__foo__',
+                              wrap=functools.partial(Functor, all_code))
+    module_path, module_name = context.inline_cached_pyx_module(
+        all_code, include_dirs=include_dirs, **kwargs)
+    if verbose:
+        print all_code
+    exec('import %s' % module_name)
+    return Functor(all_code, eval('%s.__foo__' % module_name))
+
+
+class GraphKey(object):
+    '''
+    Hashable reference to a `theano` operation graph, which compares equal to
+    any structurally identical graph *(see `graph_fingerprint`)*.
 
-    @property
-    def jagged(self):
-        return self._jagged
+    This makes it possible to key `functools32.lru_cache` caches on operation
+    graphs, since `theano` variables hash by identity.
+    '''
+    def __init__(self, operation_graph):
+        self.graph = operation_graph
+        self.fingerprint = graph_fingerprint(operation_graph)
 
-    @property
-    def df(self):
-        return self.as_dataframe()
+    def __hash__(self):
+        return hash(self.fingerprint)
 
-    def as_dataframe(self):
-        return pd.DataFrame(OrderedDict([(k, v[:])
-                                         for k, v in self._view_dict
-                                         .iteritems()]),
-                            index=range(*self.index_bounds()))
+    def __eq__(self, other):
+        return (isinstance(other, GraphKey) and
+                self.fingerprint == other.fingerprint)
 
-    def reset_views(self):
-        for column in self.columns:
-            self.v[column].first_i = 0
-            self.v[column].last_i = self.d[column].size - 1
+    def __ne__(self, other):
+        return not self == other
 
-    def index_bounds(self):
-        sample_view = self._view_dict.values()[0]
-        first_i = sample_view.first_i
-        last_i = sample_view.last_i
-        return first_i, last_i + 1
 
-    def inline_func(self, columns, code='', setup='', context=None,
-                    verbose=False, include_dirs=None, **kwargs):
-        '''
-        Return a dynamically compiled Cython function, based on the
-        `BASE_TEMPLATE` template.
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_scatter_func(context, columns, dtypes, in_operations,
+                     out_operations):
+    '''
+    Dynamically compile a scatter function *(see `DeviceViewGroup.scatter`)*
+    for views of the specified columns/types.
 
-        Argument types are implied by the data-type of each column, where each
-        column is represented by the corresponding `DeviceVectorView` type.
+    `in_operations` and `out_operations` must be tuples of `GraphKey`
+    instances.
 
-        Arguments
-        ---------
+    __NB,__ Results of this function are cached to improve runtime
+    performance of repeated calls for the same operations/column types.
+    '''
+    transforms_in = [context.build_transform(
+                         k.graph, transform_name('scatter_in', k.graph))
+                     for k in in_operations]
+    transforms_out = [context.build_transform(
+                          k.graph, transform_name('scatter_out', k.graph))
+                      for k in out_operations]
+
+    setup = (jinja2.Template(SCATTER_SETUP_TEMPLATE)
+             .render(transforms_in=transforms_in,
+                     transforms_out=transforms_out))
+    code = (jinja2.Template(SCATTER_TEMPLATE)
+            .render(transforms_in=transforms_in,
+                    transforms_out=transforms_out))
+
+    include_dirs = np.concatenate([t.get_includes()
+                                   for t in transforms_in +
+                                   transforms_out]).tolist()
+
+    return build_inline_func(context, columns, dtypes,
+                             include_dirs=include_dirs, setup=setup,
+                             code=code,
+                             template_context=dict(preargs='uint32_t N, '))
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_transform_reduce_func(context, columns, dtypes, reduce_ops,
+                              transforms, init_values, **kwargs):
+    '''
+    Dynamically compile a function to reduce the output of each transform
+    *(see `DeviceViewGroup.reduce`)*, taking views of the specified
+    columns/types as arguments.
 
-         - `columns` : `list`-like
-          * Column names to pass as arguments to generated function.
-         - `code` : `str` *(optional)*
-          * Code to insert in function body.  May contain Jinja
-            template language.
-         - `setup` : `str` *(optional)*
-          * Set-up code to insert at start of template.  May contain Jinja
-            template language.
-         - `context` : `dict` *(optional)*
-          * Context to add to Jinja template context.
-         - `verbose` : `bool` *(optional)*
-          * If `True`, generated code will be printed.
-         - `kwargs` : `dict` *(optional)*
-          * Additional keyword arguments to pass along to `inline_pyx_module`.
-        '''
-        template = jinja2.Template('\n'.join([setup, BASE_TEMPLATE, code]))
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    setup = (jinja2.Template(REDUCE_SETUP_TEMPLATE)
+            .render(transforms=transforms,
+                    reduce_ops=reduce_ops,
+                    init_values=init_values,
+                    named_positions=NAMED_POSITIONS))
+
+    code = (jinja2.Template(REDUCE_TEMPLATE)
+            .render(transforms=transforms,
+                    reduce_ops=reduce_ops,
+                    init_values=init_values,
+                    named_positions=NAMED_POSITIONS))
+
+    include_dirs = np.concatenate([t.get_includes()
+                                   for t in transforms]).tolist()
+
+    return build_inline_func(context, columns, dtypes,
+                             include_dirs=include_dirs, setup=setup,
+                             code=code,
+                             template_context=dict(preargs='size_t N, '),
+                             **kwargs)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_transform_reduce_by_key_func(context, key_dtypes, columns, dtypes,
+                                     transforms, reduce_ops):
+    '''
+    Dynamically compile a function to reduce the output of each transform by
+    key *(see `GroupBy.agg_expressions`)*, without materializing the
+    transform outputs.
 
-        if context is None:
-            context = {}
-        all_code = template.render(
-            df=self, module_names=self.get_vector_module(columns),
-            dtypes=self.get_dtype(columns), view_names=columns,
-            **context)
-        if include_dirs is None:
-            include_dirs = self._context.kwargs['include_dirs']
-        else:
-            include_dirs += self._context.kwargs['include_dirs']
-        module_path, module_name = self._context.inline_pyx_module(
-            all_code, include_dirs=include_dirs, **kwargs)
-        if verbose:
-            print all_code
-        exec('import %s' % module_name)
-        return Functor(all_code, eval('%s.__foo__' % module_name))
+    The compiled function takes the following view arguments (in order):
+    key columns, `columns` *(inputs of the transforms)*, output key columns,
+    and one output column per transform.  The number of reduced keys is
+    returned.
 
-    def __getitem__(self, key):
-        '''
-        Return the columns corresponding to the provided key(s) as a
-        `DeviceViewGroup`.
-        '''
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    key_names = ['keys%d' % (i + 1) for i in xrange(len(key_dtypes))]
+    key_out_names = ['keys_out%d' % (i + 1)
+                     for i in xrange(len(key_dtypes))]
+    value_out_names = ['values_out%d' % (i + 1)
+                       for i in xrange(len(transforms))]
+    value_out_dtypes = [np.dtype(t.dfg.operation_graph.owner.out.dtype).type
+                        for t in transforms]
+    template_context = dict(
+        transforms=transforms, reduce_ops=reduce_ops,
+        key_modules=[context.get_device_vector_module(d)
+                     for d in key_dtypes],
+        key_ctypes=[NP_TYPE_TO_CTYPE[np.dtype(d).name] for d in key_dtypes],
+        value_out_modules=[context.get_device_vector_module(d)
+                           for d in value_out_dtypes],
+        value_ctypes=['%s_t' % t.dfg.operation_graph.owner.out.dtype
+                      for t in transforms])
+    setup = (jinja2.Template(TRANSFORM_REDUCE_BY_KEY_SETUP_TEMPLATE)
+             .render(**template_context))
+    code = (jinja2.Template(TRANSFORM_REDUCE_BY_KEY_TEMPLATE)
+            .render(**template_context))
+
+    include_dirs = np.concatenate([t.get_includes()
+                                   for t in transforms]).tolist()
+
+    return build_inline_func(context,
+                             key_names + list(columns) + key_out_names +
+                             value_out_names,
+                             list(key_dtypes) + list(dtypes) +
+                             list(key_dtypes) + value_out_dtypes,
+                             include_dirs=include_dirs, setup=setup,
+                             code=code)
+
+
+def accumulator_dtype(kind, dtype):
+    '''
+    Return the type of the reduced values of an accumulator of the specified
+    kind over values of type `dtype` *(see `get_agg_reduce_by_key_func`)*.
+    '''
+    if kind in ('float', 'square'):
+        return np.float64
+    elif kind in ('count', 'position'):
+        return np.uint32
+    return np.dtype(dtype).type
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_agg_reduce_by_key_func(context, key_dtypes, value_dtypes,
+                               accumulators, row_index=False):
+    '''
+    Dynamically compile a function to reduce several accumulators of value
+    columns by key, using a single `reduce_by_key` pass over tuples of
+    accumulators *(see `GroupBy.agg_accumulated`)*.
+
+    Arguments
+    ---------
+
+     - `accumulators` : `tuple`
+      * One `(kind, value, reduce_op)` tuple per accumulator, where `value`
+        is the position of the value column in `value_dtypes` *(ignored for
+        the `count` kind)*, `reduce_op` is the name of a Thrust/`cythrust`
+        binary functor, and `kind` is one of:
+        - `'value'`: values of the column.
+        - `'float'`: values of the column, as `float64`.
+        - `'square'`: squared values of the column, as `float64`.
+        - `'count'`: `1` per row.
+        - `'position'`: `(value, row position)` tuples, reduced with
+          `arg_minimum` or `arg_maximum`, of which only the row position is
+          written.
+     - `row_index` : `bool` *(optional)*
+      * If `True`, row positions are read from a `uint32` view argument
+        *(e.g., the index of the `argsort` engine)*.  Otherwise, row
+        positions count from zero.
+
+    The compiled function takes the following view arguments (in order):
+    key columns, value columns, row positions *(if `row_index`)*, output key
+    columns, and one output column per accumulator *(see
+    `accumulator_dtype`)*.  The number of reduced keys is returned.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    if len(accumulators) > MAX_ZIP_ARITY:
+        raise ValueError('At most %d accumulators are supported.' %
+                         MAX_ZIP_ARITY)
+    value_out_dtypes = [accumulator_dtype(kind, value_dtypes[value - 1]
+                                          if kind != 'count' else None)
+                        for kind, value, reduce_op in accumulators]
+    ctypes = {'float': 'double', 'square': 'double', 'count': 'uint32_t'}
+    components = [dict(kind=kind, value=value, op=reduce_op,
+                       ctype=ctypes.get(kind) or
+                       NP_TYPE_TO_CTYPE[np.dtype(value_dtypes[value - 1])
+                                        .name])
+                  for kind, value, reduce_op in accumulators]
+    template_context = dict(
+        components=components,
+        key_modules=[context.get_device_vector_module(d)
+                     for d in key_dtypes],
+        key_ctypes=[NP_TYPE_TO_CTYPE[np.dtype(d).name] for d in key_dtypes],
+        value_modules=[context.get_device_vector_module(d)
+                       for d in value_dtypes],
+        value_out_modules=[context.get_device_vector_module(d)
+                           for d in value_out_dtypes],
+        row_module=(context.get_device_vector_module(SELECTION_INDEX_DTYPE)
+                    if row_index else None))
+    setup = (jinja2.Template(AGG_REDUCE_BY_KEY_SETUP_TEMPLATE)
+             .render(**template_context))
+    code = (jinja2.Template(AGG_REDUCE_BY_KEY_TEMPLATE)
+            .render(**template_context))
+
+    key_names = ['keys%d' % (i + 1) for i in xrange(len(key_dtypes))]
+    value_names = ['values%d' % (i + 1) for i in xrange(len(value_dtypes))]
+    row_names, row_dtypes = ((['rows'], [SELECTION_INDEX_DTYPE])
+                             if row_index else ([], []))
+    key_out_names = ['keys_out%d' % (i + 1)
+                     for i in xrange(len(key_dtypes))]
+    value_out_names = ['values_out%d' % (i + 1)
+                       for i in xrange(len(accumulators))]
+    return build_inline_func(context,
+                             key_names + value_names + row_names +
+                             key_out_names + value_out_names,
+                             list(key_dtypes) + list(value_dtypes) +
+                             row_dtypes + list(key_dtypes) + value_out_dtypes,
+                             setup=setup, code=code)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_filter_func(context, dtypes, inplace):
+    '''
+    Dynamically compile a function to compact the rows of columns of the
+    specified types, keeping rows where a `uint8` mask is non-zero *(see
+    `DeviceDataFrame.filter`)*.
+
+    The compiled function takes the mask view, followed by one view per input
+    column and, unless `inplace` is `True`, one output view per column.  The
+    number of rows kept is returned.
+
+     - If `inplace` is `True`, kept rows are moved to the start of each input
+       view using `stable_partition`.
+     - Otherwise, kept rows are copied to the output views using `copy_if`.
+
+    In both cases, the relative order of kept rows is preserved and columns
+    are zipped in groups of at most `MAX_ZIP_ARITY` columns, so each group is
+    compacted in a single pass.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    column_count = len(dtypes)
+    column_groups = [range(i + 1, min(i + MAX_ZIP_ARITY, column_count) + 1)
+                     for i in xrange(0, column_count, MAX_ZIP_ARITY)]
+    in_names = ['in%d' % (i + 1) for i in xrange(column_count)]
+    out_names = ['out%d' % (i + 1) for i in xrange(column_count)]
+    template_context = dict(mask_ctype='uint8_t', column_groups=column_groups,
+                            inplace=inplace)
+    setup = (jinja2.Template(FILTER_SETUP_TEMPLATE)
+             .render(**template_context))
+    code = (jinja2.Template(FILTER_TEMPLATE)
+            .render(**template_context))
+    if inplace:
+        columns = ['mask'] + in_names
+        view_dtypes = [np.uint8] + list(dtypes)
+    else:
+        columns = ['mask'] + in_names + out_names
+        view_dtypes = [np.uint8] + 2 * list(dtypes)
+    return build_inline_func(context, columns, view_dtypes, setup=setup,
+                             code=code)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_gather_func(context, dtypes):
+    '''
+    Dynamically compile a function to gather the rows of columns of the
+    specified types through an index column *(see
+    `SelectionViewGroup.materialize`)*, using `permutation_iterator`.
+
+    The compiled function takes the index view (of type
+    `SELECTION_INDEX_DTYPE`), followed by one view per input column and one
+    output view per column.  The number of rows gathered is returned.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    column_count = len(dtypes)
+    column_groups = [range(i + 1, min(i + MAX_ZIP_ARITY, column_count) + 1)
+                     for i in xrange(0, column_count, MAX_ZIP_ARITY)]
+    in_names = ['in%d' % (i + 1) for i in xrange(column_count)]
+    out_names = ['out%d' % (i + 1) for i in xrange(column_count)]
+    setup = jinja2.Template(GATHER_SETUP_TEMPLATE).render()
+    code = (jinja2.Template(GATHER_TEMPLATE)
+            .render(column_groups=column_groups))
+    return build_inline_func(context, ['index'] + in_names + out_names,
+                             [SELECTION_INDEX_DTYPE] + 2 * list(dtypes),
+                             setup=setup, code=code)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_join_count_func(context, key_dtypes, how):
+    '''
+    Dynamically compile a function to find the matching rows of a join *(see
+    `merge`)*, using vectorized `lower_bound`/`upper_bound` of each left key
+    in the sorted right keys.
+
+    The compiled function takes one view per left key column, one view per
+    (sorted) right key column, and `lower`, `upper` (of type
+    `SELECTION_INDEX_DTYPE`) and `offset` (`uint64`) output views with one
+    row per left row.  The number of output rows of the join is returned.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    key_count = len(key_dtypes)
+    setup = jinja2.Template(JOIN_SETUP_TEMPLATE).render()
+    code = (jinja2.Template(JOIN_COUNT_TEMPLATE)
+            .render(key_count=key_count, how=how))
+    columns = (['left%d' % (i + 1) for i in xrange(key_count)] +
+               ['right%d' % (i + 1) for i in xrange(key_count)] +
+               ['lower', 'upper', 'offset'])
+    dtypes = (2 * list(key_dtypes) + 2 * [SELECTION_INDEX_DTYPE] +
+              [np.uint64])
+    return build_inline_func(context, columns, dtypes, setup=setup,
+                             code=code)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_range_count_func(context, key_dtypes):
+    '''
+    Dynamically compile a function to find the rows of sorted key columns
+    within each of several inclusive `[lo, hi]` key ranges *(see
+    `SortedIndex`)*, using vectorized `lower_bound`/`upper_bound`.
+
+    The compiled function takes one view per sorted key column, one view per
+    `lo` key column, one view per `hi` key column, and `lower`, `upper` (of
+    type `SELECTION_INDEX_DTYPE`) and `offset` (`uint64`) output views with
+    one row per range.  The total number of rows within the ranges is
+    returned.  Row positions may be expanded using the function returned by
+    `get_join_expand_func` for an `inner` join.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    key_count = len(key_dtypes)
+    setup = jinja2.Template(JOIN_SETUP_TEMPLATE).render()
+    code = (jinja2.Template(RANGE_COUNT_TEMPLATE)
+            .render(key_count=key_count))
+    columns = (['sorted%d' % (i + 1) for i in xrange(key_count)] +
+               ['lo%d' % (i + 1) for i in xrange(key_count)] +
+               ['hi%d' % (i + 1) for i in xrange(key_count)] +
+               ['lower', 'upper', 'offset'])
+    dtypes = (3 * list(key_dtypes) + 2 * [SELECTION_INDEX_DTYPE] +
+              [np.uint64])
+    return build_inline_func(context, columns, dtypes, setup=setup,
+                             code=code)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_join_expand_func(context, how):
+    '''
+    Dynamically compile a function to write the left row position of each
+    output row of a join, along with the position of the matching row in the
+    sorted right keys *(except for `semi` joins)*, and an unmatched row flag
+    *(`left` joins only)*.
+
+    The compiled function takes the `lower`, `upper` and `offset` views
+    computed by the function returned by `get_join_count_func`, followed by
+    the `left_index`, `right_index`, and `unmatched` output views.
+    '''
+    setup = jinja2.Template(JOIN_SETUP_TEMPLATE).render()
+    code = jinja2.Template(JOIN_EXPAND_TEMPLATE).render(how=how)
+    columns = ['lower', 'upper', 'offset', 'left_index']
+    dtypes = 2 * [SELECTION_INDEX_DTYPE] + [np.uint64, SELECTION_INDEX_DTYPE]
+    if how != 'semi':
+        columns.append('right_index')
+        dtypes.append(SELECTION_INDEX_DTYPE)
+    if how == 'left':
+        columns.append('unmatched')
+        dtypes.append(np.uint8)
+    return build_inline_func(context, columns, dtypes, setup=setup,
+                             code=code)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_replace_where_func(context, dtypes):
+    '''
+    Dynamically compile a function to replace the rows of columns of the
+    specified types where a `uint8` mask is non-zero.
+
+    The compiled function takes the mask view, followed by one view per
+    column and one fill value per column.
+    '''
+    ctypes = [NP_TYPE_TO_CTYPE[np.dtype(d).name] for d in dtypes]
+    setup = jinja2.Template(REPLACE_WHERE_SETUP_TEMPLATE).render()
+    code = jinja2.Template(REPLACE_WHERE_TEMPLATE).render(ctypes=ctypes)
+    postargs = ''.join(', %s fill%d' % (c, i + 1)
+                       for i, c in enumerate(ctypes))
+    columns = ['column%d' % (i + 1) for i in xrange(len(dtypes))]
+    return build_inline_func(context, ['mask'] + columns,
+                             [np.uint8] + list(dtypes), setup=setup,
+                             code=code,
+                             template_context=dict(postargs=postargs))
+
+
+def graph_columns(operation_graphs, columns):
+    '''
+    Return the names in `columns` referenced as inputs by any of the
+    `theano` operation graphs, in the order of `columns`.
+    '''
+    from theano.gof.graph import inputs as graph_inputs
+
+    names = set(v.name for v in graph_inputs(list(operation_graphs)))
+    return [c for c in columns if c in names]
+
+
+def mask_graph(predicate, columns):
+    '''
+    Return `(graph, input_columns)`, where `graph` evaluates `predicate` *(a
+    `ColumnExpression` or `theano` graph)* to a `uint8` mask and
+    `input_columns` are the names in `columns` referenced by the predicate
+    *(see `DeviceDataFrame.filter`)*.
+    '''
+    if isinstance(predicate, ColumnExpression):
+        input_columns = [c for c in columns if c in predicate.columns]
+        graph = predicate.operation_graph
+    else:
+        input_columns = graph_columns([predicate], columns)
+        graph = predicate
+        if graph.owner is None:
+            graph = graph.take(T.arange((1 << 32) - 1))
+    if graph.dtype != 'uint8':
+        graph = T.cast(T.neq(graph, 0), 'uint8')
+    return graph, input_columns
+
+
+def mask_count(mask):
+    '''
+    Return the number of non-zero values in the `mask` column of `mask`.
+    '''
+    return mask.reduce('plus', operations=[
+        T.cast(mask.tensor('mask').take(T.arange((1 << 32) - 1)), 'uint64')])
+
+
+def _graph_constant(variable):
+    # Return the value of a scalar `theano` constant *(possibly broadcast)*,
+    # or `None` if `variable` is not a constant.
+    from theano.tensor.elemwise import DimShuffle
+
+    while (variable.owner is not None and
+           isinstance(variable.owner.op, DimShuffle)):
+        variable = variable.owner.inputs[0]
+    data = getattr(variable, 'data', None)
+    if data is None or np.asarray(data).size != 1:
+        return None
+    return np.asarray(data).item()
+
+
+def predicate_ranges(predicate):
+    '''
+    Return a dictionary mapping column names to inclusive `(lo, hi)` bounds
+    *(`None` if unbounded)*, which the values of a row must be within for
+    `predicate` *(a `ColumnExpression` or `theano` graph)* to be non-zero.
+    For example, `{'a': (0, 10)}` for `(df.expr('a') >= 0) * (df.expr('a') <
+    10)`.
+
+    Bounds are derived from comparisons of a column with a constant, and
+    products *(i.e., logical and)* of comparisons.  Other expressions imply
+    no bounds.  Bounds of strict comparisons are inclusive, which is
+    conservative when skipping blocks *(see `ZoneMap`)*.
+    '''
+    graph = (predicate.graph if isinstance(predicate, ColumnExpression)
+             else predicate)
+    owner = graph.owner
+    scalar_op = getattr(getattr(owner, 'op', None), 'scalar_op', None)
+    if scalar_op is None:
+        return {}
+    op_name = type(scalar_op).__name__
+    if op_name in ('Mul', 'AND'):
+        ranges = {}
+        for input_ in owner.inputs:
+            for column, (lo, hi) in predicate_ranges(input_).iteritems():
+                lo_i, hi_i = ranges.get(column, (None, None))
+                ranges[column] = (lo if lo_i is None else
+                                  lo_i if lo is None else max(lo, lo_i),
+                                  hi if hi_i is None else
+                                  hi_i if hi is None else min(hi, hi_i))
+        return ranges
+    elif op_name not in ('LT', 'LE', 'GT', 'GE', 'EQ'):
+        return {}
+
+    column, other = owner.inputs
+    if column.owner is not None or column.name is None:
+        # Constant on the left, e.g., `0 < a`.
+        column, other = other, column
+        op_name = {'LT': 'GT', 'LE': 'GE', 'GT': 'LT',
+                   'GE': 'LE'}.get(op_name, op_name)
+    value = _graph_constant(other)
+    if column.owner is not None or column.name is None or value is None:
+        return {}
+    elif op_name in ('GT', 'GE'):
+        return {column.name: (value, None)}
+    elif op_name in ('LT', 'LE'):
+        return {column.name: (None, value)}
+    return {column.name: (value, value)}
+
+
+def range_predicate(views, ranges):
+    '''
+    Return a `ColumnExpression` which is non-zero for the rows of `views`
+    within all of the inclusive `(lo, hi)` `ranges` *(see `ZoneMap`)*, or
+    `None` if no range is bounded.
+    '''
+    predicate = None
+    for column, (lo, hi) in ranges.iteritems():
+        value = views.expr(column)
+        conditions = []
+        if lo is not None:
+            conditions.append(value >= lo)
+        if hi is not None:
+            conditions.append(value <= hi)
+        for condition in conditions:
+            predicate = (condition if predicate is None
+                         else predicate * condition)
+    return predicate
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_zone_map_func(context, dtypes):
+    '''
+    Dynamically compile a function to compute the minimum and maximum of each
+    block of rows of columns of the specified types *(see `ZoneMap`)*, using
+    the `minmax_tuple` functor.
+
+    The compiled function takes the number of rows per block, followed by
+    one view per column, one `mins` output view per column, and one `maxs`
+    output view per column *(one row per block, of the type of the column)*.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    column_count = len(dtypes)
+    setup = jinja2.Template(ZONE_MAP_SETUP_TEMPLATE).render()
+    code = (jinja2.Template(ZONE_MAP_TEMPLATE)
+            .render(column_count=column_count))
+    columns = (['values%d' % (i + 1) for i in xrange(column_count)] +
+               ['mins%d' % (i + 1) for i in xrange(column_count)] +
+               ['maxs%d' % (i + 1) for i in xrange(column_count)])
+    return build_inline_func(context, columns, 3 * list(dtypes), setup=setup,
+                             code=code,
+                             template_context=dict(preargs='size_t '
+                                                   'block_size, '))
+
+
+def block_minmax(views, columns, block_size):
+    '''
+    Return `(mins, maxs)` ordered dictionaries mapping each of the specified
+    columns of `views` to a `numpy` array of the minimum *(maximum)* of each
+    block of `block_size` rows *(see `get_zone_map_func`)*.
+    '''
+    dtypes = views.get_dtype(columns)
+    block_count = -(-views.size // block_size)
+    stats = DeviceDataFrame(OrderedDict(
+        [('min%d' % i, np.zeros(block_count, dtype=d))
+         for i, d in enumerate(dtypes)] +
+        [('max%d' % i, np.zeros(block_count, dtype=d))
+         for i, d in enumerate(dtypes)]), context=views._context)
+    if block_count > 0:
+        zone_map_func = get_zone_map_func(views._context, tuple(dtypes))
+        zone_map_func(block_size, *([views.v[c] for c in columns] +
+                                    stats._view_dict.values()))
+    arrays = stats.as_arrays()
+    return (OrderedDict([(c, arrays['min%d' % i])
+                         for i, c in enumerate(columns)]),
+            OrderedDict([(c, arrays['max%d' % i])
+                         for i, c in enumerate(columns)]))
+
+
+class ZoneMap(object):
+    '''
+    Minimum and maximum of each block of rows of columns of a
+    `DeviceDataFrame` *(see `DeviceDataFrame.build_zone_map`)*, used to skip
+    blocks which cannot contain rows within the ranges of a filter or a
+    range-restricted reduce.
+
+    Block `i` covers rows `[i * block_size, (i + 1) * block_size)` of the
+    view `bounds` *(see `DeviceViewGroup.index_bounds`)* the map was computed
+    for, and the map is only used while the frame has the same bounds.  The
+    block statistics are small *(one pair of values per block)*, so they are
+    kept on the host.
+
+    __NB__ Blocks containing `NaN` values span all values, so they are never
+    skipped.
+    '''
+    def __init__(self, block_size, bounds, mins, maxs):
+        self.block_size = block_size
+        self.bounds = tuple(bounds)
+        self.mins = mins
+        self.maxs = maxs
+
+    @property
+    def columns(self):
+        return self.mins.keys()
+
+    @property
+    def size(self):
+        return self.bounds[1] - self.bounds[0]
+
+    @property
+    def block_count(self):
+        return -(-self.size // self.block_size)
+
+    def classify(self, ranges):
+        '''
+        Return `(candidates, covered)` boolean arrays with one value per
+        block, where `candidates` marks blocks which may contain rows within
+        all of the inclusive `(lo, hi)` `ranges`, and `covered` marks blocks
+        with _all_ rows within the ranges.
+
+        Blocks are never covered by a range of a column without block
+        statistics.
+        '''
+        candidates = np.ones(self.block_count, dtype=bool)
+        covered = np.ones(self.block_count, dtype=bool)
+        for column, (lo, hi) in ranges.iteritems():
+            if column not in self.mins:
+                covered[:] = False
+                continue
+            mins, maxs = self.mins[column], self.maxs[column]
+            if lo is not None:
+                candidates &= maxs >= lo
+                covered &= mins >= lo
+            if hi is not None:
+                candidates &= mins <= hi
+                covered &= maxs <= hi
+        return candidates, covered
+
+    def runs(self, blocks):
+        '''
+        Return the `(start, end)` row ranges *(relative to the first row of
+        the view)* of the runs of consecutive blocks selected by the boolean
+        `blocks` array.
+        '''
+        runs = []
+        for block in np.flatnonzero(blocks):
+            start = block * self.block_size
+            end = min(start + self.block_size, self.size)
+            if runs and runs[-1][1] == start:
+                runs[-1] = (runs[-1][0], end)
+            else:
+                runs.append((start, end))
+        return runs
+
+    def update(self, frame, columns, start, end):
+        '''
+        Recompute the statistics of the blocks overlapping rows `[start, end)`
+        of the specified columns of `frame` *(e.g., after the rows are
+        written)*.
+        '''
+        columns = [c for c in columns if c in self.mins]
+        if not columns or start >= end:
+            return
+        first_block = start // self.block_size
+        last_block = (end - 1) // self.block_size + 1
+        mins, maxs = block_minmax(
+            frame.view(first_block * self.block_size,
+                       min(last_block * self.block_size, self.size)),
+            columns, self.block_size)
+        for column in columns:
+            self.mins[column][first_block:last_block] = mins[column]
+            self.maxs[column][first_block:last_block] = maxs[column]
+
+    def drop(self, columns):
+        '''
+        Discard the statistics of the specified columns.
+        '''
+        for column in columns:
+            self.mins.pop(column, None)
+            self.maxs.pop(column, None)
+
+    def __repr__(self):
+        return ('ZoneMap(columns=%r, block_size=%r, block_count=%r)' %
+                (self.columns, self.block_size, self.block_count))
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_host_reduce_by_key_func(context, engine, key_dtypes, value_dtypes,
+                                reduce_ops, count=False):
+    '''
+    Dynamically compile a function to reduce values by key on the host,
+    rather than sorting *(see `GroupBy`)*, using either:
+
+     - `engine='hash'`: a hash table.  Reduced keys are written in order of
+       first appearance.
+     - `engine='dense'`: an array indexed by key, for a single integer key
+       column.  Reduced keys are written in ascending order.  The compiled
+       function takes the maximum key range as its first argument *(see
+       `DENSE_MAX_KEY_RANGE`)*, and raises `ValueError` if the range of the
+       keys is larger.
+
+    The compiled function takes the following view arguments (in order):
+    key columns, value columns, output key columns, and one output column
+    per value column, matching the functions returned by `get_reduce_func`.
+    The number of reduced keys is returned.
+
+    If `count` is `True`, the number of rows of each key is written to a
+    single `uint32` output column, there are no value column arguments, and
+    `value_dtypes`/`reduce_ops` are ignored *(see `get_count_func`)*.
+
+    __NB__ Only supported for host backends *(see `Context.host_memory`)*.
+    All arguments must be *hashable* types.  This is a requirement for using
+    `functools32.lru_cache`.
+    '''
+    if count:
+        value_dtypes = (np.uint32, )
+        reduce_ops = ('plus', )
+    key_ctypes = [NP_TYPE_TO_CTYPE[np.dtype(d).name] for d in key_dtypes]
+    value_ctypes = [NP_TYPE_TO_CTYPE[np.dtype(d).name] for d in value_dtypes]
+
+    if len(key_ctypes) > 1:
+        hash_type = 'tuple_hash[tuple%d[%s]]' % (len(key_ctypes),
+                                                 ', '.join(key_ctypes))
+    else:
+        hash_type = 'key_hash[%s]' % key_ctypes[0]
+    value_ops = ['%s[%s]' % (op, c) for op, c in zip(reduce_ops,
+                                                     value_ctypes)]
+    functors = sorted(set(reduce_ops))
+    if len(value_ops) > 1:
+        reduce_type = 'reduce%d[%s]' % (len(value_ops), ', '.join(value_ops))
+        functors.append('reduce%d' % len(value_ops))
+    else:
+        reduce_type = value_ops[0]
+
+    template_context = dict(engine=engine, functors=functors,
+                            hash_type=hash_type, reduce_type=reduce_type,
+                            key_count=len(key_dtypes),
+                            value_count=len(value_dtypes), count=count)
+    setup = (jinja2.Template(HOST_REDUCE_BY_KEY_SETUP_TEMPLATE)
+             .render(**template_context))
+    code = (jinja2.Template(HOST_REDUCE_BY_KEY_TEMPLATE)
+            .render(**template_context))
+
+    key_names = ['keys%d' % (i + 1) for i in xrange(len(key_dtypes))]
+    key_out_names = ['keys_out%d' % (i + 1)
+                     for i in xrange(len(key_dtypes))]
+    value_names = ['values%d' % (i + 1) for i in xrange(len(value_dtypes))]
+    value_out_names = ['values_out%d' % (i + 1)
+                       for i in xrange(len(value_dtypes))]
+    if count:
+        columns = key_names + key_out_names + value_out_names
+        dtypes = 2 * list(key_dtypes) + list(value_dtypes)
+    else:
+        columns = key_names + value_names + key_out_names + value_out_names
+        dtypes = 2 * (list(key_dtypes) + list(value_dtypes))
+    if engine == 'dense':
+        template_context = dict(preargs='size_t max_key_range, ')
+    else:
+        template_context = None
+    return build_inline_func(context, columns, dtypes, setup=setup,
+                             code=code, template_context=template_context)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_describe_transforms(context, columns, dtypes):
+    '''
+    Return the transforms reduced by `DeviceViewGroup.describe` for views of
+    the specified columns/types, i.e., for each column (in order): value,
+    squared value, value, value *(reduced by sum, sum, min, and max,
+    respectively)*.
+    '''
+    tensors = [T.vector(c, dtype=d.__name__) for c, d in zip(columns, dtypes)]
+    describe_ops = lambda t: [T.cast(t.take(T.arange((1 << 32) - 1)),
+                                     'float32'),
+                              T.sqr(t),
+                              T.cast(t.take(T.arange((1 << 32) - 1)),
+                                     'float32'),
+                              T.cast(t.take(T.arange((1 << 32) - 1)),
+                                     'float32')]
+    return tuple(context.build_transform(t, transform_name('reduce', t))
+                 for tensor in tensors for t in describe_ops(tensor))
+
+
+def describe_summary(columns, reduced, size):
+    '''
+    Return a `pandas.Series` summarizing each column *(see
+    `DeviceViewGroup.describe`)*, given the result `reduced` of a describe
+    reduction *(see `DeviceViewGroup.prepare_describe`)* over `size` rows.
+    '''
+    index = pd.MultiIndex.from_product([columns, ['sum', 'sqr_sum', 'min',
+                                                  'max']])
+    result = pd.Series(reduced, index=index)
+    n = float(size)
+    for column in columns:
+        mean = result[column, 'sum'] / n
+        sum_ = result[column, 'sum']
+        sqr_sum = result[column, 'sqr_sum']
+
+        # Compute standard deviation.
+        #
+        #  - Compute *sum of squares* using shortcut described [here][1].
+        #  - Compute *standard deviation* using sum of squares, as
+        #    described [here][2].
+        #
+        # [1]: https://people.richland.edu/james/lecture/m170/ch03-var.html
+        # [2]: https://www.westgard.com/lesson35.htm#5
+        std = np.sqrt((sqr_sum - (sum_ * sum_) / float(n)) / (n - 1))
+        result[column, 'mean'] = mean
+        result[column, 'std'] = std
+        result[column, 'count'] = n
+    return result.sortlevel(level=0, sort_remaining=False)
+
+
+class PreparedReduce(object):
+    '''
+    Callable bound to a compiled reduce function and the column layout it was
+    compiled for *(see `DeviceViewGroup.prepare_reduce`)*.
+    '''
+    def __init__(self, func, columns, reduce_ops=None):
+        self.func = func
+        self.columns = list(columns)
+        self.reduce_ops = reduce_ops
+
+    def __call__(self, views, size=None):
+        '''
+        Reduce the views of `views`, which must have the same column names
+        and types as the group the reduction was prepared for.
+
+        The selected rows of a `SelectionViewGroup` are gathered first, since
+        the compiled function reads views directly.
+        '''
+        if isinstance(views, SelectionViewGroup):
+            views = views.materialize(self.columns)
+        if size is None:
+            size = views.size
+        return self.func(size, *[views.v[c] for c in self.columns])
+
+    def combine(self, a, b):
+        '''
+        Combine two partial results of the reduction *(e.g., the results for
+        two chunks of rows)* using the corresponding reduce operations.
+        '''
+        if len(self.reduce_ops) == 1:
+            return REDUCE_COMBINERS[self.reduce_ops[0]](a, b)
+        return [REDUCE_COMBINERS[op](a_i, b_i)
+                for op, a_i, b_i in zip(self.reduce_ops, a, b)]
+
+
+class PreparedGroupBy(object):
+    '''
+    Callable bound to compiled sort and reduce-by-key functions, along with
+    the argument layout they were compiled for *(see `GroupBy.prepare_agg` and
+    `GroupBy.prepare_count`)*.
+
+    If `argsort` is `True` *(i.e., for the `argsort` engine of `GroupBy`)*,
+    the called view group is not sorted in place.  Instead, a copy of the key
+    columns is sorted along with a row index, and the value columns in
+    `in_columns` are gathered through the index *(see `_argsort`)*.
+    '''
+    def __init__(self, context, sort_func, sort_columns, func, in_columns,
+                 out_columns, out_dtypes, key_columns=None, argsort=False,
+                 stable=False):
+        self.context = context
+        self.argsort = argsort
+        self.stable = stable
+        self.sort_func = sort_func
+        self.sort_columns = list(sort_columns)
+        self.key_columns = key_columns
+        self.func = func
+        self.in_columns = list(in_columns)
+        self.out_columns = list(out_columns)
+        self.out_dtypes = list(out_dtypes)
+
+    def __call__(self, views, out=None, sort=True):
+        '''
+        Group the rows of `views` *(which must have the same column names and
+        types as the group the operation was prepared for)* and reduce them.
+
+        Arguments
+        ---------
+
+         - `views` : `DeviceViewGroup`
+         - `out` : `DeviceViewGroup` *(optional)*
+          * Output views, with the same layout as the frame returned by the
+            corresponding `GroupBy` method.  If not provided, a new
+            `DeviceDataFrame` is allocated.
+         - `sort` : `bool` *(optional)*
+          * If `False`, assume rows are already sorted by the key columns.
+            Ignored for the `hash` and `dense` engines, which do not sort.
+        '''
+        if self.argsort:
+            views = self._argsort(views, sort)
+        elif (sort and self.sort_func is not None and not
+                (self.key_columns is not None and
+                 views.is_sorted(self.key_columns))):
+            views.check_writable('sort the rows by key')
+            self.sort_func(*[views.v[c] for c in self.sort_columns])
+            views.invalidate_zone_map()
+            if self.key_columns is not None:
+                views.set_sort_order(self.key_columns)
+        if out is None:
+            size = views.size
+            out = DeviceDataFrame(OrderedDict([
+                (c, np.zeros(size, dtype=d))
+                for c, d in zip(self.out_columns, self.out_dtypes)]),
+                context=self.context)
+
+        reduced_key_count = self.func(*([views.v[c] for c in self.in_columns]
+                                        + out.v.values()))
+
+        for view in out.v.itervalues():
+            view.last_i = reduced_key_count - 1
+        return out
+
+    def _argsort(self, views, sort):
+        '''
+        Return a view group containing the columns of `in_columns`, in the
+        order of the key columns, _without_ modifying `views`.
+
+        The key columns are sorted as a copy, along with a row index *(see
+        `SelectionViewGroup.sort_keys`)*, and each value column is gathered
+        through the index once.
+        '''
+        if not sort or views.is_sorted(self.key_columns):
+            return views
+        selection = views.select()
+        keys = selection.sort_keys(self.key_columns, stable=self.stable)
+        value_columns = [c for i, c in enumerate(self.in_columns)
+                         if c not in self.key_columns and
+                         c not in self.in_columns[:i]]
+        if not value_columns:
+            return keys
+        return join(keys, selection.materialize(value_columns))
+
+
+def _expression_graph(value):
+    # Return `theano` graph for a `ColumnExpression` operand.
+    if isinstance(value, ColumnExpression):
+        return value.graph
+    return value
+
+
+def _expression_columns(*values):
+    # Return the names of the columns referenced by `ColumnExpression`
+    # operands, in order of first appearance.
+    columns = []
+    for value in values:
+        if isinstance(value, ColumnExpression):
+            columns.extend([c for c in value.columns if c not in columns])
+    return tuple(columns)
+
+
+class ColumnExpression(object):
+    '''
+    Lazy arithmetic expression over the columns of a `DeviceViewGroup`
+    *(see `DeviceViewGroup.expr`)*.
+
+    Arithmetic operators build a `theano` graph, and no data is read or
+    written until one of the following is called, each of which compiles a
+    single fused kernel that reads the input columns once and never
+    allocates intermediate columns:
+
+     - `sum`, `product`, `min`, `max`: transform feeding `reduce_n`.
+     - `agg`: transform feeding `reduce_by_key` *(see
+       `GroupBy.agg_expressions`)*.
+     - Assignment to a frame column, e.g., `df['c'] = df.expr('a') * 2`
+       *(see `DeviceDataFrame.assign`)*.
+
+    Example
+    -------
+
+        >>> a, b = df.expr(['a', 'b'])
+        >>> (a * b + 1).sum()
+        >>> df['c'] = (a - b) ** 2
+    '''
+    def __init__(self, group, graph, columns):
+        self.group = group
+        self.graph = graph
+        self.columns = tuple(columns)
+
+    def _apply(self, func, *others):
+        values = (self, ) + others
+        return ColumnExpression(self.group,
+                                func(*[_expression_graph(v) for v in values]),
+                                _expression_columns(*values))
+
+    def __add__(self, other):
+        return self._apply(operator.add, other)
+
+    def __radd__(self, other):
+        return self._apply(lambda a, b: b + a, other)
+
+    def __sub__(self, other):
+        return self._apply(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._apply(lambda a, b: b - a, other)
+
+    def __mul__(self, other):
+        return self._apply(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._apply(lambda a, b: b * a, other)
+
+    def __div__(self, other):
+        return self._apply(operator.truediv, other)
+
+    def __rdiv__(self, other):
+        return self._apply(lambda a, b: b / a, other)
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def __mod__(self, other):
+        return self._apply(operator.mod, other)
+
+    def __pow__(self, other):
+        return self._apply(operator.pow, other)
+
+    def __neg__(self):
+        return self._apply(operator.neg)
+
+    def __abs__(self):
+        return self._apply(abs)
+
+    def __lt__(self, other):
+        return self._apply(operator.lt, other)
+
+    def __le__(self, other):
+        return self._apply(operator.le, other)
+
+    def __gt__(self, other):
+        return self._apply(operator.gt, other)
+
+    def __ge__(self, other):
+        return self._apply(operator.ge, other)
+
+    def astype(self, dtype):
+        return self._apply(lambda a: T.cast(a, np.dtype(dtype).name))
+
+    @property
+    def dtype(self):
+        return np.dtype(self.graph.dtype)
+
+    @property
+    def operation_graph(self):
+        '''
+        Graph to build a `Transform` from.  A bare column is wrapped in an
+        identity operation, since transforms of bare column tensors are not
+        supported *(see `DeviceViewGroup.get_transforms`)*.
+        '''
+        if self.graph.owner is None:
+            return self.graph.take(T.arange((1 << 32) - 1))
+        return self.graph
+
+    def reduce(self, reduce_op='plus'):
+        '''
+        Reduce the expression values using a single fused kernel *(see
+        `DeviceViewGroup.reduce`)*.
+        '''
+        return self.group.reduce(reduce_op,
+                                 operations=[self.operation_graph])
+
+    def sum(self):
+        return self.reduce('plus')
+
+    def product(self):
+        return self.reduce('multiplies')
+
+    def min(self):
+        return self.reduce('minimum')
+
+    def max(self):
+        return self.reduce('maximum')
+
+    def agg(self, key_columns, reduce_op='sum', name='value', out=None):
+        '''
+        Reduce the expression values by key using a single fused kernel
+        *(see `GroupBy.agg_expressions`)*.
+
+        __NB__ Like `GroupBy`, the rows of the group are sorted by
+        `key_columns` in place.
+        '''
+        return (self.group.groupby(key_columns)
+                .agg_expressions(OrderedDict([(name, (self, reduce_op))]),
+                                 out=out))
+
+
+class SortOrder(object):
+    '''
+    Sortedness metadata of a `DeviceViewGroup` *(see
+    `DeviceViewGroup.sort_order`)*: the rows within the view `bounds` *(i.e.,
+    `(first_i, last_i + 1)`, see `DeviceViewGroup.index_bounds`)* are sorted
+    by the `keys` columns, in order, using a stable sort if `stable` is
+    `True`.
+    '''
+    def __init__(self, keys, stable, bounds):
+        self.keys = tuple(keys)
+        self.stable = stable
+        self.bounds = tuple(bounds)
+
+    def satisfies(self, key_columns, bounds):
+        '''
+        Return `True` if rows within `bounds` are sorted by `key_columns`,
+        i.e., if `key_columns` is a prefix of `keys` and `bounds` are within
+        the sorted bounds.
+        '''
+        key_columns = tuple(key_columns)
+        return (self.keys[:len(key_columns)] == key_columns and
+                self.bounds[0] <= bounds[0] and bounds[1] <= self.bounds[1])
+
+    def __repr__(self):
+        return ('SortOrder(keys=%r, stable=%r, bounds=%r)' %
+                (self.keys, self.stable, self.bounds))
+
+
+class DeviceViewGroup(object):
+    '''
+    Base class to group together references to device vector views that belong
+    to a common `Context`.  This is useful, for example, to create `Transform`
+    instances using views from different columns of `DeviceDataFrame` and
+    `DeviceVectorCollection` instances.
+
+    This class also acts as a mixin for the `DeviceDataFrame` and
+    `DeviceVectorCollection` classes, to provide shared functionality.
+
+    Note that a `DeviceViewGroup` does *not necessarily* own the underlying
+    device vectors.
+
+    The `sort_order` attribute records the key columns the rows were last
+    sorted by *(see `SortOrder`)*, or is `None` if the order is unknown.  It
+    is set by `sort` and `GroupBy`, and is cleared by writes to any of the
+    key columns through `__setitem__`, `add`, `assign`, `scatter`, or
+    `transform` *(`out` group)*.  Order-dependent operations *(e.g.,
+    `GroupBy`)* skip sorting when the order is already satisfied.
+
+    The `zone_map` attribute holds block-level column statistics *(see
+    `ZoneMap` and `DeviceDataFrame.build_zone_map`)*, or is `None`.
+    Statistics of a column are discarded when the column is written through
+    `add`, `scatter`, or `transform` *(`out` group)*, and all statistics are
+    discarded when rows are reordered *(e.g., by `sort` or `GroupBy`)*.
+
+    If the `read_only` attribute is `True` *(e.g., for a frame opened with
+    `DeviceDataFrame.from_directory(..., mode='r')`)*, operations which
+    write through the views *(e.g., in-place `sort`, `scatter`, `GroupBy`
+    with the `sort` engine)* raise a `ValueError` rather than writing to
+    read-only memory.  Groups returned by `__getitem__`, `select`, and
+    `DeviceDataFrame.view` inherit the attribute.
+
+    __NB__ Writes through another group sharing the same views *(e.g.,
+    directly through views, or through a group returned by `__getitem__`)*
+    are not tracked.
+    '''
+    TRANSFORM_CACHE = LRUCache()
+    sort_order = None
+    zone_map = None
+    read_only = False
+
+    @classmethod
+    def from_device_vectors(self, device_vectors):
+        group = DeviceViewGroup()
+        group._context = device_vectors._context
+        group._view_dict = device_vectors.v.copy()
+        if len(set([v.size for v in group._view_dict.itervalues()])) > 1:
+            # Device vector views are of different sizes.
+            group._jagged = True
+        else:
+            # All vector views are of the same length.
+            group._jagged = True
+        return group
+
+    @property
+    def jagged(self):
+        return self._jagged
+
+    @property
+    def df(self):
+        return self.as_dataframe()
+
+    def as_dataframe(self, copy=True):
+        '''
+        Return the viewed column data as a `pandas.DataFrame`.
+
+        Arguments
+        ---------
+
+         - `copy` : bool *(optional)*
+          * If `False`, column data residing in host memory is wrapped
+            without copying *(see `DeviceVectorView.asarray`)*.  Note that
+            `pandas` may still consolidate the columns into a single block.
+        '''
+        return pd.DataFrame(OrderedDict([(k, v.asarray(copy=copy))
+                                         for k, v in self._view_dict
+                                         .iteritems()]),
+                            index=range(*self.index_bounds()), copy=False)
+
+    def reset_views(self):
+        for column in self.columns:
+            self.v[column].first_i = 0
+            self.v[column].last_i = self.d[column].size - 1
+
+    def index_bounds(self):
+        sample_view = self._view_dict.values()[0]
+        first_i = sample_view.first_i
+        last_i = sample_view.last_i
+        return first_i, last_i + 1
+
+    def set_sort_order(self, keys, stable=False):
+        '''
+        Record that the rows of the group are sorted by the `keys` columns
+        *(see `sort_order`)*.
+        '''
+        if isinstance(keys, str):
+            keys = [keys]
+        if len(self._view_dict):
+            self.sort_order = SortOrder(keys, stable, self.index_bounds())
+
+    def check_writable(self, operation):
+        '''
+        Raise a `ValueError` if the views of the group must not be written
+        by `operation` *(see `read_only`)*.
+        '''
+        if self.read_only:
+            raise ValueError('Cannot %s: the views are read-only.' %
+                             operation)
+
+    def invalidate_sort_order(self, columns=None):
+        '''
+        Clear `sort_order` if any of the specified columns *(all columns by
+        default)* is one of the sorted key columns.
+        '''
+        if self.sort_order is None:
+            return
+        if isinstance(columns, str):
+            columns = [columns]
+        if columns is None or set(columns).intersection(self.sort_order
+                                                         .keys):
+            self.sort_order = None
+
+    def invalidate_zone_map(self, columns=None):
+        '''
+        Discard the block statistics of the specified columns *(all columns
+        by default)* from `zone_map`.
+        '''
+        if self.zone_map is None:
+            return
+        if columns is None:
+            self.zone_map = None
+        else:
+            if isinstance(columns, str):
+                columns = [columns]
+            self.zone_map.drop(columns)
+
+    def is_sorted(self, key_columns):
+        '''
+        Return `True` if the rows of the group are known to be sorted by the
+        `key_columns` *(see `sort_order`)*.
+        '''
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+        return (self.sort_order is not None and len(self._view_dict) > 0 and
+                self.sort_order.satisfies(key_columns, self.index_bounds()))
+
+    def inline_func(self, columns, code='', setup='', context=None,
+                    verbose=False, include_dirs=None, background=False,
+                    **kwargs):
+        '''
+        Return a dynamically compiled Cython function, based on the
+        `BASE_TEMPLATE` template.
+
+        Argument types are implied by the data-type of each column, where each
+        column is represented by the corresponding `DeviceVectorView` type.
+
+        Arguments
+        ---------
+
+         - `columns` : `list`-like
+          * Column names to pass as arguments to generated function.
+         - `code` : `str` *(optional)*
+          * Code to insert in function body.  May contain Jinja
+            template language.
+         - `setup` : `str` *(optional)*
+          * Set-up code to insert at start of template.  May contain Jinja
+            template language.
+         - `context` : `dict` *(optional)*
+          * Context to add to Jinja template context.
+         - `verbose` : `bool` *(optional)*
+          * If `True`, generated code will be printed.
+         - `background` : `bool` *(optional)*
+          * If `True`, compile in the compile pool of the context and return
+            a `concurrent.futures.Future` resolving to the function.
+         - `kwargs` : `dict` *(optional)*
+          * Additional keyword arguments to pass along to
+            `inline_cached_pyx_module`.
+        '''
+        if context is None:
+            context = {}
+        return build_inline_func(self._context, columns,
+                                 self.get_dtype(columns), code=code,
+                                 setup=setup,
+                                 template_context=dict(df=self, **context),
+                                 verbose=verbose, include_dirs=include_dirs,
+                                 background=background, **kwargs)
+
+    def __getitem__(self, key):
+        '''
+        Return the columns corresponding to the provided key(s) as a
+        `DeviceViewGroup`.
+        '''
         group = DeviceViewGroup()
         group._context = self._context
         views = self._get_scalar_or_list(key, lambda name, column: (name,
@@ -447,6 +2462,17 @@ class DeviceViewGroup(object):
         if isinstance(views, tuple):
             views = [views]
         group._view_dict = OrderedDict(views)
+        group.read_only = self.read_only
+        if self.sort_order is not None:
+            # The rows remain sorted by the selected prefix of the keys.
+            keys = []
+            for k in self.sort_order.keys:
+                if k not in group._view_dict:
+                    break
+                keys.append(k)
+            if keys:
+                group.sort_order = SortOrder(keys, self.sort_order.stable,
+                                             self.sort_order.bounds)
         return group
 
     @property
@@ -495,6 +2521,19 @@ class DeviceViewGroup(object):
                                                  dtype=view.dtype.__name__),
                                         include_name=True)
 
+    def expr(self, column):
+        '''
+        Return a lazy `ColumnExpression` *(or a list of expressions)* for the
+        specified column(s).
+        '''
+        tensors = self.__dict__.setdefault('_expr_tensors', {})
+        def _expr(column, view):
+            # Reuse tensors, so each column is a single input to a graph.
+            if column not in tensors:
+                tensors[column] = T.vector(column, dtype=view.dtype.__name__)
+            return ColumnExpression(self, tensors[column], (column, ))
+        return self._get_scalar_or_list(column, _expr, include_name=True)
+
     def get_dtype(self, column):
         return self._get_scalar_or_list(column, lambda x: x.dtype)
 
@@ -520,7 +2559,7 @@ class DeviceViewGroup(object):
         return get_sort_func(self._context, key_modules, key_dtypes,
                              value_modules, value_dtypes, stable=stable)
 
-    def sort(self, column=None, key=None, stable=False):
+    def sort(self, column=None, key=None, stable=False, inplace=True):
         '''
         Sort values in specified column(s) by the values specified key
         column(s).
@@ -531,7 +2570,16 @@ class DeviceViewGroup(object):
 
         If no `key` columns are specified, the values in the `column` column(s)
         are sorted while leaving all other columns *untouched*.
+
+        If `inplace` is `False`, no column is modified.  Instead, a
+        `SelectionViewGroup` of all columns is returned, with rows ordered by
+        the key columns *(see `argsort`)*.
         '''
+        if not inplace:
+            if key is None:
+                key = column if column is not None else self.columns
+            return self.select(self.argsort(key, stable=stable))
+
         if column is None:
             if key is not None:
                 raise ValueError('If column is not specified, `key` must not '
@@ -552,12 +2600,45 @@ class DeviceViewGroup(object):
         else:
             key = tuple(key)
 
+        self.check_writable('sort in place')
         sort_func = self.get_sort_func(key_columns=key, value_columns=columns,
                                        stable=stable)
-        sort_func(*self[key + columns])
+        sort_func(*[self.v[c] for c in key + columns])
+        self.invalidate_zone_map()
+        if set(key + columns) == set(self.columns):
+            self.set_sort_order(key, stable)
+        else:
+            # Rows of the columns which were not moved are no longer aligned
+            # with the sorted rows.
+            self.invalidate_sort_order()
+
+    def argsort(self, key, stable=False):
+        '''
+        Return a `DeviceVector` of the row positions which sort the rows by
+        the key column(s), sorting only a copy of the key columns along with
+        a row index *(see `SelectionViewGroup.sort`)*.
+
+        Value columns are not moved.  They may be gathered lazily, through a
+        `SelectionViewGroup` with the returned index *(see `select`)*.
+        '''
+        selection = self.select()
+        selection.sort_keys(key, stable=stable)
+        return selection._index
+
+    def as_arrays(self, copy=True):
+        '''
+        Return an ordered dictionary mapping each column name to a `numpy`
+        array of the viewed column data.
+
+        Arguments
+        ---------
 
-    def as_arrays(self):
-        return OrderedDict([(k, v[:]) for k, v in self._view_dict.iteritems()])
+         - `copy` : bool *(optional)*
+          * If `False`, column data residing in host memory is returned as
+            `numpy` views, without copying *(see `DeviceVectorView.asarray`)*.
+        '''
+        return OrderedDict([(k, v.asarray(copy=copy))
+                            for k, v in self._view_dict.iteritems()])
 
     def views(self):
         return self._view_dict.values()
@@ -578,54 +2659,134 @@ class DeviceViewGroup(object):
         return OrderedDict([(k, d.size)
                             for k, d in self._data_dict.iteritems()])
 
-    def groupby(self, key_columns, sort=True):
-        return GroupBy(self, key_columns)
+    def groupby(self, key_columns, sort=True, engine='sort'):
+        return GroupBy(self, key_columns, sort=sort, engine=engine)
+
+    def create_index(self, key):
+        '''
+        Return a `SortedIndex` of the rows of this group by the key
+        column(s), for batched point and range lookups.
+        '''
+        return SortedIndex(self, key)
+
+    def merge(self, right, on, how='inner', **kwargs):
+        '''
+        Return a `DeviceDataFrame` joining the rows of this group with the
+        rows of `right` by the `on` key column(s) *(see `merge`)*.
+        '''
+        return merge(self, right, on, how=how, **kwargs)
+
+    def select(self, index=None):
+        '''
+        Return a `SelectionViewGroup` of the views of this group, selecting
+        rows through an index column rather than copying column data.
+
+        Arguments
+        ---------
+
+         - `index` : numpy.ndarray or DeviceVector *(optional)*
+          * Positions of the selected rows, relative to the first row of each
+            view.  By default, all rows are selected in order.
+        '''
+        return SelectionViewGroup(self, index)
 
     def transform(self, transform_dict, out=None):
         '''
         Return result from applying specified transforms.
 
         Use `TRANSFORM_CACHE` to reuse previously compiled functions for the
-        same dictionary transforms.
+        same dictionary transforms.  At most `KERNEL_CACHE_SIZE` functions are
+        kept *(see `LRUCache`)*.
         '''
+        if out is not None:
+            out.check_writable('transform to `out`')
         out, group, foo = self.get_transform_function(transform_dict, out)
         foo(*group._view_dict.values())
+        out.invalidate_sort_order(transform_dict.keys())
+        out.invalidate_zone_map(transform_dict.keys())
         return out
 
-    def get_transform_function(self, transform_dict, out):
-        transform_tuple = tuple(transform_dict.items())
+    def get_transform_function(self, transform_dict, out, **kwargs):
+        '''
+        Return `(out, group, foo)`, where `foo` is the compiled transform
+        function to call with the views of `group`.
 
-        if out is None or transform_tuple not in self.TRANSFORM_CACHE:
-            transforms = OrderedDict([
-                (k, self._context.build_transform(v, '%s%s' % (k, hash(v))))
-                for k, v in transform_dict.iteritems()])
+        Additional keyword arguments are passed along to `inline_func`.  For
+        example, with `background=True`, `foo` is a future which is cached in
+        `TRANSFORM_CACHE` and resolved on next use.
+        '''
+        def build():
+            # Compute all outputs using a single functor, with shared
+            # subexpressions computed once *(see `FusedTransform`)*.
+            fused = None
+            if len(transform_dict) > 1:
+                try:
+                    fused = self._context.build_fused_transform(
+                        transform_dict.values())
+                except NotImplementedError:
+                    # Fall back to one functor per output.
+                    pass
+            if fused is None:
+                transforms = OrderedDict([
+                    (k, self._context.build_transform(v,
+                                                      transform_name(k, v)))
+                    for k, v in transform_dict.iteritems()])
+                out_dtypes = [t.thrust_code.output_nodes.sort_index()
+                              .iloc[-1].dtype
+                              for t in transforms.itervalues()]
+            else:
+                transforms = None
+                out_dtypes = fused.output_dtypes
+            return fused, transforms, out_dtypes
 
+        built = None
         if out is None:
+            built = build()
             out = DeviceDataFrame(OrderedDict([
-                (k, np.zeros(self.size, dtype=t.thrust_code.output_nodes
-                             .sort_index().iloc[-1].dtype))
-                for k, t in transforms.iteritems()]),
+                (k, np.zeros(self.size, dtype=dtype))
+                for k, dtype in zip(transform_dict.keys(), built[2])]),
                 context=self._context)
 
         group = join(self, out)
 
+        # Key cache on graph fingerprints, since `theano` variables hash by
+        # identity, and on the layout of `group`, since the compiled function
+        # is called with the views of `group` as positional arguments.
+        transform_tuple = ((self._context, ) +
+                           tuple((k, graph_fingerprint(v))
+                                 for k, v in transform_dict.iteritems()) +
+                           (tuple(group.columns),
+                            tuple(group.get_dtype(group.columns))))
+
         if transform_tuple in self.TRANSFORM_CACHE:
-            foo = self.TRANSFORM_CACHE[transform_tuple]
+            foo = self.TRANSFORM_CACHE.lookup(transform_tuple)
+            if not kwargs.get('background') and hasattr(foo, 'result'):
+                # Function was scheduled for compilation in the background.
+                foo = self.TRANSFORM_CACHE[transform_tuple] = foo.result()
         else:
-            setup = (jinja2.Template(TRANSFORM_SETUP_TEMPLATE)
-                    .render(transforms=transforms.values(),
-                            out_views=transforms.keys()))
-            code = (jinja2.Template(TRANSFORM_TEMPLATE)
-                    .render(transforms=transforms.values(),
-                            out_views=transforms.keys()))
+            if built is None:
+                built = build()
+            fused, transforms, out_dtypes = built
+            if fused is not None:
+                setup = (jinja2.Template(FUSED_TRANSFORM_SETUP_TEMPLATE)
+                         .render(t=fused))
+                code = (jinja2.Template(FUSED_TRANSFORM_TEMPLATE)
+                        .render(t=fused, out_views=transform_dict.keys()))
+                include_dirs = fused.get_includes()
+            else:
+                setup = (jinja2.Template(TRANSFORM_SETUP_TEMPLATE)
+                        .render(transforms=transforms.values(),
+                                out_views=transforms.keys()))
+                code = (jinja2.Template(TRANSFORM_TEMPLATE)
+                        .render(transforms=transforms.values(),
+                                out_views=transforms.keys()))
+                include_dirs = np.concatenate(
+                    [t.get_includes() for t in transforms.values()]).tolist()
 
             try:
                 foo = group.inline_func(group._view_dict.keys(),
-                    setup=setup,
-                    include_dirs=
-                    np.concatenate([t.get_includes()
-                                    for t in transforms.values()]).tolist(),
-                    code=code)
+                    setup=setup, include_dirs=include_dirs, code=code,
+                    **kwargs)
             except:
                 print 50 * '='
                 print setup
@@ -693,29 +2854,16 @@ class DeviceViewGroup(object):
             # iterable. Assume a single operator was passed.
             in_operations = [in_operations]
             out_operations = [out_operations]
-        transforms_in = [self._context.build_transform(t, 'scatter_in%s' %
-                                                       hash(t))
-                         for t in in_operations]
-        transforms_out = [self._context.build_transform(t, 'scatter_out%s' %
-                                                        hash(t))
-                          for t in out_operations]
-
-        setup = (jinja2.Template(SCATTER_SETUP_TEMPLATE)
-                 .render(transforms_in=transforms_in,
-                         transforms_out=transforms_out))
-        code = (jinja2.Template(SCATTER_TEMPLATE)
-                .render(transforms_in=transforms_in,
-                        transforms_out=transforms_out))
-
-        include_dirs = np.concatenate([t.get_includes()
-                                       for t in transforms_in +
-                                       transforms_out]).tolist()
-
-        scatter_func = self.inline_func(self.columns,
-                                        include_dirs=include_dirs, setup=setup,
-                                        code=code,
-                                        context=dict(preargs='uint32_t N, '))
+        self.check_writable('scatter')
+        scatter_func = get_scatter_func(
+            self._context, tuple(self.columns),
+            tuple(self.get_dtype(self.columns)),
+            tuple(GraphKey(t) for t in in_operations),
+            tuple(GraphKey(t) for t in out_operations))
         scatter_func(out_size, *self.v.values())
+        out_columns = graph_columns(out_operations, self.columns)
+        self.invalidate_sort_order(out_columns)
+        self.invalidate_zone_map(out_columns)
         return self
 
     def min(self, **kwargs):
@@ -731,48 +2879,26 @@ class DeviceViewGroup(object):
         return self._reduce_wrapper('multiplies', **kwargs)
 
     def describe(self, transforms=None, **kwargs):
-        reduce_ops = ['plus', 'plus', 'minimum', 'maximum']
+        return describe_summary(self.columns,
+                                self.prepare_describe(transforms)(self),
+                                self.size)
+
+    def prepare_describe(self, transforms=None):
+        '''
+        Return a `PreparedReduce` callable computing the sums, sums of
+        squares, minimums and maximums summarized by `describe` *(see
+        `describe_summary`)*.
+        '''
         if transforms is None or not transforms:
-            tensors = self.tensor(self.columns)
-            describe_ops = lambda t: [T.cast(t.take(T.arange((1 << 32) - 1)),
-                                             'float32'),
-                                      T.sqr(t),
-                                      T.cast(t.take(T.arange((1 << 32) - 1)),
-                                             'float32'),
-                                      T.cast(t.take(T.arange((1 << 32) - 1)),
-                                             'float32')]
-
-            operations = np.concatenate([describe_ops(t) for t in tensors])
-            _transforms = self.get_transforms(operations=operations)
+            _transforms = list(get_describe_transforms(
+                self._context, tuple(self.columns),
+                tuple(self.get_dtype(self.columns))))
             if isinstance(transforms, list):
                 transforms.extend(_transforms)
             else:
                 transforms = _transforms
-
-        index = pd.MultiIndex.from_product([self.columns, ['sum', 'sqr_sum',
-                                                           'min', 'max']])
-        result = pd.Series(self.reduce(reduce_ops * len(self.columns),
-                                       transforms=transforms),
-                           index=index)
-        n = float(self.size)
-        for column in self.columns:
-            mean = result[column, 'sum'] / n
-            sum_ = result[column, 'sum']
-            sqr_sum = result[column, 'sqr_sum']
-
-            # Compute standard deviation.
-            #
-            #  - Compute *sum of squares* using shortcut described [here][1].
-            #  - Compute *standard deviation* using sum of squares, as
-            #    described [here][2].
-            #
-            # [1]: https://people.richland.edu/james/lecture/m170/ch03-var.html
-            # [2]: https://www.westgard.com/lesson35.htm#5
-            std = np.sqrt((sqr_sum - (sum_ * sum_) / float(n)) / (n - 1))
-            result[column, 'mean'] = mean
-            result[column, 'std'] = std
-            result[column, 'count'] = n
-        return result.sortlevel(level=0, sort_remaining=False)
+        return self.prepare_reduce(DESCRIBE_REDUCE_OPS * len(self.columns),
+                                   transforms=transforms)
 
     def _reduce_wrapper(self, reduce_op, **kwargs):
         result = self.reduce(reduce_op, **kwargs)
@@ -792,11 +2918,28 @@ class DeviceViewGroup(object):
             # TODO: Fix support for bare column tensors.  This may require
             # changes to `theano_helpers`.
             operations = [t.take(T.arange((1 << 32) - 1)) for t in tensors]
-        return [self._context.build_transform(t, 'reduce%s' % hash(t))
+        return [self._context.build_transform(t, transform_name('reduce', t))
                 for t in operations]
 
     def reduce(self, reduce_ops=None, operations=None, transforms=None,
                init_values=None, size=None, **kwargs):
+        prepared = self.prepare_reduce(reduce_ops, operations=operations,
+                                       transforms=transforms,
+                                       init_values=init_values, **kwargs)
+        return prepared(self, size=size)
+
+    def prepare_reduce(self, reduce_ops=None, operations=None,
+                       transforms=None, init_values=None, **kwargs):
+        '''
+        Return a `PreparedReduce` callable, which is bound to the compiled
+        reduce function for the specified arguments *(see `reduce`)* and the
+        column layout of this group.
+
+        Calling the returned object with a view group having the same column
+        names and types *(e.g., `prepared(df)`)* is equivalent to calling
+        `df.reduce(...)`, but skips building transforms, rendering code, and
+        cache look-ups.
+        '''
         if transforms is None:
             transforms = self.get_transforms(operations=operations)
         elif isinstance(transforms, list) and not transforms:
@@ -812,42 +2955,28 @@ class DeviceViewGroup(object):
                            if not callable(TRANSFORM_IDENTITIES[k])
                            else TRANSFORM_IDENTITIES[k](transforms[i])
                            for i, k in enumerate(reduce_ops)]
-        if size is None:
-            size = self.size
 
         # Cast arguments as tuples since cached `get_reduce_func` function
         # requires *hashable* arguments.
         reduce_func = self.get_reduce_func(tuple(reduce_ops),
                                            tuple(transforms),
                                            tuple(init_values), **kwargs)
+        return PreparedReduce(reduce_func, self.columns, reduce_ops)
 
-        return reduce_func(size, *self.v.values())
-
-    @functools32.lru_cache()
     def get_reduce_func(self, reduce_ops, transforms, init_values, **kwargs):
         '''
         __NB__ `reduce_ops`, `transforms`, and `init_values` must all be
         *hashable* types.  This is a requirement for using
         `functools32.lru_cache`.
-        '''
-        setup = (jinja2.Template(REDUCE_SETUP_TEMPLATE)
-                .render(transforms=transforms,
-                        reduce_ops=reduce_ops,
-                        init_values=init_values,
-                        named_positions=NAMED_POSITIONS))
-
-        code = (jinja2.Template(REDUCE_TEMPLATE)
-                .render(transforms=transforms,
-                        reduce_ops=reduce_ops,
-                        init_values=init_values,
-                        named_positions=NAMED_POSITIONS))
 
-        include_dirs = np.concatenate([t.get_includes()
-                                       for t in transforms]).tolist()
-
-        return self.inline_func(self.columns, include_dirs=include_dirs,
-                                setup=setup, code=code,
-                                context=dict(preargs='size_t N, '), **kwargs)
+        Compiled functions are cached by `get_transform_reduce_func`, keyed on
+        the column names/types of this group, so groups with the same layout
+        share compiled functions.
+        '''
+        return get_transform_reduce_func(self._context, tuple(self.columns),
+                                         tuple(self.get_dtype(self.columns)),
+                                         reduce_ops, transforms, init_values,
+                                         **kwargs)
 
 
 class DeviceVectorCollection(DeviceViewGroup):
@@ -860,22 +2989,29 @@ class DeviceVectorCollection(DeviceViewGroup):
     The types of the device vector instances will be inferred based on the
     types of the input arrays.
 
+    If `borrow` is `True`, the memory of each input array is used directly
+    *(see `Context.borrow_array`)*, rather than copied into a new device
+    vector.  This is only supported for host backends.
+
 
     Known issues
     ------------
 
      - Only numeric types are accepted.
     '''
-    def __init__(self, data=None, context=None):
+    def __init__(self, data=None, context=None, borrow=False):
         if context is None:
             context = Context()
         self._context = context
+        if borrow:
+            from_array = self._context.borrow_array
+        else:
+            from_array = self._context.from_array
         if isinstance(data, dict):
-            self._data_dict = OrderedDict([(k, self._context.from_array(v))
+            self._data_dict = OrderedDict([(k, from_array(v))
                                            for k, v in data.iteritems()])
         elif isinstance(data, pd.DataFrame):
-            self._data_dict = OrderedDict([(c, self._context
-                                            .from_array(data[c].values))
+            self._data_dict = OrderedDict([(c, from_array(data[c].values))
                                            for c in data.columns])
         elif data is None:
             self._data_dict = OrderedDict()
@@ -914,6 +3050,7 @@ class DeviceVectorCollection(DeviceViewGroup):
         result._view_dict = OrderedDict([(k, v.view())
                                          for k, v in result._data_dict
                                          .iteritems()])
+        result.read_only = self.read_only
         return result
 
     @property
@@ -931,16 +3068,23 @@ class DeviceDataFrame(DeviceVectorCollection):
     The types of the device vector instances will be inferred based on the
     types of the input arrays.
 
+    If `borrow` is `True`, the memory of each input array is used directly
+    *(see `Context.borrow_array`)*, rather than copied into a new device
+    vector.  This is only supported for host backends.
+
 
     Known issues
     ------------
 
      - Only numeric types are accepted.
     '''
-    def __init__(self, data=None, context=None):
+    # Directory of an on-disk frame *(see `from_directory`)*, or `None`.
+    frame_dir = None
+
+    def __init__(self, data=None, context=None, borrow=False):
         if isinstance(data, dict):
             assert(len(set([v.size for v in data.itervalues()])) == 1)
-        super(DeviceDataFrame, self).__init__(data, context)
+        super(DeviceDataFrame, self).__init__(data, context, borrow=borrow)
 
     def copy(self):
         return DeviceDataFrame(self.as_arrays(), context=self._context)
@@ -970,8 +3114,210 @@ class DeviceDataFrame(DeviceVectorCollection):
             end = self._data_dict.values()[0].size - 1
         self._view_dict[column_name] = self._data_dict[column_name].view(
             first_i=start, last_i=end)
+        self.invalidate_sort_order([column_name])
+        self.invalidate_zone_map([column_name])
+
+    def assign(self, column, expression):
+        '''
+        Write the values of a `ColumnExpression` to `column` using a single
+        fused transform kernel, without allocating intermediate columns.  If
+        `column` does not exist, it is added with the data type of the
+        expression.
+        '''
+        self.check_writable('assign')
+        if column not in self.columns:
+            self.add(column, dtype=expression.dtype)
+        # Only pass the input columns of the expression to the transform, so
+        # the compiled function does not depend on other frame columns.
+        self[list(expression.columns)].transform(
+            {column: expression.operation_graph}, out=self[[column]])
+        self.invalidate_sort_order([column])
+        self._update_zone_map([column])
+        return self
+
+    def filter(self, predicate, inplace=True):
+        '''
+        Keep only the rows for which `predicate` is non-zero, compacting all
+        columns in a single pass per `MAX_ZIP_ARITY` columns *(see
+        `get_filter_func`)*.  The relative order of kept rows is preserved.
+
+        Arguments
+        ---------
+
+         - `predicate` : ColumnExpression or theano graph
+           * Boolean expression over the frame columns, e.g.,
+             `df.expr('a') > 0` *(see `DeviceViewGroup.expr`)*, or a graph
+             over column tensors *(see `DeviceViewGroup.tensor`)*.
+         - `inplace` : bool *(optional)*
+           * If `True` *(default)*, kept rows are moved to the start of the
+             existing views and the view bounds are updated, so no column is
+             allocated other than the mask.
+           * Otherwise, kept rows are copied to a new, right-sized frame.
+
+        Returns
+        -------
+
+        `self` if `inplace` is `True`, or a new `DeviceDataFrame`.
+
+        __NB__ The predicate is first evaluated to a one byte per row mask,
+        since the stencil of `stable_partition` must not overlap the
+        partitioned columns.
+
+        If the frame has a `zone_map`, blocks of rows outside the column
+        ranges implied by the predicate *(see `predicate_ranges`)* are
+        skipped, and the predicate is only evaluated for the remaining
+        blocks *(see `_filter_runs`)*.
+        '''
+        if inplace:
+            self.check_writable('filter in place')
+        graph, input_columns = mask_graph(predicate, self.columns)
+        zone_map = self._valid_zone_map()
+        if zone_map is not None:
+            candidates, covered = zone_map.classify(
+                predicate_ranges(predicate))
+            if not candidates.all():
+                return self._filter_runs(graph, input_columns,
+                                         zone_map.runs(candidates), inplace)
+
+        mask = self[input_columns].transform({'mask': graph})
+        filter_func = get_filter_func(self._context,
+                                      tuple(self.get_dtype(self.columns)),
+                                      inplace)
+
+        if inplace:
+            count = filter_func(mask.v['mask'], *self._view_dict.values())
+            self._keep_first(count)
+            return self
+        else:
+            count = mask_count(mask)
+            out = DeviceDataFrame(OrderedDict([
+                (k, np.zeros(count, dtype=dtype))
+                for k, dtype in zip(self.columns,
+                                    self.get_dtype(self.columns))]),
+                context=self._context)
+            if count > 0:
+                filter_func(mask.v['mask'], *(self._view_dict.values() +
+                                              out._view_dict.values()))
+            if self.sort_order is not None:
+                out.set_sort_order(self.sort_order.keys,
+                                   self.sort_order.stable)
+            return out
+
+    def _keep_first(self, count):
+        # Shrink the views to the first `count` rows, e.g., after the kept
+        # rows of an in-place filter are moved to the start of the views.
+        for view in self._view_dict.itervalues():
+            if count > 0:
+                view.last_i = view.first_i + count - 1
+            else:
+                # Setting `last_i` to `-1` wraps around to the end of the
+                # vector, so move `first_i` to the end of the view.
+                view.first_i = view.last_i + 1
+        if self.sort_order is not None:
+            # Kept rows are in the same relative order.
+            self.set_sort_order(self.sort_order.keys, self.sort_order.stable)
+
+    def _filter_runs(self, graph, input_columns, runs, inplace):
+        '''
+        Filter only the rows within the `(start, end)` row ranges in `runs`
+        *(see `filter`)*, e.g., the blocks of `zone_map` which may contain
+        rows matching the predicate `graph`.
+
+        The mask of each run is evaluated and counted first, and the kept
+        rows of each run are then copied to a single, right-sized frame.
+        If `inplace` is `True`, the kept rows are gathered back to the start
+        of the views of this frame.
+        '''
+        dtypes = self.get_dtype(self.columns)
+        masks = []
+        count = 0
+        for start, end in runs:
+            views = self.view(start, end)
+            mask = views[input_columns].transform({'mask': graph})
+            run_count = int(mask_count(mask))
+            masks.append((views, mask, run_count))
+            count += run_count
+
+        out = DeviceDataFrame(OrderedDict([
+            (k, np.zeros(count, dtype=dtype))
+            for k, dtype in zip(self.columns, dtypes)]),
+            context=self._context)
+        filter_func = get_filter_func(self._context, tuple(dtypes), False)
+        offset = 0
+        for views, mask, run_count in masks:
+            if run_count > 0:
+                out_views = out.view(offset, offset + run_count)
+                filter_func(mask.v['mask'],
+                            *([views.v[c] for c in self.columns] +
+                              [out_views.v[c] for c in self.columns]))
+            offset += run_count
+
+        if not inplace:
+            if self.sort_order is not None:
+                out.set_sort_order(self.sort_order.keys,
+                                   self.sort_order.stable)
+            return out
+        if count > 0:
+            index = self._context.from_array(
+                np.arange(count, dtype=SELECTION_INDEX_DTYPE))
+            gather_func = get_gather_func(self._context, tuple(dtypes))
+            gather_func(index.view(), *([out.v[c] for c in self.columns] +
+                                        [self.v[c] for c in self.columns]))
+        self._keep_first(count)
+        return self
+
+    def reduce(self, reduce_ops=None, operations=None, transforms=None,
+               init_values=None, size=None, ranges=None, **kwargs):
+        '''
+        Reduce the rows of the frame *(see `DeviceViewGroup.reduce`)*.
+
+        Arguments
+        ---------
+
+         - `ranges` : `dict` *(optional)*
+          * Mapping from column names to inclusive `(lo, hi)` bounds *(`None`
+            if unbounded)*.  If specified, only rows within all of the ranges
+            are reduced.  If the frame has a `zone_map`, blocks without rows
+            within the ranges are skipped, blocks with _all_ rows within the
+            ranges are reduced directly, and only the rows of the remaining
+            blocks are filtered before they are reduced.  The partial results
+            are combined using `PreparedReduce.combine`.
+
+        Remaining arguments are passed to `DeviceViewGroup.reduce`.
+        '''
+        predicate = None if ranges is None else range_predicate(self, ranges)
+        if predicate is None:
+            return super(DeviceDataFrame, self).reduce(
+                reduce_ops, operations=operations, transforms=transforms,
+                init_values=init_values, size=size, **kwargs)
+        elif size is not None:
+            raise ValueError('`size` is not supported along with `ranges`.')
+
+        prepared = self.prepare_reduce(reduce_ops, operations=operations,
+                                       transforms=transforms,
+                                       init_values=init_values, **kwargs)
+        zone_map = self._valid_zone_map()
+        if zone_map is None:
+            runs = [((0, self.size), False)] if self.size > 0 else []
+        else:
+            candidates, covered = zone_map.classify(ranges)
+            runs = ([(r, True) for r in zone_map.runs(candidates & covered)] +
+                    [(r, False) for r in zone_map.runs(candidates &
+                                                       ~covered)])
+        # Reducing no rows yields the initial values.
+        result = prepared(self, size=0)
+        for (start, end), run_covered in runs:
+            views = self.view(start, end)
+            if not run_covered:
+                views = views.filter(predicate, inplace=False)
+            result = prepared.combine(result, prepared(views))
+        return result
 
     def __setitem__(self, key_or_slice, value):
+        if isinstance(value, ColumnExpression):
+            self.assign(key_or_slice, value)
+            return
+        self.check_writable('set items')
         if isinstance(value, pd.DataFrame):
             missing_columns = (set(value.columns)
                                .difference(self._view_dict.keys()))
@@ -987,69 +3333,771 @@ class DeviceDataFrame(DeviceVectorCollection):
         if isinstance(value, pd.DataFrame):
             for column in value.columns:
                 self._view_dict[column][key_or_slice] = value[column]
+            self.invalidate_sort_order(value.columns)
+            self._update_zone_map(value.columns, key_or_slice)
         else:
             for v in self._view_dict.itervalues():
                 v[key_or_slice] = value
+            self.invalidate_sort_order()
+            self._update_zone_map(self.columns, key_or_slice)
+
+    def build_zone_map(self, columns=None, block_size=ZONE_MAP_BLOCK_SIZE):
+        '''
+        Compute the minimum and maximum of each block of `block_size` rows of
+        the specified columns *(all columns by default)* in a single pass
+        per column, and store them as `zone_map` *(see `ZoneMap`)*.
+
+        The statistics of written blocks are recomputed by `__setitem__` and
+        `assign`.  They are used by `filter` and by `reduce` with `ranges` to
+        skip blocks without rows within the ranges of the predicate.
+
+        Returns
+        -------
+
+        The `ZoneMap`.
+        '''
+        if columns is None:
+            columns = self.columns
+        elif isinstance(columns, str):
+            columns = [columns]
+        mins, maxs = block_minmax(self, list(columns), block_size)
+        self.zone_map = ZoneMap(block_size, self.index_bounds(), mins, maxs)
+        return self.zone_map
+
+    def _valid_zone_map(self):
+        # Return `zone_map` if it was computed for the current view bounds,
+        # e.g., not before an in-place filter.
+        if (self.zone_map is None or not len(self._view_dict) or
+                self.zone_map.bounds != self.index_bounds()):
+            return None
+        return self.zone_map
+
+    def _update_zone_map(self, columns, key_or_slice=None):
+        # Recompute the block statistics of the rows of `columns` written
+        # through `key_or_slice` *(all rows by default)*.
+        zone_map = self._valid_zone_map()
+        if zone_map is None:
+            return
+        size = self.size
+        if key_or_slice is None:
+            start, end = 0, size
+        elif isinstance(key_or_slice, slice):
+            start, end, step = key_or_slice.indices(size)
+        else:
+            start = key_or_slice if key_or_slice >= 0 else size + key_or_slice
+            end = start + 1
+        zone_map.update(self, list(columns), start, end)
 
     def _in_bounds(self, i):
         lbound, ubound = self.index_bounds()
         return (i >= lbound and i < ubound and lbound < ubound)
 
-    @property
-    def size(self):
-        sizes = self.sizes
-        min_size = min(sizes.values())
-        max_size = max(sizes.values())
-        assert(min_size == max_size)
-        return max_size
+    @property
+    def size(self):
+        sizes = self.sizes
+        min_size = min(sizes.values())
+        max_size = max(sizes.values())
+        assert(min_size == max_size)
+        return max_size
+
+    @property
+    def vector_size(self):
+        sizes = self.vector_sizes
+        min_size = min(sizes.values())
+        max_size = max(sizes.values())
+        assert(min_size == max_size)
+        return max_size
+
+    def view(self, start, end=None):
+        '''
+        Return a view corresponding to the specified slice of the views
+        dictionary items.
+
+        *N.B.,* No data is copied.
+        '''
+        if end is None:
+            start = 0
+            end = start
+        if start < 0:
+            start = self.size + start
+        if end < 0:
+            end = self.size + end + 1
+        elif end > self.size:
+            end = self.size
+        view = DeviceDataFrame()
+        view._data_dict = self._data_dict
+        if len(self._view_dict):
+            sample_view = self._view_dict.values()[0]
+            start += sample_view.first_i
+            end += sample_view.first_i
+            end = min(sample_view.last_i + 1, end)
+        view._view_dict = OrderedDict([(k, v.view(start, end - 1))
+                                        for k, v in
+                                        self._data_dict.iteritems()])
+        # Rows within a view of sorted rows are sorted *(see
+        # `SortOrder.satisfies`)*.
+        view.sort_order = self.sort_order
+        view.read_only = self.read_only
+        return view
+
+    def base(self):
+        result = DeviceDataFrame()
+        result._data_dict = self._data_dict
+        result._view_dict = OrderedDict([(k, v.view())
+                                         for k, v in result._data_dict
+                                         .iteritems()])
+        result.read_only = self.read_only
+        return result
+
+    def to_directory(self, frame_dir, overwrite=False):
+        '''
+        Write the viewed rows of each column to a memory-mappable file in
+        `frame_dir`, along with a metadata file listing the column names and
+        data types *(see `from_directory`)*.
+
+        Arguments
+        ---------
+
+         - `frame_dir` : `str`
+          * Output directory *(created if it does not exist)*.
+         - `overwrite` : bool *(optional)*
+          * If `False` *(default)*, raise an `IOError` if `frame_dir` already
+            contains a frame.
+        '''
+        columns = [(c, self.get_dtype(c)) for c in self.columns]
+        mmaps = _create_frame_directory(frame_dir, columns, self.size,
+                                        overwrite=overwrite)
+        for column, mmap in mmaps.iteritems():
+            mmap[:] = self.v[column].asarray(copy=False)
+            mmap.flush()
+
+    @classmethod
+    def from_directory(cls, frame_dir, mode='r+', context=None):
+        '''
+        Open a frame written by `to_directory` *(or created by
+        `create_mapped`)*, with each column memory-mapped from its file.
+
+        Column memory is used directly by all operations *(see
+        `Context.borrow_array`)*, so opening a frame is instant, and frames
+        larger than RAM are supported.  Only supported for host backends.
+
+        Arguments
+        ---------
+
+         - `frame_dir` : `str`
+         - `mode` : `str` *(optional)*
+          * `numpy.memmap` mode:
+           - `'r+'` *(default)*: changes *(e.g., in-place sorts)* are written
+             to the column files.
+           - `'c'`: copy-on-write; changes are _not_ written to disk.
+           - `'r'`: read-only; operations which modify the frame in place
+             *(e.g., `sort`)* raise a `ValueError` *(see
+             `DeviceViewGroup.read_only`)*.  Use non-mutating alternatives
+             instead *(e.g., `sort(inplace=False)`, or `GroupBy` with the
+             `argsort`, `hash`, or `dense` engine)*.
+         - `context` : `Context` *(optional)*
+        '''
+        frame_dir = path(frame_dir)
+        metadata = json.loads(frame_dir.joinpath(FRAME_METADATA_NAME)
+                              .bytes())
+        mmaps = OrderedDict()
+        for column in metadata['columns']:
+            dtype = np.dtype(str(column['dtype']))
+            if metadata['size'] > 0:
+                mmaps[column['name']] = np.memmap(frame_dir
+                                                  .joinpath(column['file']),
+                                                  dtype=dtype, mode=mode,
+                                                  shape=(metadata['size'], ))
+            else:
+                # Empty files cannot be memory-mapped.
+                mmaps[column['name']] = np.zeros(0, dtype=dtype)
+        frame = cls(mmaps, context=context, borrow=True)
+        frame.frame_dir = frame_dir
+        frame._mmaps = mmaps
+        frame.read_only = (mode == 'r')
+        return frame
+
+    @classmethod
+    def create_mapped(cls, frame_dir, columns, size, context=None,
+                      overwrite=False):
+        '''
+        Create a zero-filled frame in `frame_dir`, with each column
+        memory-mapped from its file *(see `from_directory`)*.
+
+        Arguments
+        ---------
+
+         - `frame_dir` : `str`
+         - `columns` : `list`-like
+          * Ordered `(column name, dtype)` pairs.
+         - `size` : int
+          * Number of rows.
+         - `context` : `Context` *(optional)*
+         - `overwrite` : bool *(optional)*
+          * If `False` *(default)*, raise an `IOError` if `frame_dir` already
+            contains a frame.
+        '''
+        mmaps = _create_frame_directory(frame_dir, columns, size,
+                                        overwrite=overwrite)
+        del mmaps
+        return cls.from_directory(frame_dir, context=context)
+
+    def flush(self):
+        '''
+        Write any changes to memory-mapped columns to disk.  Has no effect
+        for frames that are not memory-mapped.
+        '''
+        for mmap in getattr(self, '_mmaps', {}).itervalues():
+            if isinstance(mmap, np.memmap):
+                mmap.flush()
+
+
+class SelectionViewGroup(DeviceViewGroup):
+    '''
+    Group of device vector views with a row-index *(selection vector)* column
+    *(see `DeviceViewGroup.select`)*.
+
+    Row `i` of the group is row `index[i]` of the underlying views.  Filtering
+    and sorting only modify the index, so the column data is never copied
+    after each step of a multi-step query.  Columns are gathered through
+    `permutation_iterator` when:
+
+     - Explicitly requested *(see `materialize`, `as_arrays`)*.
+     - Read by `transform`, `reduce`, and column expressions, in which case
+       only the columns referenced by the operations are gathered.
+     - Reduced by a `PreparedReduce` *(e.g., `prepare_reduce`,
+       `prepare_describe`, `stream_reduce`)*, in which case the columns of
+       the prepared layout are gathered.
+     - Grouped by `groupby`, since `GroupBy` sorts all columns in place.
+
+    `scatter` is not supported, since it writes through the views.
+
+    Example
+    -------
+
+        >>> selection = df.select()
+        >>> selection.filter(selection.expr('a') > 0)
+        >>> selection.sort(key='b')
+        >>> selection.materialize(['a', 'c'])
+
+    __NB__ Groups returned by `__getitem__` share the index of this group.
+    '''
+    def __init__(self, group, index=None):
+        self._context = group._context
+        self._view_dict = group._view_dict.copy()
+        self._jagged = False
+        self.read_only = group.read_only
+        if index is None:
+            index = np.arange(group.size, dtype=SELECTION_INDEX_DTYPE)
+        if isinstance(index, np.ndarray):
+            index = self._context.from_array(
+                index.astype(SELECTION_INDEX_DTYPE))
+        self._index = index
+
+    @property
+    def index(self):
+        return self._index.view()
+
+    def select(self, index=None):
+        '''
+        Return a `SelectionViewGroup` of the selected rows, with a separate
+        copy of the index.  If `index` is specified, it is composed with the
+        index of this group, i.e., row `i` of the returned group is row
+        `index[i]` of this group.
+        '''
+        if index is None:
+            return SelectionViewGroup(self, self.index.asarray())
+        if isinstance(index, np.ndarray):
+            index = self._context.from_array(
+                index.astype(SELECTION_INDEX_DTYPE))
+        composed = self._context.from_array(
+            np.zeros(index.size, dtype=SELECTION_INDEX_DTYPE))
+        if index.size > 0:
+            gather_func = get_gather_func(self._context,
+                                          (SELECTION_INDEX_DTYPE, ))
+            gather_func(index.view(), self.index, composed.view())
+        return SelectionViewGroup(self, composed)
+
+    def __getitem__(self, key):
+        return SelectionViewGroup(super(SelectionViewGroup,
+                                        self).__getitem__(key), self._index)
+
+    @property
+    def sizes(self):
+        return OrderedDict([(k, self._index.size) for k in self.columns])
+
+    @property
+    def size(self):
+        return self._index.size
+
+    def materialize(self, columns=None):
+        '''
+        Return a `DeviceDataFrame` containing the selected rows of the
+        specified columns *(all columns by default)*, gathered in a single
+        pass per `MAX_ZIP_ARITY` columns *(see `get_gather_func`)*.
+        '''
+        if columns is None:
+            columns = self.columns
+        elif isinstance(columns, str):
+            columns = [columns]
+        columns = list(columns)
+        dtypes = self.get_dtype(columns)
+        out = DeviceDataFrame(OrderedDict([
+            (c, np.zeros(self.size, dtype=d))
+            for c, d in zip(columns, dtypes)]), context=self._context)
+        if columns and self.size > 0:
+            gather_func = get_gather_func(self._context, tuple(dtypes))
+            gather_func(self.index, *([self.v[c] for c in columns] +
+                                      out._view_dict.values()))
+        return out
+
+    def as_arrays(self, copy=True):
+        return self.materialize().as_arrays(copy=copy)
+
+    def as_dataframe(self, copy=True):
+        df = self.materialize().as_dataframe(copy=copy)
+        df.index = self.index.asarray()
+        return df
+
+    def filter(self, predicate):
+        '''
+        Keep only the selected rows for which `predicate` is non-zero *(see
+        `DeviceDataFrame.filter`)*.  Only the columns referenced by
+        `predicate` are gathered, and only the index is compacted.
+        '''
+        graph, input_columns = mask_graph(predicate, self.columns)
+        mask = self.materialize(input_columns).transform({'mask': graph})
+        count = mask_count(mask)
+        index = self._context.from_array(np.zeros(count,
+                                                  dtype=SELECTION_INDEX_DTYPE))
+        if count > 0:
+            filter_func = get_filter_func(self._context,
+                                          (SELECTION_INDEX_DTYPE, ), False)
+            filter_func(mask.v['mask'], self.index, index.view())
+        self._index = index
+        return self
+
+    def sort(self, column=None, key=None, stable=False):
+        '''
+        Reorder the selected rows by the values of the key column(s).  Only
+        the key columns are gathered, and only the index is permuted.
+
+        For consistency with `DeviceViewGroup.sort`, key columns may be
+        specified as either `column` or `key`.
+        '''
+        if key is None:
+            key = column
+        if key is None:
+            key = self.columns
+        self.sort_keys(key, stable=stable)
+        return self
+
+    def sort_keys(self, key, stable=False):
+        '''
+        Reorder the selected rows by the values of the key column(s) *(see
+        `sort`)*, and return a `DeviceDataFrame` containing the sorted key
+        columns.
+        '''
+        if isinstance(key, str):
+            key = [key]
+        keys = self.materialize(key)
+        key_columns = keys.columns
+        sort_func = get_sort_func(
+            self._context, tuple(keys.get_vector_module(key_columns)),
+            tuple(keys.get_dtype(key_columns)),
+            (self._context.get_device_vector_module(SELECTION_INDEX_DTYPE), ),
+            (SELECTION_INDEX_DTYPE, ), stable=stable)
+        sort_func(*(keys.v.values() + [self.index]))
+        return keys
+
+    def transform(self, transform_dict, out=None):
+        columns = graph_columns(transform_dict.values(), self.columns)
+        return self.materialize(columns).transform(transform_dict, out=out)
+
+    def reduce(self, reduce_ops=None, operations=None, transforms=None,
+               init_values=None, size=None, **kwargs):
+        if transforms is None:
+            transforms = self.get_transforms(operations=operations)
+        elif isinstance(transforms, list) and not transforms:
+            transforms.extend(self.get_transforms(operations=operations))
+        columns = [c for c in self.columns
+                   if any(c in t.thrust_code.graph_inputs
+                          for t in transforms)]
+        return self.materialize(columns).reduce(reduce_ops,
+                                                transforms=transforms,
+                                                init_values=init_values,
+                                                size=size, **kwargs)
+
+    def describe(self, transforms=None, **kwargs):
+        return self.materialize().describe(transforms, **kwargs)
+
+    def scatter(self, out_size, in_operations, out_operations):
+        # Scattering through the raw views would ignore the index.
+        raise NotImplementedError('Not supported for selections.  Use '
+                                  '`materialize().scatter(...)` instead.')
+
+    def groupby(self, key_columns, sort=True, engine='sort'):
+        return self.materialize().groupby(key_columns, sort=sort,
+                                          engine=engine)
+
+
+class SortedIndex(object):
+    '''
+    Index of the rows of a `DeviceViewGroup` by key column(s), for batched
+    point *(`get`)* and range *(`between`)* lookups.
+
+    The index holds a sorted copy of the key columns, along with the row
+    permutation which sorts the rows *(see `DeviceViewGroup.argsort`)*.  If
+    the rows are already sorted by the key columns *(see
+    `DeviceViewGroup.sort_order`)*, the key columns are used in place and no
+    permutation is stored.
+
+    Each batch of lookups is answered using vectorized `lower_bound` and
+    `upper_bound` *(i.e., `O(log n)` per lookup)*, followed by a single
+    gather of the matching rows.
+
+    Example
+    -------
+
+        >>> index = df.create_index('id')
+        >>> index.get(np.array([3, 17, 42]))
+        >>> index.between(10, 20)
+
+    __NB__ The index is a snapshot of the key columns.  Create a new index
+    after writing to the key columns of the group.
+    '''
+    def __init__(self, group, key):
+        if isinstance(key, str):
+            key = [key]
+        self.group = group
+        self.key = list(key)
+        if len(self.key) > MAX_ZIP_ARITY:
+            raise ValueError('At most %d key columns are supported.' %
+                             MAX_ZIP_ARITY)
+        self.key_dtypes = group.get_dtype(self.key)
+        if group.is_sorted(self.key):
+            self.keys = group[self.key]
+            self.order = None
+        else:
+            selection = group.select()
+            self.keys = selection.sort_keys(self.key, stable=True)
+            self.order = selection._index
+
+    @property
+    def size(self):
+        return self.keys.size
+
+    def _queries(self, values):
+        # Return a `DeviceViewGroup` of query keys, with one column per key
+        # column.
+        if isinstance(values, SelectionViewGroup):
+            values = values.materialize(self.key)
+        if isinstance(values, DeviceViewGroup):
+            if values.get_dtype(self.key) != self.key_dtypes:
+                raise ValueError('Query keys must have the same data types '
+                                 'as the key columns.')
+            return values
+        if isinstance(values, (dict, pd.DataFrame)):
+            arrays = [values[c] for c in self.key]
+        elif len(self.key) == 1:
+            arrays = [values]
+        else:
+            # Single key, as a tuple of values.
+            arrays = list(values)
+        return DeviceDataFrame(OrderedDict([
+            (c, np.asarray(a, dtype=d).ravel())
+            for c, a, d in zip(self.key, arrays, self.key_dtypes)]),
+            context=self.group._context)
+
+    def _search(self, lo, hi):
+        # Return `(bounds, row_count)`, where `bounds` holds the `lower`
+        # and `upper` positions of each range in the sorted keys, and the
+        # `offset` of the rows of each range.
+        lo = self._queries(lo)
+        hi = lo if hi is None else self._queries(hi)
+        if lo.size != hi.size:
+            raise ValueError('`lo` and `hi` must have the same number of '
+                             'keys.')
+        context = self.group._context
+        bounds = DeviceDataFrame(OrderedDict([
+            ('lower', np.zeros(lo.size, dtype=SELECTION_INDEX_DTYPE)),
+            ('upper', np.zeros(lo.size, dtype=SELECTION_INDEX_DTYPE)),
+            ('offset', np.zeros(lo.size, dtype=np.uint64))]),
+            context=context)
+        count_func = get_range_count_func(context, tuple(self.key_dtypes))
+        row_count = count_func(*([self.keys.v[c] for c in self.key] +
+                                 [lo.v[c] for c in self.key] +
+                                 [hi.v[c] for c in self.key] +
+                                 bounds._view_dict.values()))
+        return bounds, row_count
+
+    def _rows(self, bounds, row_count):
+        # Return the rows of the group within the ranges found by `_search`.
+        context = self.group._context
+        if (self.order is None and bounds.size == 1 and row_count > 0 and
+                isinstance(self.group, DeviceDataFrame)):
+            # Single range of sorted rows, so no data is copied.
+            lower = int(bounds.v['lower'].asarray()[0])
+            return self.group.view(lower, lower + row_count)
+        if row_count == 0:
+            return SelectionViewGroup(self.group,
+                                      np.zeros(0, dtype=SELECTION_INDEX_DTYPE)
+                                      ).materialize()
+        positions = context.from_array(np.zeros(row_count,
+                                                dtype=SELECTION_INDEX_DTYPE))
+        ranges = context.from_array(np.zeros(row_count,
+                                             dtype=SELECTION_INDEX_DTYPE))
+        get_join_expand_func(context, 'inner')(
+            *(bounds._view_dict.values() + [ranges.view(),
+                                            positions.view()]))
+        if self.order is not None:
+            # Map positions in the sorted keys to rows of the group.
+            rows = context.from_array(np.zeros(row_count,
+                                               dtype=SELECTION_INDEX_DTYPE))
+            get_gather_func(context, (SELECTION_INDEX_DTYPE, ))(
+                positions.view(), self.order.view(), rows.view())
+            positions = rows
+        return SelectionViewGroup(self.group, positions).materialize()
+
+    def bounds(self, lo, hi=None):
+        '''
+        Return `(lower, upper)` `numpy` arrays, such that the rows with keys
+        within each inclusive `[lo, hi]` range *(`hi` defaults to `lo`)* are
+        at positions `[lower, upper)` of the sorted keys.
+
+        Rows returned by `get` and `between` are grouped by range, in the
+        order of the ranges, i.e., `upper - lower` rows per range.
+        '''
+        bounds, row_count = self._search(lo, hi)
+        return bounds.v['lower'].asarray(), bounds.v['upper'].asarray()
+
+    def get(self, keys):
+        '''
+        Return the rows with key(s) equal to each of the specified key(s).
+
+        Arguments
+        ---------
+
+         - `keys` : One of:
+          * Scalar or array-like of keys *(single key column only)*.
+          * `tuple` of scalars *(single key with several key columns)*.
+          * `dict`-like or `pandas.DataFrame` with one array-like of keys per
+            key column.
+          * `DeviceViewGroup` containing the key columns.
 
-    @property
-    def vector_size(self):
-        sizes = self.vector_sizes
-        min_size = min(sizes.values())
-        max_size = max(sizes.values())
-        assert(min_size == max_size)
-        return max_size
+        Returns
+        -------
 
-    def view(self, start, end=None):
+        `DeviceDataFrame` containing the matching rows, grouped by key in the
+        order of `keys` *(see `bounds`)*.  If the rows of the group are
+        sorted by key and there is a single key, a view of the matching rows
+        is returned, i.e., no data is copied.
         '''
-        Return a view corresponding to the specified slice of the views
-        dictionary items.
+        return self._rows(*self._search(keys, None))
 
-        *N.B.,* No data is copied.
+    def between(self, lo, hi):
         '''
-        if end is None:
-            start = 0
-            end = start
-        if start < 0:
-            start = self.size + start
-        if end < 0:
-            end = self.size + end + 1
-        elif end > self.size:
-            end = self.size
-        view = DeviceDataFrame()
-        view._data_dict = self._data_dict
-        if len(self._view_dict):
-            sample_view = self._view_dict.values()[0]
-            start += sample_view.first_i
-            end += sample_view.first_i
-            end = min(sample_view.last_i + 1, end)
-        view._view_dict = OrderedDict([(k, v.view(start, end - 1))
-                                        for k, v in
-                                        self._data_dict.iteritems()])
-        return view
+        Return the rows with keys within each inclusive `[lo, hi]` range,
+        grouped by range *(see `get` for supported key types)*.
+        '''
+        return self._rows(*self._search(lo, hi))
+
+
+def _create_frame_directory(frame_dir, columns, size, overwrite=False):
+    # Write frame metadata and zero-filled column files to `frame_dir`, and
+    # return an ordered dictionary of writable column memory maps.
+    frame_dir = path(frame_dir)
+    metadata_path = frame_dir.joinpath(FRAME_METADATA_NAME)
+    if metadata_path.isfile() and not overwrite:
+        raise IOError('Frame already exists: %s' % frame_dir)
+    frame_dir.makedirs_p()
+    metadata = OrderedDict([('version', FRAME_METADATA_VERSION),
+                            ('size', int(size)), ('columns', [])])
+    mmaps = OrderedDict()
+    for i, (column, dtype) in enumerate(columns):
+        dtype = np.dtype(dtype)
+        if dtype.type not in DEVICE_VECTOR_DTYPES:
+            raise ValueError('Unsupported data type: %s' % dtype)
+        file_name = 'column_%04d.bin' % i
+        metadata['columns'].append(OrderedDict([('name', column),
+                                                ('dtype', dtype.name),
+                                                ('file', file_name)]))
+        column_path = frame_dir.joinpath(file_name)
+        if size > 0:
+            mmaps[column] = np.memmap(column_path, dtype=dtype, mode='w+',
+                                      shape=(size, ))
+        else:
+            column_path.write_bytes('')
+            mmaps[column] = np.zeros(0, dtype=dtype)
+    # Write metadata last, so a partially written frame is not mistaken for
+    # a complete one.
+    metadata_path.write_bytes(json.dumps(metadata, indent=2))
+    return mmaps
 
-    def base(self):
-        result = DeviceDataFrame()
-        result._data_dict = self._data_dict
-        result._view_dict = OrderedDict([(k, v.view())
-                                         for k, v in result._data_dict
-                                         .iteritems()])
-        return result
+
+def chunk_view_group(chunk, context=None, borrow=True):
+    '''
+    Return a `DeviceViewGroup` for a chunk of rows passed to one of the
+    streaming functions *(e.g., `stream_reduce`)*.
+
+    Arguments
+    ---------
+
+     - `chunk` : One of:
+      * `DeviceViewGroup`: returned as is.
+      * `str`: directory of an on-disk frame *(see
+        `DeviceDataFrame.from_directory`)*, mapped copy-on-write, i.e., the
+        files are never modified.
+      * `pandas.DataFrame` or dictionary-like container of `numpy.ndarray`
+        instances *(e.g., `numpy.memmap`)*.
+     - `context` : `Context` *(optional)*
+     - `borrow` : bool *(optional)*
+      * If `True` *(default)* and `context` uses a host backend, arrays are
+        used directly, rather than copied *(see `Context.borrow_array`)*.
+    '''
+    if isinstance(chunk, DeviceViewGroup):
+        return chunk
+    if context is None:
+        context = Context()
+    if isinstance(chunk, basestring):
+        return DeviceDataFrame.from_directory(chunk, mode='c',
+                                              context=context)
+    elif isinstance(chunk, pd.DataFrame):
+        chunk = OrderedDict([(c, chunk[c].values) for c in chunk.columns])
+    elif not isinstance(chunk, dict):
+        raise ValueError('Unsupported chunk type: %s' % type(chunk))
+    if borrow and context.host_memory:
+        return DeviceDataFrame(OrderedDict([(k, np.ascontiguousarray(v))
+                                            for k, v in chunk.iteritems()]),
+                               context=context, borrow=True)
+    return DeviceDataFrame(chunk, context=context)
+
+
+def stream_reduce(chunks, reduce_ops=None, operations=None, transforms=None,
+                  init_values=None, context=None, **kwargs):
+    '''
+    Reduce an iterable of chunks of rows, one chunk at a time, and combine
+    the partial results *(see `REDUCE_COMBINERS`)*.
+
+    The reduce function is compiled once, for the layout of the first chunk
+    *(see `DeviceViewGroup.prepare_reduce`)*, and each chunk must have the
+    same column names and types.  Memory use is bounded by the chunk size.
+
+    The result is the same as reducing all rows at once using
+    `DeviceViewGroup.reduce`, up to floating point rounding, since partial
+    sums/products are combined in a different order.
+
+    Arguments
+    ---------
+
+     - `chunks` : iterable
+      * Chunks of rows *(see `chunk_view_group` for supported types)*.
+     - `context` : `Context` *(optional)*
+      * Context used for chunks that are not `DeviceViewGroup` instances.
+
+    Remaining arguments are passed to `DeviceViewGroup.prepare_reduce`.
+    '''
+    if context is None:
+        context = Context()
+    prepared = None
+    result = None
+    for chunk in chunks:
+        views = chunk_view_group(chunk, context=context)
+        if prepared is None:
+            prepared = views.prepare_reduce(reduce_ops, operations=operations,
+                                            transforms=transforms,
+                                            init_values=init_values, **kwargs)
+            result = prepared(views)
+        else:
+            result = prepared.combine(result, prepared(views))
+    if prepared is None:
+        raise ValueError('At least one chunk is required.')
+    return result
+
+
+def stream_describe(chunks, context=None):
+    '''
+    Equivalent to `DeviceViewGroup.describe` for all rows of an iterable of
+    chunks, reducing one chunk at a time *(see `stream_reduce`)*.
+    '''
+    if context is None:
+        context = Context()
+    prepared = None
+    columns = None
+    size = 0
+    for chunk in chunks:
+        views = chunk_view_group(chunk, context=context)
+        if prepared is None:
+            prepared = views.prepare_describe()
+            columns = views.columns
+            result = prepared(views)
+        else:
+            result = prepared.combine(result, prepared(views))
+        size += views.size
+    if prepared is None:
+        raise ValueError('At least one chunk is required.')
+    return describe_summary(columns, result, size)
 
 
 class GroupBy(object):
-    def __init__(self, views, key_columns, sort=True, stable=False):
+    '''
+    Group the rows of `views` by the values of the key columns, to reduce the
+    remaining value columns by key *(see `agg`, `count`, `describe`)*.
+
+    Arguments
+    ---------
+
+     - `views` : `DeviceViewGroup`
+     - `key_columns` : list
+     - `sort` : bool *(optional)*
+      * If `True` *(default)*, sort the rows of `views` by key in place,
+        unless they are already sorted by the key columns *(see
+        `DeviceViewGroup.sort_order`)*.  Sorting read-only `views` *(see
+        `DeviceViewGroup.read_only`)* raises a `ValueError`.
+     - `stable` : bool *(optional)*
+      * If `True`, use a stable sort.
+     - `engine` : str *(optional)*
+      * `'sort'` *(default)*: sort the rows by key and reduce consecutive
+        rows with `reduce_by_key`.  Reduced keys are sorted.
+      * `'argsort'`: like `'sort'`, but only a copy of the key columns is
+        sorted, along with a row index *(see `DeviceViewGroup.argsort`)*,
+        _without_ modifying `views`.  Only the value columns reduced by each
+        `agg` call are gathered through the index, and `count` gathers no
+        value columns.
+      * `'hash'`: reduce rows into a hash table, _without_ sorting
+        or modifying `views`, using per-thread partial tables on OMP/TBB
+        backends.  Reduced keys are in order of first appearance.
+      * `'dense'`: reduce rows into an array indexed by key, _without_
+        sorting or modifying `views`, using per-thread partial arrays on
+        OMP/TBB backends.  Reduced keys are sorted.  Only supported for a
+        single integer key column, with a range of values of at most
+        `DENSE_MAX_KEY_RANGE` *(`ValueError` is raised otherwise)*.
+
+    All engines return frames with the same layout from `agg` and `count`,
+    and support `prepare_agg` and `prepare_count`.  The operations of
+    `ACCUMULATED_AGG_OPS` *(e.g., `mean`, `std`)* are only supported by the
+    `sort` and `argsort` engines *(see `agg_accumulated`)*.
+    The `hash` and `dense` engines are only supported for host backends
+    *(see `Context.host_memory`)*, and are typically faster for many rows
+    with few distinct keys, since rows of wide frames are never moved.  For
+    small-range integer keys, `dense` reduces in a single linear pass after
+    computing the key range.
+    '''
+    def __init__(self, views, key_columns, sort=True, stable=False,
+                 engine='sort'):
+        if engine not in GROUPBY_ENGINES:
+            raise ValueError('Unsupported engine: %s.  Engine must be one of:'
+                             ' %s' % (engine, ', '.join(GROUPBY_ENGINES)))
+        if engine in ('hash', 'dense') and not views._context.host_memory:
+            raise ValueError('The %s engine is only supported for host '
+                             'backends.' % engine)
+        if engine == 'dense':
+            key_views = views[key_columns]
+            dtypes = key_views.get_dtype(key_views.columns)
+            if len(dtypes) != 1 or not np.issubdtype(dtypes[0], np.integer):
+                raise ValueError('The dense engine is only supported for a '
+                                 'single integer key column.')
+        self.engine = engine
         self.views = views
         self.key_views = views[key_columns]
         self.value_views = views[[c for c in self.views.columns
@@ -1061,14 +4109,66 @@ class GroupBy(object):
         value_modules = tuple(self.value_views.get_vector_module(value_columns))
         value_dtypes = tuple(self.value_views.get_dtype(value_columns))
 
-        self.sort_func = get_sort_func(views._context, key_modules, key_dtypes,
-                                       value_modules, value_dtypes, stable=stable)
+        if engine == 'argsort':
+            # Sort a copy of the key columns, along with a row index used to
+            # gather value columns on demand *(see `_gather_values`)*.
+            self.sort_func = None
+            selection = views.select()
+            self.key_views = selection.sort_keys(key_columns, stable=stable)
+            self.index = selection._index
+        elif engine != 'sort':
+            # Rows are reduced without sorting.
+            self.sort_func = None
+        else:
+            self.sort_func = get_sort_func(views._context, key_modules,
+                                           key_dtypes, value_modules,
+                                           value_dtypes, stable=stable)
 
-        if sort:
+        self.stable = stable
+        if sort and self.sort_func is not None:
             self.sort()
 
     def sort(self):
+        '''
+        Sort the rows of `views` by the key columns, unless they are already
+        sorted *(see `DeviceViewGroup.sort_order`)*.
+        '''
+        key_columns = self.key_views.columns
+        if self.views.is_sorted(key_columns):
+            return
+        self.views.check_writable('sort the rows by key (use the argsort, '
+                                  'hash, or dense engine instead)')
         self.sort_func(*(self.key_views.v.values() + self.value_views.v.values()))
+        self.views.invalidate_zone_map()
+        self.views.set_sort_order(key_columns, self.stable)
+
+    def _gather_values(self, columns):
+        '''
+        Return an ordered dictionary mapping each of the specified columns of
+        `views` to a view of its values, in the order of the key views.
+
+        For the `argsort` engine, each column is gathered through the sorted
+        row index once.  Otherwise, the views of `views` are returned as is.
+        '''
+        columns = [c for i, c in enumerate(columns) if c not in columns[:i]]
+        if self.engine == 'argsort':
+            return self.views.select(self.index).materialize(columns).v
+        return OrderedDict([(c, self.views.v[c]) for c in columns])
+
+    def _host_reduce_func(self, value_dtypes, reduce_ops, count=False):
+        '''
+        Return the compiled reduce-by-key function for the `hash` or `dense`
+        engine *(see `get_host_reduce_by_key_func`)*, taking the same
+        arguments as the corresponding `sort` engine function.
+        '''
+        key_columns = self.key_views.columns
+        func = get_host_reduce_by_key_func(
+            self.views._context, self.engine,
+            tuple(self.key_views.get_dtype(key_columns)), tuple(value_dtypes),
+            tuple(reduce_ops), count=count)
+        if self.engine == 'dense':
+            return functools.partial(func, DENSE_MAX_KEY_RANGE)
+        return func
 
     def get_count_func(self, out):
         key_columns = self.key_views.columns
@@ -1079,6 +4179,9 @@ class GroupBy(object):
         count_dtypes = (out.get_dtype('count'), )
         count_ctypes = (out.get_ctype('count'), )
 
+        if self.engine in ('hash', 'dense'):
+            return self._host_reduce_func(count_dtypes, ('plus', ),
+                                          count=True)
         return get_count_func(self.views._context, key_modules, key_dtypes,
                               count_modules, count_dtypes, key_ctypes,
                               count_ctypes)
@@ -1097,6 +4200,8 @@ class GroupBy(object):
         value_ctypes = tuple(self.value_views.get_ctype(value_columns))
         assert(len(reduce_ops) == len(value_columns))
 
+        if self.engine in ('hash', 'dense'):
+            return self._host_reduce_func(value_dtypes, reduce_ops)
         return get_reduce_func(self.views._context, key_modules, key_dtypes,
                                value_modules, value_dtypes, key_ctypes,
                                value_ctypes, tuple(reduce_ops))
@@ -1116,9 +4221,12 @@ class GroupBy(object):
                                   for col in ref_result.columns.values]
         return ref_result.reset_index()
 
-    def agg(self, reduce_op, out=None, bounds_check=True):
+    def _agg_layout(self, reduce_op):
         '''
-        Perform reduction using `cythrust.thrust.reduce_by_key`.
+        Return `(reduce_op, value_columns, reduce_ops)`, where `reduce_op` is
+        a tuple of `pandas` operation names, and `value_columns` and
+        `reduce_ops` list the value column and operation, respectively, for
+        each reduced output column.
         '''
         if isinstance(reduce_op, str):
             value_columns = self.value_views.v.keys()
@@ -1129,6 +4237,83 @@ class GroupBy(object):
                              for column in self.value_views.v.keys()
                              for op in reduce_op]
             reduce_ops = np.tile(reduce_op, len(self.value_views.v)).tolist()
+        return tuple(reduce_op), value_columns, reduce_ops
+
+    def prepare_agg(self, reduce_op):
+        '''
+        Return a `PreparedGroupBy` callable, bound to the compiled sort and
+        reduce-by-key functions for `agg(reduce_op)`.
+
+        Calling the returned object with a view group having the same column
+        names and types *(e.g., `prepared(df)`)* is equivalent to
+        `df.groupby(key_columns).agg(reduce_op)`, but does not re-derive
+        modules or types, or look up compiled functions.
+
+        For the `argsort` engine, the rows of the called view group are not
+        modified.  Instead, a copy of the key columns is sorted along with a
+        row index, and the reduced value columns are gathered through the
+        index *(see `PreparedGroupBy`)*.
+        '''
+        reduce_op, value_columns, reduce_ops = self._agg_layout(reduce_op)
+        if any(op not in PANDAS_TO_THRUST for op in reduce_op):
+            raise NotImplementedError('Only supported for operations in '
+                                      '`PANDAS_TO_THRUST`.')
+        func = self.get_reduce_func([PANDAS_TO_THRUST[op]
+                                     for op in reduce_ops],
+                                    value_columns=value_columns)
+        out_columns = (self.key_views.columns +
+                       ['%s_%s' % (column, op)
+                        for column in self.value_views.columns
+                        for op in reduce_op])
+        out_dtypes = (self.key_views.get_dtype(self.key_views.columns) +
+                      self.value_views.get_dtype(value_columns))
+        return PreparedGroupBy(self.views._context, self.sort_func,
+                               self.key_views.columns +
+                               self.value_views.columns, func,
+                               self.key_views.columns + value_columns,
+                               out_columns, out_dtypes,
+                               key_columns=self.key_views.columns,
+                               argsort=(self.engine == 'argsort'),
+                               stable=self.stable)
+
+    def prepare_count(self):
+        '''
+        Return a `PreparedGroupBy` callable, bound to the compiled sort and
+        count-by-key functions for `count()` *(see `prepare_agg`)*.
+        '''
+        key_columns = self.key_views.columns
+        context = self.views._context
+        if self.engine in ('hash', 'dense'):
+            func = self._host_reduce_func((np.uint32, ), ('plus', ),
+                                          count=True)
+        else:
+            func = get_count_func(context,
+                                  tuple(self.key_views
+                                        .get_vector_module(key_columns)),
+                                  tuple(self.key_views.get_dtype(key_columns)),
+                                  (context.get_device_vector_module(np.uint32),
+                                   ),
+                                  (np.uint32, ),
+                                  tuple(self.key_views.get_ctype(key_columns)),
+                                  ('uint32_t', ))
+        return PreparedGroupBy(context, self.sort_func,
+                               key_columns + self.value_views.columns, func,
+                               key_columns, key_columns + ['count'],
+                               self.key_views.get_dtype(key_columns) +
+                               [np.uint32], key_columns=key_columns,
+                               argsort=(self.engine == 'argsort'),
+                               stable=self.stable)
+
+    def agg(self, reduce_op, out=None, bounds_check=True):
+        '''
+        Perform reduction using `cythrust.thrust.reduce_by_key`.
+
+        If any of the operations is in `ACCUMULATED_AGG_OPS` *(e.g.,
+        `mean`)*, all operations are computed by `agg_accumulated`.
+        '''
+        reduce_op, value_columns, reduce_ops = self._agg_layout(reduce_op)
+        if any(op not in PANDAS_TO_THRUST for op in reduce_op):
+            return self.agg_accumulated(reduce_op, out=out)
 
         # __NB__ Key columns and value columns are all unique
         # (i.e., a key column will not have the same name as
@@ -1153,7 +4338,8 @@ class GroupBy(object):
         func = self.get_reduce_func([PANDAS_TO_THRUST[op]
                                      for op in reduce_ops],
                                     value_columns=value_columns)
-        in_views = self.key_views.v.values() + [self.value_views.v[c]
+        value_views = self._gather_values(value_columns)
+        in_views = self.key_views.v.values() + [value_views[c]
                                                 for c in value_columns]
         out_views = out.v.values()
 
@@ -1163,6 +4349,192 @@ class GroupBy(object):
             view.last_i = reduced_key_count - 1
         return out
 
+    def _accumulator_layout(self, value_columns, reduce_ops):
+        '''
+        Return `(accumulators, finalize, out_dtypes)` for reducing each value
+        column in `value_columns` with the corresponding `pandas` operation
+        in `reduce_ops` *(see `agg_accumulated`)*, where:
+
+         - `accumulators` lists a `((kind, column, reduce_op), (target,
+           name))` tuple per accumulator *(see `get_agg_reduce_by_key_func`)*,
+           where `target` is `'out'` if the reduced values are written
+           directly to the output column `name`, or `'scratch'` otherwise.
+         - `finalize` maps each remaining output column name to a function,
+           returning the `ColumnExpression` computing the output column from
+           a dictionary of expressions of the scratch columns.
+         - `out_dtypes` maps each output column name to its type.
+        '''
+        dtypes = dict(zip(self.value_views.columns,
+                          self.value_views.get_dtype(self.value_views
+                                                     .columns)))
+        accumulators = []
+        scratch_names = {}
+        finalize = OrderedDict()
+        out_dtypes = OrderedDict()
+
+        def scratch(kind, column):
+            # Name of a scratch column, shared by all operations using the
+            # same accumulator.
+            key = (kind, column, 'plus')
+            if key not in scratch_names:
+                scratch_names[key] = 'acc%d' % len(scratch_names)
+                accumulators.append((key, ('scratch', scratch_names[key])))
+            return scratch_names[key]
+
+        for column, op in zip(value_columns, reduce_ops):
+            name = '%s_%s' % (column, op)
+            if op in PANDAS_TO_THRUST or op in ('first', 'last'):
+                accumulators.append((('value', column,
+                                      PANDAS_TO_THRUST.get(op,
+                                                           'take_' + op)),
+                                     ('out', name)))
+                out_dtypes[name] = accumulator_dtype('value', dtypes[column])
+            elif op in ('argmin', 'argmax'):
+                accumulators.append((('position', column,
+                                      'arg_minimum' if op == 'argmin'
+                                      else 'arg_maximum'), ('out', name)))
+                out_dtypes[name] = accumulator_dtype('position',
+                                                     dtypes[column])
+            elif op == 'count':
+                n = scratch('count', None)
+                finalize[name] = lambda e, n=n: e[n]
+                out_dtypes[name] = accumulator_dtype('count', None)
+            elif op in ('mean', 'var', 'std'):
+                n = scratch('count', None)
+                sum_ = scratch('float', column)
+                if op == 'mean':
+                    finalize[name] = (lambda e, n=n, sum_=sum_:
+                                      e[sum_] / e[n].astype('float64'))
+                else:
+                    sqr_sum = scratch('square', column)
+
+                    def variance(e, n=n, sum_=sum_, sqr_sum=sqr_sum):
+                        n = e[n].astype('float64')
+                        return (e[sqr_sum] - e[sum_] * e[sum_] / n) / (n - 1)
+                    finalize[name] = (variance if op == 'var' else
+                                      lambda e, variance=variance:
+                                      variance(e)._apply(T.sqrt))
+                out_dtypes[name] = np.float64
+            else:
+                raise ValueError('Unsupported operation: %s.  Operation must '
+                                 'be one of: %s' %
+                                 (op, ', '.join(sorted(PANDAS_TO_THRUST) +
+                                                list(ACCUMULATED_AGG_OPS))))
+        return accumulators, finalize, out_dtypes
+
+    def agg_accumulated(self, reduce_op, out=None):
+        '''
+        Reduce the value columns by key, for operations of `PANDAS_TO_THRUST`
+        and `ACCUMULATED_AGG_OPS`, using a single `reduce_by_key` pass over
+        tuples of accumulators *(per `MAX_ZIP_ARITY` accumulators)*.
+
+        Accumulators are shared between operations, e.g., `mean` and `std`
+        of a column reduce a single sum, sum of squares and count.  Outputs
+        derived from accumulators *(i.e., `count`, `mean`, `var`, `std`)* are
+        then computed from the reduced accumulators in a single fused
+        transform.
+
+        For `argmin`/`argmax`, the position of the first row with the
+        minimum/maximum value is returned, i.e., the position within `views`
+        after sorting for the `sort` engine, and the position within the
+        _unmodified_ `views` for the `argsort` engine.  Like `pandas`,
+        variances use one degree of freedom.
+
+        The output frame has the same layout as `agg` *(i.e., one
+        `<column>_<op>` column per value column and operation)*.
+        '''
+        if self.engine not in ('sort', 'argsort'):
+            raise NotImplementedError('Only supported by the sort and argsort '
+                                      'engines.')
+        reduce_op, value_columns, reduce_ops = self._agg_layout(reduce_op)
+        accumulators, finalize, out_dtypes = self._accumulator_layout(
+            value_columns, reduce_ops)
+        context = self.views._context
+        key_columns = self.key_views.columns
+        key_dtypes = tuple(self.key_views.get_dtype(key_columns))
+        dtypes = dict(zip(self.value_views.columns,
+                          self.value_views.get_dtype(self.value_views
+                                                     .columns)))
+        size = self.key_views.size
+
+        if out is None:
+            out = DeviceDataFrame(OrderedDict(
+                [(c, np.zeros(size, dtype=d))
+                 for c, d in zip(key_columns, key_dtypes)] +
+                [(c, np.zeros(size, dtype=d))
+                 for c, d in out_dtypes.iteritems()]), context=context)
+        scratch = DeviceDataFrame(OrderedDict([
+            (name, np.zeros(size, dtype=accumulator_dtype(kind,
+                                                          dtypes.get(column))))
+            for (kind, column, op), (target, name) in accumulators
+            if target == 'scratch']), context=context) if finalize else None
+
+        row_index = (self.engine == 'argsort' and
+                     any(key[0] == 'position' for key, target in accumulators))
+        value_views = self._gather_values([key[1] for key, target
+                                           in accumulators
+                                           if key[1] is not None])
+        reduced_key_count = 0
+        for i in xrange(0, len(accumulators), MAX_ZIP_ARITY):
+            chunk = accumulators[i:i + MAX_ZIP_ARITY]
+            columns = []
+            for (kind, column, op), target in chunk:
+                if column is not None and column not in columns:
+                    columns.append(column)
+            func = get_agg_reduce_by_key_func(
+                context, key_dtypes, tuple(dtypes[c] for c in columns),
+                tuple((kind, columns.index(column) + 1
+                       if column is not None else 0, op)
+                      for (kind, column, op), target in chunk),
+                row_index=row_index)
+            targets = [(out if target == 'out' else scratch).v[name]
+                       for key, (target, name) in chunk]
+            reduced_key_count = func(*(self.key_views.v.values() +
+                                       [value_views[c] for c in columns] +
+                                       ([self.index.view()] if row_index
+                                        else []) +
+                                       [out.v[c] for c in key_columns] +
+                                       targets))
+
+        for group in (out, scratch):
+            if group is not None:
+                for view in group.v.itervalues():
+                    view.last_i = reduced_key_count - 1
+        if finalize and reduced_key_count > 0:
+            expressions = dict(zip(scratch.columns,
+                                   scratch.expr(scratch.columns)))
+            scratch.transform(OrderedDict([
+                (name, expression(expressions).operation_graph)
+                for name, expression in finalize.iteritems()]),
+                out=out[finalize.keys()])
+        return out
+
+    def describe(self):
+        '''
+        Summarize each value column by key, i.e., compute the statistics of
+        `GROUPBY_DESCRIBE_OPS` for each key, using a single pass over tuples
+        of accumulators *(see `agg_accumulated`)*.
+
+        Returns
+        -------
+
+        `pandas.DataFrame` laid out like `pandas` `groupby().describe()`,
+        i.e., indexed by the key columns along with the name of each
+        statistic, with one `float64` column per value column.
+        '''
+        reduced = self.agg_accumulated(GROUPBY_DESCRIBE_OPS).df
+        key_columns = self.key_views.columns
+        value_columns = self.value_views.columns
+        ops = list(GROUPBY_DESCRIBE_OPS)
+        index = pd.MultiIndex.from_arrays(
+            [np.repeat(reduced[c].values, len(ops)) for c in key_columns] +
+            [np.tile(ops, len(reduced))], names=key_columns + [None])
+        # Interleave the statistics of each key, in the order of `ops`.
+        return pd.DataFrame(OrderedDict([
+            (c, np.column_stack([reduced['%s_%s' % (c, op)].values
+                                 .astype(np.float64) for op in ops]).ravel())
+            for c in value_columns]), index=index, columns=value_columns)
+
     def ref_count(self):
         '''
         Perform count using `pandas.DataFrame.agg`.
@@ -1201,32 +4573,214 @@ class GroupBy(object):
             view.last_i = reduced_key_count - 1
         return out
 
+    def agg_expressions(self, expressions, out=None):
+        '''
+        Reduce the values of column expressions by key, using a single fused
+        transform and `reduce_by_key` kernel, i.e., without allocating
+        columns for the expression values.
 
-@functools32.lru_cache()
-def get_sort_func(context, key_modules, key_dtypes, value_modules=None,
-                  value_dtypes=None, stable=False):
+        Arguments
+        ---------
+
+         - `expressions` : `OrderedDict`
+          * Maps each output column name to a `(expression, reduce_op)`
+            tuple, where `expression` is a `ColumnExpression` over columns of
+            the grouped views, and `reduce_op` is a `pandas` operation name
+            *(see `PANDAS_TO_THRUST`)*.
+         - `out` : `DeviceViewGroup` *(optional)*
+          * Output views: key columns, followed by one column per
+            expression.  If not provided, a new `DeviceDataFrame` is
+            allocated.
+        '''
+        if self.engine not in ('sort', 'argsort'):
+            raise NotImplementedError('Expressions are only supported by the '
+                                      'sort and argsort engines.')
+        context = self.views._context
+        names = expressions.keys()
+        graphs = [expressions[k][0].operation_graph for k in names]
+        reduce_ops = tuple(PANDAS_TO_THRUST[expressions[k][1]]
+                           for k in names)
+        transforms = tuple(context.build_transform(g, transform_name('agg',
+                                                                     g))
+                           for g in graphs)
+        columns = [c for c in self.views.columns
+                   if any(c in t.thrust_code.graph_inputs
+                          for t in transforms)]
+        key_columns = self.key_views.columns
+        key_dtypes = tuple(self.key_views.get_dtype(key_columns))
+
+        if out is None:
+            out = DeviceDataFrame(OrderedDict(
+                [(c, np.zeros(self.views.size, dtype=d))
+                 for c, d in zip(key_columns, key_dtypes)] +
+                [(k, np.zeros(self.views.size, dtype=g.dtype))
+                 for k, g in zip(names, graphs)]), context=context)
+
+        func = get_transform_reduce_by_key_func(
+            context, key_dtypes, tuple(columns),
+            tuple(self.views.get_dtype(columns)), transforms, reduce_ops)
+        value_views = self._gather_values(columns)
+        reduced_key_count = func(*(self.key_views.v.values() +
+                                   [value_views[c] for c in columns] +
+                                   out.v.values()))
+
+        for view in out.v.itervalues():
+            view.last_i = reduced_key_count - 1
+        return out
+
+
+class StreamingGroupBy(object):
+    '''
+    Group-by aggregation over chunks of rows, processed one chunk at a time.
+
+    Each chunk is aggregated using `GroupBy.agg` *(or `GroupBy.count`)*, and
+    the resulting partial `(key, aggregate)` table is merged into the running
+    result by sorting both tables by key and reducing by key again *(counts
+    are merged by summing)*.  Memory use therefore scales with the chunk size
+    plus the number of distinct keys, not with the total number of rows.
+
+    Example
+    -------
+
+        >>> groupby = StreamingGroupBy(['day', 'user'], ('sum', 'max'))
+        >>> for frame_dir in frame_dirs:
+        ...     groupby.update(frame_dir)
+        >>> groupby.result.df
+    '''
+    def __init__(self, key_columns, reduce_op='count', context=None):
+        '''
+        Arguments
+        ---------
+
+         - `key_columns` : `list`
+         - `reduce_op` : `str` or `list`-like *(optional)*
+          * `'count'` *(default)*, or operation name(s) accepted by
+            `GroupBy.agg`.
+         - `context` : `Context` *(optional)*
+          * Context used for chunks that are not `DeviceViewGroup`
+            instances.
+        '''
+        if context is None:
+            context = Context()
+        self.context = context
+        self.key_columns = list(key_columns)
+        if isinstance(reduce_op, str):
+            self.reduce_op = reduce_op
+        else:
+            self.reduce_op = tuple(reduce_op)
+        if reduce_op != 'count' and any(op not in PANDAS_TO_THRUST
+                                        for op in ((reduce_op, )
+                                                   if isinstance(reduce_op,
+                                                                 str)
+                                                   else reduce_op)):
+            # e.g., means of chunks cannot be merged without their counts.
+            raise ValueError('Only operations in `PANDAS_TO_THRUST` are '
+                             'supported.')
+        self.result = None
+
+    def update(self, chunk):
+        '''
+        Aggregate a chunk of rows *(see `chunk_view_group` for supported
+        types)* and merge the result into `result`.
+
+        __NB__ Like `GroupBy`, `DeviceViewGroup` chunks are sorted in place.
+        Array chunks are copied, and on-disk frames are mapped copy-on-write,
+        so neither is modified.
+        '''
+        views = chunk_view_group(chunk, context=self.context, borrow=False)
+        if views.size == 0:
+            return self.result
+        groupby = GroupBy(views, self.key_columns)
+        if self.reduce_op == 'count':
+            partial = groupby.count()
+        else:
+            partial = groupby.agg(self.reduce_op)
+        # Copy aggregated rows to compact table, so memory allocated for
+        # the size of the chunk is released.
+        partial = self._table(partial.as_arrays(copy=True))
+
+        if self.result is None:
+            self.result = partial
+        else:
+            self.result = self._merge(partial)
+        return self.result
+
+    def _table(self, arrays):
+        # Return data frame for arrays of a partial table.  Arrays are owned
+        # by the table, so they are borrowed on host backends to avoid a copy.
+        return DeviceDataFrame(arrays, context=self.context,
+                               borrow=self.context.host_memory)
+
+    def merge_ops(self):
+        '''
+        Return the Thrust reduce operation used to merge each aggregate
+        column of partial tables.
+        '''
+        if self.reduce_op == 'count':
+            return ['plus']
+        reduce_op = ((self.reduce_op, ) if isinstance(self.reduce_op, str)
+                     else self.reduce_op)
+        value_count = len(self.result.columns) - len(self.key_columns)
+        return [PANDAS_TO_THRUST[op]
+                for op in reduce_op * (value_count / len(reduce_op))]
+
+    def _merge(self, partial):
+        # Concatenate running result with partial table, sort by key, and
+        # reduce by key using merge operation of each aggregate column.
+        arrays = OrderedDict([(c, np.concatenate([self.result.v[c]
+                                                  .asarray(copy=False),
+                                                  partial.v[c]
+                                                  .asarray(copy=False)]))
+                              for c in self.result.columns])
+        merged = self._table(arrays)
+        groupby = GroupBy(merged, self.key_columns)
+        value_columns = groupby.value_views.columns
+        func = groupby.get_reduce_func(self.merge_ops(),
+                                       value_columns=value_columns)
+        out = DeviceDataFrame(OrderedDict([(c, np.zeros(merged.size,
+                                                        dtype=a.dtype))
+                                           for c, a in arrays.iteritems()]),
+                              context=self.context)
+        in_views = (groupby.key_views.v.values() +
+                    groupby.value_views.v.values())
+        reduced_key_count = func(*(in_views + out.v.values()))
+        for view in out.v.itervalues():
+            view.last_i = reduced_key_count - 1
+        return self._table(out.as_arrays(copy=True))
+
+
+def stream_groupby(chunks, key_columns, reduce_op='count', context=None):
+    '''
+    Return the result of `StreamingGroupBy` after processing each chunk in
+    the iterable `chunks`, i.e., a `DeviceDataFrame` with the same layout as
+    `GroupBy.agg` *(or `GroupBy.count`)* for all rows of the chunks.
+    '''
+    groupby = StreamingGroupBy(key_columns, reduce_op=reduce_op,
+                               context=context)
+    for chunk in chunks:
+        groupby.update(chunk)
+    if groupby.result is None:
+        raise ValueError('At least one non-empty chunk is required.')
+    return groupby.result
+
+
+def render_sort_code(key_modules, key_dtypes, value_modules=None,
+                     value_dtypes=None, stable=False):
     if value_modules is None or value_dtypes is None:
         value_modules = []
         value_dtypes = []
 
     template = jinja2.Template(SORT_TEMPLATE)
-    code = template.render(key_modules=key_modules, key_dtypes=key_dtypes,
+    return template.render(key_modules=key_modules, key_dtypes=key_dtypes,
                            value_modules=value_modules,
                            value_dtypes=value_dtypes, stable=stable)
-    try:
-        module_path, module_name = context.inline_pyx_module(code)
-    except:
-        print code
-        raise
-    exec('from %s import sort_func as __sort_func__' % module_name)
-    return __sort_func__
 
 
-@functools32.lru_cache()
-def get_reduce_func(context, key_modules, key_dtypes, value_modules,
-                    value_dtypes, key_ctypes, value_ctypes,
-                    reduce_ops, key_out_modules=None, key_out_dtypes=None,
-                    value_out_modules=None, value_out_dtypes=None):
+def render_reduce_by_key_code(key_modules, key_dtypes, value_modules,
+                              value_dtypes, key_ctypes, value_ctypes,
+                              reduce_ops, key_out_modules=None,
+                              key_out_dtypes=None, value_out_modules=None,
+                              value_out_dtypes=None):
     # By default, use input key/value types for output keys/values.
     if key_out_modules is None:
         key_out_modules = key_modules
@@ -1238,7 +4792,7 @@ def get_reduce_func(context, key_modules, key_dtypes, value_modules,
         value_out_dtypes = value_dtypes
 
     template = jinja2.Template(REDUCE_BY_KEY_TEMPLATE)
-    code = template.render(key_modules=key_modules,
+    return template.render(key_modules=key_modules,
                            key_dtypes=key_dtypes,
                            value_modules=value_modules,
                            value_dtypes=value_dtypes,
@@ -1249,19 +4803,11 @@ def get_reduce_func(context, key_modules, key_dtypes, value_modules,
                            key_out_dtypes=key_out_dtypes,
                            value_out_modules=value_out_modules,
                            value_out_dtypes=value_out_dtypes)
-    try:
-        module_path, module_name = context.inline_pyx_module(code)
-    except:
-        print code
-        raise
-    exec('from %s import reduce_by_key_func as __reduce_func__' % module_name)
-    return __reduce_func__
 
 
-@functools32.lru_cache()
-def get_count_func(context, key_modules, key_dtypes, value_out_modules,
-                   value_out_dtypes, key_ctypes, value_out_ctypes,
-                   key_out_modules=None, key_out_dtypes=None):
+def render_count_code(key_modules, key_dtypes, value_out_modules,
+                      value_out_dtypes, key_ctypes, value_out_ctypes,
+                      key_out_modules=None, key_out_dtypes=None):
     # By default, use input key/value types for output keys/values.
     if key_out_modules is None:
         key_out_modules = key_modules
@@ -1269,7 +4815,7 @@ def get_count_func(context, key_modules, key_dtypes, value_out_modules,
         key_out_dtypes = key_dtypes
 
     template = jinja2.Template(COUNT_TEMPLATE)
-    code = template.render(key_modules=key_modules,
+    return template.render(key_modules=key_modules,
                            key_dtypes=key_dtypes,
                            key_ctypes=key_ctypes,
                            value_out_modules=value_out_modules,
@@ -1277,8 +4823,104 @@ def get_count_func(context, key_modules, key_dtypes, value_out_modules,
                            value_out_ctypes=value_out_ctypes,
                            key_out_modules=key_out_modules,
                            key_out_dtypes=key_out_dtypes)
+
+
+def packed_sort_supported(key_dtypes):
+    '''
+    Return `True` if rows may be sorted by the specified key types using
+    `get_packed_sort_func`, i.e., if there are several key columns, all of
+    integer type, with a combined width of at most `PACKED_SORT_MAX_BITS`.
+    '''
+    key_dtypes = [np.dtype(d) for d in key_dtypes]
+    return (len(key_dtypes) > 1 and
+            all(np.issubdtype(d, np.integer) for d in key_dtypes) and
+            sum(8 * d.itemsize for d in key_dtypes) <= PACKED_SORT_MAX_BITS)
+
+
+@functools32.lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_packed_sort_func(context, key_dtypes, value_dtypes):
+    '''
+    Dynamically compile a function to sort rows by several integer key
+    columns *(see `packed_sort_supported`)*, taking the same arguments as the
+    functions returned by `get_sort_func`: key views followed by value views.
+
+    Rather than sorting zipped key columns using a comparison sort, the keys
+    of each row are packed into a single `uint64_t` *(first key column in
+    the most significant bits)*, which Thrust sorts along with a row index
+    using radix sort.  Each key and value column is then gathered through the
+    sorted row index once.  The sort is stable.
+
+    __NB__ All arguments must be *hashable* types.  This is a requirement
+    for using `functools32.lru_cache`.
+    '''
+    if value_dtypes is None:
+        value_dtypes = tuple()
+    key_ctypes = [NP_TYPE_TO_CTYPE[np.dtype(d).name] for d in key_dtypes]
+    template_context = dict(key_ctypes=key_ctypes,
+                            value_count=len(value_dtypes))
+    setup = (jinja2.Template(PACKED_SORT_SETUP_TEMPLATE)
+             .render(**template_context))
+    code = (jinja2.Template(PACKED_SORT_TEMPLATE)
+            .render(**template_context))
+    key_names = ['keys%d' % (i + 1) for i in xrange(len(key_dtypes))]
+    value_names = ['values%d' % (i + 1) for i in xrange(len(value_dtypes))]
+    return build_inline_func(context, key_names + value_names,
+                             list(key_dtypes) + list(value_dtypes),
+                             setup=setup, code=code)
+
+
+@functools32.lru_cache()
+def get_sort_func(context, key_modules, key_dtypes, value_modules=None,
+                  value_dtypes=None, stable=False):
+    '''
+    Return a compiled function to sort key views, along with value views, by
+    the key views, taking key views followed by value views as arguments.
+
+    Several integer key columns are packed into a single key and radix
+    sorted, if supported *(see `get_packed_sort_func`)*.
+    '''
+    if packed_sort_supported(key_dtypes):
+        return get_packed_sort_func(context, tuple(key_dtypes),
+                                    tuple(value_dtypes or tuple()))
+    code = render_sort_code(key_modules, key_dtypes, value_modules,
+                            value_dtypes, stable=stable)
+    try:
+        module_path, module_name = context.inline_cached_pyx_module(code)
+    except:
+        print code
+        raise
+    exec('from %s import sort_func as __sort_func__' % module_name)
+    return __sort_func__
+
+
+@functools32.lru_cache()
+def get_reduce_func(context, key_modules, key_dtypes, value_modules,
+                    value_dtypes, key_ctypes, value_ctypes,
+                    reduce_ops, key_out_modules=None, key_out_dtypes=None,
+                    value_out_modules=None, value_out_dtypes=None):
+    code = render_reduce_by_key_code(key_modules, key_dtypes, value_modules,
+                                     value_dtypes, key_ctypes, value_ctypes,
+                                     reduce_ops, key_out_modules,
+                                     key_out_dtypes, value_out_modules,
+                                     value_out_dtypes)
+    try:
+        module_path, module_name = context.inline_cached_pyx_module(code)
+    except:
+        print code
+        raise
+    exec('from %s import reduce_by_key_func as __reduce_func__' % module_name)
+    return __reduce_func__
+
+
+@functools32.lru_cache()
+def get_count_func(context, key_modules, key_dtypes, value_out_modules,
+                   value_out_dtypes, key_ctypes, value_out_ctypes,
+                   key_out_modules=None, key_out_dtypes=None):
+    code = render_count_code(key_modules, key_dtypes, value_out_modules,
+                             value_out_dtypes, key_ctypes, value_out_ctypes,
+                             key_out_modules, key_out_dtypes)
     try:
-        module_path, module_name = context.inline_pyx_module(code)
+        module_path, module_name = context.inline_cached_pyx_module(code)
     except:
         print code
         raise
@@ -1286,10 +4928,227 @@ def get_count_func(context, key_modules, key_dtypes, value_out_modules,
     return __count_func__
 
 
+def submit_sort_func(context, *args, **kwargs):
+    '''
+    Equivalent to `get_sort_func`, but compile in the compile pool of
+    `context` and return a `concurrent.futures.Future` resolving to the sort
+    function.
+    '''
+    return _import_future(context.submit_pyx_module(
+        render_sort_code(*args, **kwargs)), 'sort_func')
+
+
+def submit_reduce_func(context, *args, **kwargs):
+    '''
+    Equivalent to `get_reduce_func`, but compile in the compile pool of
+    `context` and return a `concurrent.futures.Future` resolving to the
+    reduce-by-key function.
+    '''
+    return _import_future(context.submit_pyx_module(
+        render_reduce_by_key_code(*args, **kwargs)), 'reduce_by_key_func')
+
+
+def submit_count_func(context, *args, **kwargs):
+    '''
+    Equivalent to `get_count_func`, but compile in the compile pool of
+    `context` and return a `concurrent.futures.Future` resolving to the
+    count-by-key function.
+    '''
+    return _import_future(context.submit_pyx_module(
+        render_count_code(*args, **kwargs)), 'count_by_key_func')
+
+
+def prebuild(device_systems=None, dtypes=None, **kwargs):
+    '''
+    Warm up the device vector module cache by building every combination of
+    the specified Thrust device backends and data types.
+
+    This is intended to be called once *(e.g., while building a container
+    image)*, so that processes using the cache never compile device vector
+    modules on first use.
+
+    Arguments
+    ---------
+
+     - `device_systems` : `list`-like *(optional)*
+      * Thrust device backends to build for.  By default, all backends in
+        `DEVICE_SYSTEMS` are built.
+     - `dtypes` : `list`-like *(optional)*
+      * `numpy` data types to build.  By default, all types in
+        `DEVICE_VECTOR_DTYPES` are built.
+     - `kwargs` : `dict` *(optional)*
+      * Additional keyword arguments to pass along to `Context`.
+
+    Returns
+    -------
+
+    `OrderedDict` mapping each device backend to the list of built module
+    names.
+    '''
+    if device_systems is None:
+        device_systems = DEVICE_SYSTEMS
+    return OrderedDict([(device_system,
+                         Context(device_system=device_system, **kwargs)
+                         .prebuild_device_vectors(dtypes))
+                        for device_system in device_systems])
+
+
 def join(left_group, right_group):
     group = DeviceViewGroup()
     assert(left_group._context == right_group._context)
     group._context = left_group._context
     group._view_dict = OrderedDict(left_group.v.items() +
                                    right_group.v.items())
+    group.read_only = left_group.read_only or right_group.read_only
     return group
+
+
+def merge(left, right, on, how='inner', suffixes=('_x', '_y'),
+          fill_value=None):
+    '''
+    Return a `DeviceDataFrame` joining the rows of `left` and `right` with
+    equal values in the `on` key column(s), similar to `pandas.merge`.
+
+    The right key columns are sorted along with a row index, unless the
+    rows of `right` are already sorted *(see `DeviceViewGroup.sort_order`)*,
+    and `right` itself is not modified.  The range of matching right rows of
+    each left row is found using vectorized `lower_bound`/`upper_bound`, and
+    the output rows are counted before the output columns are allocated
+    *(see `get_join_count_func`)*.  The output columns are then gathered
+    through the matched row positions *(see `get_join_expand_func`)*.
+
+    Output rows are in the order of the `left` rows, and the rows matching
+    each `left` row are in the order of the `right` rows.
+
+    Arguments
+    ---------
+
+     - `left`, `right` : `DeviceViewGroup`
+      * Groups belonging to the same `Context`.
+     - `on` : `str` or `list`-like
+      * Key column(s), present in both groups with the same data types.
+     - `how` : `str` *(optional)*
+      * One of `JOIN_TYPES`:
+        - `inner` *(default)*: one row per pair of matching rows.
+        - `left`: rows of an `inner` join, along with one row per `left` row
+          without matching `right` rows, with `right` columns set to
+          `fill_value`.
+        - `semi`: `left` rows with at least one matching `right` row
+          *(`left` columns only)*.
+     - `suffixes` : `tuple` *(optional)*
+      * Suffixes appended to the names of non-key columns present in both
+        groups.
+     - `fill_value` : scalar *(optional)*
+      * Value of `right` columns in unmatched rows of a `left` join.  By
+        default, `NaN` for floating point columns, and `0` otherwise.
+
+    Returns
+    -------
+
+    `DeviceDataFrame` containing the key columns, followed by the non-key
+    columns of `left` and `right`.
+    '''
+    if how not in JOIN_TYPES:
+        raise ValueError('Unsupported join type: %s.  Join type must be one '
+                         'of: %s' % (how, ', '.join(JOIN_TYPES)))
+    if left._context != right._context:
+        raise ValueError('Groups must belong to the same context.')
+    if isinstance(on, str):
+        on = [on]
+    on = list(on)
+    if len(on) > MAX_ZIP_ARITY:
+        raise ValueError('At most %d key columns are supported.' %
+                         MAX_ZIP_ARITY)
+    # Kernels read the views of a group directly, so selected rows are
+    # gathered first.
+    if isinstance(left, SelectionViewGroup):
+        left = left.materialize()
+    if isinstance(right, SelectionViewGroup):
+        right = right.materialize()
+    key_dtypes = left.get_dtype(on)
+    if key_dtypes != right.get_dtype(on):
+        raise ValueError('Key columns must have the same data types in both '
+                         'groups.')
+
+    context = left._context
+    left_columns = [c for c in left.columns if c not in on]
+    if how == 'semi':
+        right_columns = []
+    else:
+        right_columns = [c for c in right.columns if c not in on]
+    shared = set(left_columns).intersection(right_columns)
+    left_names = [c + suffixes[0] if c in shared else c for c in left_columns]
+    right_names = [c + suffixes[1] if c in shared else c
+                   for c in right_columns]
+
+    if right.is_sorted(on):
+        right_keys = right[on]
+        right_order = None
+    else:
+        selection = right.select()
+        right_keys = selection.sort_keys(on, stable=True)
+        right_order = selection.index
+
+    left_size = left.size
+    bounds = DeviceDataFrame(OrderedDict([
+        ('lower', np.zeros(left_size, dtype=SELECTION_INDEX_DTYPE)),
+        ('upper', np.zeros(left_size, dtype=SELECTION_INDEX_DTYPE)),
+        ('offset', np.zeros(left_size, dtype=np.uint64))]), context=context)
+    count_func = get_join_count_func(context, tuple(key_dtypes), how)
+    row_count = count_func(*([left.v[c] for c in on] +
+                             [right_keys.v[c] for c in on] +
+                             bounds._view_dict.values()))
+
+    index_columns = [('left_index', SELECTION_INDEX_DTYPE)]
+    if how != 'semi':
+        index_columns.append(('right_index', SELECTION_INDEX_DTYPE))
+    if how == 'left':
+        index_columns.append(('unmatched', np.uint8))
+    index = DeviceDataFrame(OrderedDict([(c, np.zeros(row_count, dtype=d))
+                                         for c, d in index_columns]),
+                            context=context)
+    left_dtypes = left.get_dtype(on + left_columns)
+    right_dtypes = right.get_dtype(right_columns)
+    out = DeviceDataFrame(OrderedDict(
+        [(c, np.zeros(row_count, dtype=d))
+         for c, d in zip(on + left_names, left_dtypes)] +
+        [(c, np.zeros(row_count, dtype=d))
+         for c, d in zip(right_names, right_dtypes)]), context=context)
+    if row_count == 0:
+        return out
+
+    expand_func = get_join_expand_func(context, how)
+    expand_func(*(bounds._view_dict.values() + index._view_dict.values()))
+
+    gather_func = get_gather_func(context, tuple(left_dtypes))
+    gather_func(index.v['left_index'],
+                *([left.v[c] for c in on + left_columns] +
+                  [out.v[c] for c in on + left_names]))
+    if right_columns and right.size > 0:
+        right_index = index.v['right_index']
+        if right_order is not None:
+            # Map positions in the sorted right keys to rows of `right`.
+            sorted_index = right_index
+            right_index = context.from_array(
+                np.zeros(row_count, dtype=SELECTION_INDEX_DTYPE)).view()
+            get_gather_func(context, (SELECTION_INDEX_DTYPE, ))(
+                sorted_index, right_order, right_index)
+        gather_func = get_gather_func(context, tuple(right_dtypes))
+        gather_func(right_index, *([right.v[c] for c in right_columns] +
+                                   [out.v[c] for c in right_names]))
+    if how == 'left' and right_columns:
+        fill_values = []
+        for dtype in right_dtypes:
+            if fill_value is not None:
+                fill_values.append(fill_value)
+            elif np.issubdtype(dtype, np.floating):
+                fill_values.append(np.nan)
+            else:
+                fill_values.append(0)
+        replace_func = get_replace_where_func(context, tuple(right_dtypes))
+        replace_func(index.v['unmatched'],
+                     *([out.v[c] for c in right_names] + fill_values))
+    if left.is_sorted(on):
+        # Output rows are in the order of the `left` rows.
+        out.set_sort_order(on)
+    return out
@@ -0,0 +1,160 @@
+#ifndef ___CYTHRUST_DENSE_REDUCE__HPP___
+#define ___CYTHRUST_DENSE_REDUCE__HPP___
+
+#include <stdint.h>
+#include <algorithm>
+#include <stdexcept>
+#include <vector>
+#include <thrust/iterator/iterator_traits.h>
+#include "hash_reduce.hpp"
+
+namespace cythrust {
+
+/* Compute the minimum and maximum key of the rows of one block. */
+template <typename KeyIterator>
+struct partial_key_range {
+  typedef typename thrust::iterator_value<KeyIterator>::type Key;
+
+  KeyIterator keys;
+  size_t n;
+  int block_count;
+  std::vector<Key> *mins;
+  std::vector<Key> *maxs;
+
+  void operator()(int block) const {
+    size_t first = n * block / block_count;
+    size_t last = n * (block + 1) / block_count;
+    Key min_key = keys[first];
+    Key max_key = min_key;
+    for (size_t i = first + 1; i < last; i++) {
+      Key key = keys[i];
+      min_key = std::min(min_key, key);
+      max_key = std::max(max_key, key);
+    }
+    (*mins)[block] = min_key;
+    (*maxs)[block] = max_key;
+  }
+};
+
+/* Reduce the rows of one block into the corresponding partial array, indexed
+ * by `key - min_key`. */
+template <typename KeyIterator, typename ValueIterator,
+          typename BinaryFunction>
+struct partial_dense_reduce {
+  typedef typename thrust::iterator_value<KeyIterator>::type Key;
+  typedef typename thrust::iterator_value<ValueIterator>::type Value;
+
+  KeyIterator keys;
+  ValueIterator values;
+  size_t n;
+  int block_count;
+  Key min_key;
+  BinaryFunction op;
+  std::vector<std::vector<Value> > *partial_values;
+  std::vector<std::vector<uint8_t> > *partial_present;
+
+  void operator()(int block) const {
+    size_t first = n * block / block_count;
+    size_t last = n * (block + 1) / block_count;
+    std::vector<Value> &block_values = (*partial_values)[block];
+    std::vector<uint8_t> &present = (*partial_present)[block];
+    BinaryFunction block_op = op;
+    for (size_t i = first; i < last; i++) {
+      Key key = keys[i];
+      Value value = values[i];
+      size_t slot = static_cast<uint64_t>(key) -
+          static_cast<uint64_t>(min_key);
+      if (present[slot]) {
+        block_values[slot] = block_op(block_values[slot], value);
+      } else {
+        block_values[slot] = value;
+        present[slot] = 1;
+      }
+    }
+  }
+};
+
+/* Reduce `n` values by integer key, by indexing an array spanning the range
+ * of keys, i.e., _without_ sorting or hashing.
+ *
+ * The key range is computed with a min/max pass over the keys.  Rows are
+ * then split into blocks, which are reduced into per-thread partial arrays on
+ * the OMP and TBB backends, and merged.  The reduced keys are written in
+ * ascending order, and the number of reduced keys is returned.
+ *
+ * Throws `std::invalid_argument` if the key range exceeds `max_key_range`.
+ *
+ * __NB__ Only supported for host backends (CPP, OMP, TBB), since keys and
+ * values are read through the host. */
+template <typename KeyIterator, typename ValueIterator,
+          typename KeyOutIterator, typename ValueOutIterator,
+          typename BinaryFunction>
+size_t dense_reduce_by_key(KeyIterator keys, size_t n, ValueIterator values,
+                           KeyOutIterator keys_out,
+                           ValueOutIterator values_out, BinaryFunction op,
+                           size_t max_key_range) {
+  typedef typename thrust::iterator_value<KeyIterator>::type Key;
+  typedef typename thrust::iterator_value<ValueIterator>::type Value;
+
+  if (n == 0) { return 0; }
+
+  int block_count = reduce_block_count(n);
+  std::vector<Key> mins(block_count);
+  std::vector<Key> maxs(block_count);
+  partial_key_range<KeyIterator> range_block = {keys, n, block_count, &mins,
+                                                &maxs};
+  for_each_block(block_count, range_block);
+  Key min_key = *std::min_element(mins.begin(), mins.end());
+  Key max_key = *std::max_element(maxs.begin(), maxs.end());
+
+  uint64_t key_range = (static_cast<uint64_t>(max_key) -
+                        static_cast<uint64_t>(min_key));
+  if (key_range >= max_key_range) {
+    throw std::invalid_argument("Key range exceeds the maximum range of the "
+                                "dense engine.");
+  }
+  key_range += 1;
+
+  // Limit the number of blocks, so that partial arrays are not much larger
+  // than the rows reduced into them.
+  block_count = std::max<size_t>(1, std::min<size_t>(block_count,
+                                                     n / key_range));
+  std::vector<std::vector<Value> > partial_values(
+      block_count, std::vector<Value>(key_range));
+  std::vector<std::vector<uint8_t> > partial_present(
+      block_count, std::vector<uint8_t>(key_range, 0));
+  partial_dense_reduce<KeyIterator, ValueIterator, BinaryFunction>
+    reduce_block = {keys, values, n, block_count, min_key, op,
+                    &partial_values, &partial_present};
+  for_each_block(block_count, reduce_block);
+
+  std::vector<Value> &result = partial_values[0];
+  std::vector<uint8_t> &present = partial_present[0];
+  for (int block = 1; block < block_count; block++) {
+    for (size_t slot = 0; slot < key_range; slot++) {
+      if (!partial_present[block][slot]) {
+        continue;
+      } else if (present[slot]) {
+        result[slot] = op(result[slot], partial_values[block][slot]);
+      } else {
+        result[slot] = partial_values[block][slot];
+        present[slot] = 1;
+      }
+    }
+  }
+
+  size_t reduced_key_count = 0;
+  for (size_t slot = 0; slot < key_range; slot++) {
+    if (present[slot]) {
+      keys_out[reduced_key_count] = static_cast<Key>(
+          static_cast<uint64_t>(min_key) + slot);
+      values_out[reduced_key_count] = result[slot];
+      reduced_key_count++;
+    }
+  }
+  return reduced_key_count;
+}
+
+}
+
+#endif  // #ifndef ___CYTHRUST_DENSE_REDUCE__HPP___
@@ -1,6 +1,7 @@
 #ifndef ___CYTHRUST__FUNCTIONAL__HPP___
 #define ___CYTHRUST__FUNCTIONAL__HPP___
 
+#include <stdint.h>
 #include <thrust/tuple.h>
 #include <math.h>
 
@@ -295,6 +296,66 @@ namespace cythrust {
   };
 
 
+  template <typename T>
+  struct take_first {
+    /* Reduce to the first value, e.g., the first row of each key of
+     * `reduce_by_key`, which combines values in order. */
+    typedef T result_type;
+
+    template <typename T1, typename T2>
+    __host__ __device__
+    result_type operator() (T1 const &a, T2 const &) { return a; }
+  };
+
+
+  template <typename T>
+  struct take_last {
+    typedef T result_type;
+
+    template <typename T1, typename T2>
+    __host__ __device__
+    result_type operator() (T1 const &, T2 const &b) { return b; }
+  };
+
+
+  template <typename T>
+  struct arg_minimum {
+    /* Reduce `(value, position)` tuples to the minimum value, along with the
+     * lowest position among rows with the minimum value. */
+    typedef thrust::tuple<T, uint32_t> result_type;
+
+    template <typename T1, typename T2>
+    __host__ __device__
+    result_type operator() (T1 const &a, T2 const &b) {
+      if (thrust::get<0>(b) < thrust::get<0>(a) ||
+          (!(thrust::get<0>(a) < thrust::get<0>(b)) &&
+           thrust::get<1>(b) < thrust::get<1>(a))) {
+        return result_type(thrust::get<0>(b), thrust::get<1>(b));
+      }
+      return result_type(thrust::get<0>(a), thrust::get<1>(a));
+    }
+  };
+
+
+  template <typename T>
+  struct arg_maximum {
+    /* Reduce `(value, position)` tuples to the maximum value, along with the
+     * lowest position among rows with the maximum value. */
+    typedef thrust::tuple<T, uint32_t> result_type;
+
+    template <typename T1, typename T2>
+    __host__ __device__
+    result_type operator() (T1 const &a, T2 const &b) {
+      if (thrust::get<0>(a) < thrust::get<0>(b) ||
+          (!(thrust::get<0>(b) < thrust::get<0>(a)) &&
+           thrust::get<1>(b) < thrust::get<1>(a))) {
+        return result_type(thrust::get<0>(b), thrust::get<1>(b));
+      }
+      return result_type(thrust::get<0>(a), thrust::get<1>(a));
+    }
+  };
+
+
   template <typename T>
   struct absolute {
     typedef T result_type;
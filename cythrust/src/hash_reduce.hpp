@@ -0,0 +1,215 @@
+#ifndef ___CYTHRUST_HASH_REDUCE__HPP___
+#define ___CYTHRUST_HASH_REDUCE__HPP___
+
+#include <stdint.h>
+#include <string.h>
+#include <algorithm>
+#include <vector>
+#include <thrust/iterator/iterator_traits.h>
+#include <thrust/tuple.h>
+#if defined(_OPENMP)
+#include <omp.h>
+#elif THRUST_DEVICE_SYSTEM == THRUST_DEVICE_SYSTEM_TBB
+#include <tbb/parallel_for.h>
+#include <tbb/task_scheduler_init.h>
+#endif
+
+namespace cythrust {
+
+/* Finalizer of the 64-bit MurmurHash3 hash, which spreads the bits of a key
+ * across the slots of a power-of-two sized table. */
+inline uint64_t hash_mix(uint64_t h) {
+  h ^= h >> 33;
+  h *= 0xff51afd7ed558ccdULL;
+  h ^= h >> 33;
+  h *= 0xc4ceb9fe1a85ec53ULL;
+  h ^= h >> 33;
+  return h;
+}
+
+/* Hash of a primitive key, based on the bytes of its value. */
+template <typename T>
+struct key_hash {
+  uint64_t operator()(const T &value) const {
+    // Hash `-0.0` the same as `0.0`, since they compare equal.
+    T normalized = (value == T(0)) ? T(0) : value;
+    uint64_t bits = 0;
+    memcpy(&bits, &normalized, std::min(sizeof(T), sizeof(bits)));
+    return hash_mix(bits);
+  }
+};
+
+/* Hash of a `thrust::tuple` key, combining the hash of each element. */
+template <typename Tuple, int N = thrust::tuple_size<Tuple>::value>
+struct tuple_hash {
+  uint64_t operator()(const Tuple &value) const {
+    typedef typename thrust::tuple_element<N - 1, Tuple>::type Element;
+    uint64_t h = tuple_hash<Tuple, N - 1>()(value);
+    uint64_t element_h = key_hash<Element>()(thrust::get<N - 1>(value));
+    return hash_mix(h ^ (element_h + 0x9e3779b97f4a7c15ULL + (h << 6) +
+                         (h >> 2)));
+  }
+};
+
+template <typename Tuple>
+struct tuple_hash<Tuple, 0> {
+  uint64_t operator()(const Tuple &) const { return 0; }
+};
+
+/* Open-addressing (linear probing) hash table, reducing the values inserted
+ * for each key using `BinaryFunction`.
+ *
+ * Keys and reduced values are stored densely, in order of first insertion,
+ * and the table grows to keep the load factor at most 1/2. */
+template <typename Key, typename Value, typename Hash,
+          typename BinaryFunction>
+class hash_table {
+public:
+  std::vector<Key> keys;
+  std::vector<Value> values;
+
+  hash_table(Hash hash, BinaryFunction op) : hash_(hash), op_(op), mask_(0) {
+    rehash(64);
+  }
+
+  void insert(const Key &key, const Value &value) {
+    size_t slot = hash_(key) & mask_;
+    while (true) {
+      int64_t i = slots_[slot];
+      if (i < 0) {
+        slots_[slot] = keys.size();
+        keys.push_back(key);
+        values.push_back(value);
+        if (2 * keys.size() > slots_.size()) { rehash(2 * slots_.size()); }
+        return;
+      } else if (keys[i] == key) {
+        values[i] = op_(values[i], value);
+        return;
+      }
+      slot = (slot + 1) & mask_;
+    }
+  }
+
+  void clear() {
+    std::vector<Key>().swap(keys);
+    std::vector<Value>().swap(values);
+    std::vector<int64_t>().swap(slots_);
+  }
+
+private:
+  void rehash(size_t capacity) {
+    slots_.assign(capacity, -1);
+    mask_ = capacity - 1;
+    for (size_t i = 0; i < keys.size(); i++) {
+      size_t slot = hash_(keys[i]) & mask_;
+      while (slots_[slot] >= 0) { slot = (slot + 1) & mask_; }
+      slots_[slot] = i;
+    }
+  }
+
+  Hash hash_;
+  BinaryFunction op_;
+  size_t mask_;
+  std::vector<int64_t> slots_;
+};
+
+/* Number of blocks of rows to reduce into separate (i.e., per-thread)
+ * partial results.  Small inputs are reduced as a single block, to avoid the
+ * overhead of merging partial results. */
+inline int reduce_block_count(size_t n) {
+  const size_t min_block_size = 1 << 16;
+#if defined(_OPENMP)
+  size_t threads = omp_get_max_threads();
+#elif THRUST_DEVICE_SYSTEM == THRUST_DEVICE_SYSTEM_TBB
+  size_t threads = tbb::task_scheduler_init::default_num_threads();
+#else
+  size_t threads = 1;
+#endif
+  return std::max<size_t>(1, std::min(threads, n / min_block_size));
+}
+
+/* Call `body(block)` for each block in `[0, block_count)`, in parallel on
+ * the OMP and TBB backends. */
+template <typename Body>
+inline void for_each_block(int block_count, const Body &body) {
+#if defined(_OPENMP)
+#pragma omp parallel for schedule(static, 1)
+  for (int block = 0; block < block_count; block++) { body(block); }
+#elif THRUST_DEVICE_SYSTEM == THRUST_DEVICE_SYSTEM_TBB
+  tbb::parallel_for(0, block_count, body);
+#else
+  for (int block = 0; block < block_count; block++) { body(block); }
+#endif
+}
+
+/* Reduce the rows of one block into the corresponding partial table. */
+template <typename KeyIterator, typename ValueIterator, typename Table>
+struct partial_hash_reduce {
+  typedef typename thrust::iterator_value<KeyIterator>::type Key;
+  typedef typename thrust::iterator_value<ValueIterator>::type Value;
+
+  KeyIterator keys;
+  ValueIterator values;
+  size_t n;
+  int block_count;
+  std::vector<Table> *tables;
+
+  void operator()(int block) const {
+    size_t first = n * block / block_count;
+    size_t last = n * (block + 1) / block_count;
+    Table &table = (*tables)[block];
+    for (size_t i = first; i < last; i++) {
+      Key key = keys[i];
+      Value value = values[i];
+      table.insert(key, value);
+    }
+  }
+};
+
+/* Reduce `n` values by key using a hash table, i.e., _without_ sorting.
+ *
+ * Rows are split into blocks, which are reduced into per-thread partial
+ * tables on the OMP and TBB backends, and then merged in block order.  The
+ * reduced keys are written in order of first appearance, and the number of
+ * reduced keys is returned.
+ *
+ * __NB__ Only supported for host backends (CPP, OMP, TBB), since keys and
+ * values are read through the host. */
+template <typename KeyIterator, typename ValueIterator,
+          typename KeyOutIterator, typename ValueOutIterator, typename Hash,
+          typename BinaryFunction>
+size_t hash_reduce_by_key(KeyIterator keys, size_t n, ValueIterator values,
+                          KeyOutIterator keys_out,
+                          ValueOutIterator values_out, Hash hash,
+                          BinaryFunction op) {
+  typedef typename thrust::iterator_value<KeyIterator>::type Key;
+  typedef typename thrust::iterator_value<ValueIterator>::type Value;
+  typedef hash_table<Key, Value, Hash, BinaryFunction> Table;
+
+  int block_count = reduce_block_count(n);
+  std::vector<Table> tables(block_count, Table(hash, op));
+  partial_hash_reduce<KeyIterator, ValueIterator, Table> reduce_block = {
+    keys, values, n, block_count, &tables};
+  for_each_block(block_count, reduce_block);
+
+  // Merge partial tables in block order, which preserves the order of first
+  // appearance of each key.
+  Table &result = tables[0];
+  for (int block = 1; block < block_count; block++) {
+    Table &partial = tables[block];
+    for (size_t i = 0; i < partial.keys.size(); i++) {
+      result.insert(partial.keys[i], partial.values[i]);
+    }
+    partial.clear();
+  }
+
+  for (size_t i = 0; i < result.keys.size(); i++) {
+    keys_out[i] = result.keys[i];
+    values_out[i] = result.values[i];
+  }
+  return result.keys.size();
+}
+
+}
+
+#endif  // #ifndef ___CYTHRUST_HASH_REDUCE__HPP___
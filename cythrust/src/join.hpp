@@ -0,0 +1,181 @@
+#ifndef ___CYTHRUST_JOIN__HPP___
+#define ___CYTHRUST_JOIN__HPP___
+
+#include <stdint.h>
+#include <thrust/binary_search.h>
+#include <thrust/for_each.h>
+#include <thrust/functional.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <thrust/iterator/zip_iterator.h>
+#include <thrust/scan.h>
+#include <thrust/transform.h>
+#include <thrust/tuple.h>
+
+namespace cythrust {
+
+enum join_type { INNER_JOIN = 0, LEFT_JOIN = 1, SEMI_JOIN = 2 };
+
+/* Number of output rows of a left row, given the `(lower, upper)` bounds of
+ * the matching rows in the sorted right keys. */
+struct join_match_count {
+  typedef uint32_t result_type;
+
+  int how;
+
+  join_match_count(int how) : how(how) {}
+
+  template <typename Tuple>
+  __host__ __device__
+  uint32_t operator()(const Tuple &bounds) const {
+    uint32_t count = thrust::get<1>(bounds) - thrust::get<0>(bounds);
+    if (how == SEMI_JOIN) { return count > 0; }
+    if (how == LEFT_JOIN && count == 0) { return 1; }
+    return count;
+  }
+};
+
+/* Write the output rows of one left row, i.e., the left row position and the
+ * position of each matching row in the sorted right keys, starting at the
+ * offset of the left row. */
+template <typename BoundIterator, typename OffsetIterator,
+          typename LeftIndexIterator, typename RightIndexIterator,
+          typename UnmatchedIterator>
+struct expand_join_rows {
+  BoundIterator lower;
+  BoundIterator upper;
+  OffsetIterator offset;
+  LeftIndexIterator left_index;
+  RightIndexIterator right_index;
+  UnmatchedIterator unmatched;
+  int how;
+
+  __host__ __device__
+  void operator()(uint32_t i) const {
+    uint32_t first = lower[i];
+    uint32_t last = upper[i];
+    uint64_t k = offset[i];
+
+    if (first == last) {
+      if (how == LEFT_JOIN) {
+        // Point at the first right row, so gathering right columns stays in
+        // bounds.  The gathered values are replaced by the caller.
+        left_index[k] = i;
+        right_index[k] = 0;
+        unmatched[k] = 1;
+      }
+    } else if (how == SEMI_JOIN) {
+      left_index[k] = i;
+    } else {
+      for (uint32_t j = first; j < last; j++, k++) {
+        left_index[k] = i;
+        right_index[k] = j;
+      }
+    }
+  }
+};
+
+/* Clamp the upper bound of a `(lower, upper)` range to the lower bound, such
+ * that empty ranges (e.g., `lo > hi`, see `range_count`) have no rows. */
+struct clamp_upper_bound {
+  typedef uint32_t result_type;
+
+  template <typename Tuple>
+  __host__ __device__
+  uint32_t operator()(const Tuple &bounds) const {
+    uint32_t lower = thrust::get<0>(bounds);
+    uint32_t upper = thrust::get<1>(bounds);
+    return (upper < lower) ? lower : upper;
+  }
+};
+
+/* Write to `offset` the exclusive prefix sum of the number of output rows of
+ * each of the first `n` `(lower, upper)` ranges (see `join_match_count`),
+ * and return the total number of output rows. */
+template <typename BoundIterator, typename OffsetIterator>
+size_t scan_match_counts(BoundIterator lower, BoundIterator upper,
+                         OffsetIterator offset, size_t n, int how) {
+  if (n == 0) { return 0; }
+
+  join_match_count match_count(how);
+  thrust::transform_exclusive_scan(
+      thrust::make_zip_iterator(thrust::make_tuple(lower, upper)),
+      thrust::make_zip_iterator(thrust::make_tuple(lower + n, upper + n)),
+      offset, match_count, uint64_t(0), thrust::plus<uint64_t>());
+
+  uint32_t last_lower = lower[n - 1];
+  uint32_t last_upper = upper[n - 1];
+  uint64_t last_offset = offset[n - 1];
+  return last_offset + match_count(thrust::make_tuple(last_lower,
+                                                      last_upper));
+}
+
+/* Find the range of rows in the first `m` (sorted) right keys equal to each
+ * of the first `n` left keys, using vectorized `lower_bound`/`upper_bound`,
+ * and write the offset of the output rows of each left row to `offset`
+ * (i.e., the exclusive prefix sum of the number of output rows per left
+ * row, see `join_match_count`).
+ *
+ * Returns the total number of output rows, such that output columns may be
+ * allocated before expanding the matches using `join_expand`. */
+template <typename LeftKeyIterator, typename RightKeyIterator,
+          typename BoundIterator, typename OffsetIterator>
+size_t join_count(LeftKeyIterator left_keys, size_t n,
+                  RightKeyIterator right_keys, size_t m, int how,
+                  BoundIterator lower, BoundIterator upper,
+                  OffsetIterator offset) {
+  if (n == 0) { return 0; }
+
+  thrust::lower_bound(right_keys, right_keys + m, left_keys, left_keys + n,
+                      lower);
+  thrust::upper_bound(right_keys, right_keys + m, left_keys, left_keys + n,
+                      upper);
+  return scan_match_counts(lower, upper, offset, n, how);
+}
+
+/* Find the range of rows in the first `m` (sorted) keys within each of `n`
+ * inclusive `[lo, hi]` key ranges, using vectorized `lower_bound` (of `lo`)
+ * and `upper_bound` (of `hi`), and write the offset of the rows of each range
+ * to `offset`.
+ *
+ * Returns the total number of rows within the ranges.  The row positions
+ * may be expanded using `join_expand` with `INNER_JOIN`. */
+template <typename SortedKeyIterator, typename QueryIterator,
+          typename BoundIterator, typename OffsetIterator>
+size_t range_count(SortedKeyIterator sorted_keys, size_t m, QueryIterator lo,
+                   QueryIterator hi, size_t n, BoundIterator lower,
+                   BoundIterator upper, OffsetIterator offset) {
+  if (n == 0) { return 0; }
+
+  thrust::lower_bound(sorted_keys, sorted_keys + m, lo, lo + n, lower);
+  thrust::upper_bound(sorted_keys, sorted_keys + m, hi, hi + n, upper);
+  thrust::transform(
+      thrust::make_zip_iterator(thrust::make_tuple(lower, upper)),
+      thrust::make_zip_iterator(thrust::make_tuple(lower + n, upper + n)),
+      upper, clamp_upper_bound());
+  return scan_match_counts(lower, upper, offset, n, INNER_JOIN);
+}
+
+/* Write the left row position, and the position in the sorted right keys,
+ * of each output row of a join, based on the bounds and offsets computed by
+ * `join_count`.  Unmatched rows of a left join are flagged in `unmatched`.
+ *
+ * Output iterators which are not needed for a join type (i.e., right
+ * positions of a semi join, and unmatched flags of an inner or semi join)
+ * may be `thrust::discard_iterator` instances. */
+template <typename BoundIterator, typename OffsetIterator,
+          typename LeftIndexIterator, typename RightIndexIterator,
+          typename UnmatchedIterator>
+void join_expand(BoundIterator lower, BoundIterator upper,
+                 OffsetIterator offset, size_t n, int how,
+                 LeftIndexIterator left_index, RightIndexIterator right_index,
+                 UnmatchedIterator unmatched) {
+  expand_join_rows<BoundIterator, OffsetIterator, LeftIndexIterator,
+                   RightIndexIterator, UnmatchedIterator>
+    expand = {lower, upper, offset, left_index, right_index, unmatched, how};
+  thrust::for_each(thrust::counting_iterator<uint32_t>(0),
+                   thrust::counting_iterator<uint32_t>(n), expand);
+}
+
+}
+
+#endif  // #ifndef ___CYTHRUST_JOIN__HPP___
@@ -0,0 +1,33 @@
+#ifndef ___CYTHRUST_MEMORY__HPP___
+#define ___CYTHRUST_MEMORY__HPP___
+
+#include <stdint.h>
+#include <thrust/device_ptr.h>
+#include <thrust/device_vector.h>
+#include <thrust/memory.h>
+
+namespace cythrust {
+
+/* Return the address of the element referenced by `it` as an integer.
+ *
+ * __NB__ For device vectors on the CUDA backend, the address refers to device
+ * memory and must _not_ be dereferenced on the host. */
+template<typename Iterator>
+inline uintptr_t raw_address(Iterator it) {
+  return reinterpret_cast<uintptr_t>(thrust::raw_pointer_cast(&(*it)));
+}
+
+/* Return a device vector iterator referring to existing memory at `data`,
+ * e.g., the buffer of a `numpy` array.  No memory is allocated or copied.
+ *
+ * __NB__ Only meaningful when `data` resides in memory accessible by the
+ * Thrust device backend, i.e., for host backends (CPP, OMP, TBB). */
+template<typename T>
+inline typename thrust::device_vector<T>::iterator device_iterator(T *data) {
+  return typename thrust::device_vector<T>::iterator(
+      thrust::device_pointer_cast(data));
+}
+
+}
+
+#endif  // #ifndef ___CYTHRUST_MEMORY__HPP___
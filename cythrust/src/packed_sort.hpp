@@ -0,0 +1,87 @@
+#ifndef ___CYTHRUST_PACKED_SORT__HPP___
+#define ___CYTHRUST_PACKED_SORT__HPP___
+
+#include <stdint.h>
+#include <limits>
+#include <thrust/copy.h>
+#include <thrust/device_vector.h>
+#include <thrust/gather.h>
+#include <thrust/iterator/iterator_traits.h>
+#include <thrust/sequence.h>
+#include <thrust/sort.h>
+#include <thrust/transform.h>
+#include <thrust/tuple.h>
+
+namespace cythrust {
+
+/* Return the bits of an integer `value`, such that unsigned comparison of the
+ * bits matches comparison of the values, i.e., with the sign bit of signed
+ * types flipped. */
+template <typename T>
+__host__ __device__
+inline uint64_t ordered_bits(T value) {
+  const int bits = 8 * sizeof(T);
+  uint64_t result = static_cast<uint64_t>(value);
+  if (bits < 64) { result &= (uint64_t(1) << (bits % 64)) - 1; }
+  if (std::numeric_limits<T>::is_signed) {
+    result ^= uint64_t(1) << (bits - 1);
+  }
+  return result;
+}
+
+/* Pack the integer elements of a `thrust::tuple` key into a single `uint64_t`,
+ * with the first element in the most significant bits, so that the packed
+ * keys sort in the same (lexicographic) order as the tuples.
+ *
+ * __NB__ The combined width of the elements must be at most 64 bits. */
+template <typename Tuple, int N = thrust::tuple_size<Tuple>::value>
+struct pack_tuple {
+  typedef uint64_t result_type;
+
+  __host__ __device__
+  uint64_t operator()(const Tuple &value) const {
+    typedef typename thrust::tuple_element<N - 1, Tuple>::type Element;
+    const int bits = 8 * sizeof(Element);
+    uint64_t element_bits = ordered_bits(thrust::get<N - 1>(value));
+    if (bits >= 64) { return element_bits; }
+    return (pack_tuple<Tuple, N - 1>()(value) << bits) | element_bits;
+  }
+};
+
+template <typename Tuple>
+struct pack_tuple<Tuple, 0> {
+  typedef uint64_t result_type;
+
+  __host__ __device__
+  uint64_t operator()(const Tuple &) const { return 0; }
+};
+
+/* Write to `index` the permutation which sorts the first `n` keys, by
+ * packing each key into a `uint64_t` using `packer` and sorting the packed
+ * keys along with a sequence.  This lets Thrust use radix sort, rather than
+ * a comparison sort of zipped key columns.  The sort is stable.
+ *
+ * The key columns themselves are not modified. */
+template <typename KeyIterator, typename Packer, typename IndexIterator>
+void packed_sort_index(KeyIterator keys, size_t n, Packer packer,
+                       IndexIterator index) {
+  thrust::device_vector<uint64_t> packed(n);
+  thrust::transform(keys, keys + n, packed.begin(), packer);
+  thrust::sequence(index, index + n);
+  thrust::stable_sort_by_key(packed.begin(), packed.end(), index);
+}
+
+/* Reorder the first `n` values in place, such that `values[i]` becomes
+ * `values[index[i]]`, using a temporary copy of the values. */
+template <typename Iterator, typename IndexIterator>
+void gather_in_place(Iterator values, size_t n, IndexIterator index) {
+  typedef typename thrust::iterator_value<Iterator>::type T;
+
+  thrust::device_vector<T> gathered(n);
+  thrust::gather(index, index + n, values, gathered.begin());
+  thrust::copy(gathered.begin(), gathered.end(), values);
+}
+
+}
+
+#endif  // #ifndef ___CYTHRUST_PACKED_SORT__HPP___
@@ -0,0 +1,79 @@
+#ifndef ___CYTHRUST_ZONE_MAP__HPP___
+#define ___CYTHRUST_ZONE_MAP__HPP___
+
+#include <limits>
+#include <thrust/functional.h>
+#include <thrust/iterator/counting_iterator.h>
+#include <thrust/iterator/discard_iterator.h>
+#include <thrust/iterator/iterator_traits.h>
+#include <thrust/iterator/transform_iterator.h>
+#include <thrust/iterator/zip_iterator.h>
+#include <thrust/reduce.h>
+#include <thrust/tuple.h>
+#include "functional.hpp"
+
+namespace cythrust {
+
+/* Block number of a row. */
+struct block_of {
+  typedef size_t result_type;
+
+  size_t block_size;
+
+  block_of(size_t block_size) : block_size(block_size) {}
+
+  __host__ __device__
+  size_t operator()(size_t i) const { return i / block_size; }
+};
+
+/* `(min, max)` bounds of a single value, to be reduced using `minmax_tuple`.
+ *
+ * NaN values are mapped to the widest bounds, since NaN compares false with
+ * every value, i.e., a block containing NaN is never pruned, nor assumed to
+ * lie within a range. */
+template <typename T>
+struct zone_bounds {
+  typedef thrust::tuple<T, T> result_type;
+
+  T lowest;
+  T highest;
+
+  zone_bounds(T lowest, T highest) : lowest(lowest), highest(highest) {}
+
+  __host__ __device__
+  result_type operator()(const T &value) const {
+    if (value != value) { return thrust::make_tuple(lowest, highest); }
+    return thrust::make_tuple(value, value);
+  }
+};
+
+/* Write the minimum and maximum of each block of `block_size` values (the
+ * last block may be shorter) of the first `n` values to `mins` and `maxs`,
+ * in a single `reduce_by_key` pass using the `minmax_tuple` functor. */
+template <typename Iterator, typename MinIterator, typename MaxIterator>
+void block_minmax(Iterator values, size_t n, size_t block_size,
+                  MinIterator mins, MaxIterator maxs) {
+  typedef typename thrust::iterator_value<Iterator>::type T;
+
+  if (n == 0) { return; }
+
+  T lowest = (std::numeric_limits<T>::is_integer ?
+              std::numeric_limits<T>::min() :
+              -std::numeric_limits<T>::infinity());
+  T highest = (std::numeric_limits<T>::is_integer ?
+               std::numeric_limits<T>::max() :
+               std::numeric_limits<T>::infinity());
+  thrust::counting_iterator<size_t> rows(0);
+  thrust::reduce_by_key(
+      thrust::make_transform_iterator(rows, block_of(block_size)),
+      thrust::make_transform_iterator(rows + n, block_of(block_size)),
+      thrust::make_transform_iterator(values, zone_bounds<T>(lowest,
+                                                             highest)),
+      thrust::make_discard_iterator(),
+      thrust::make_zip_iterator(thrust::make_tuple(mins, maxs)),
+      thrust::equal_to<size_t>(), minmax_tuple<T>());
+}
+
+}
+
+#endif  // #ifndef ___CYTHRUST_ZONE_MAP__HPP___
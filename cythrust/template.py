@@ -1,3 +1,7 @@
+# Sort the rows within the bounds of each view *(i.e., `_begin` to `_end`)*,
+# rather than the whole underlying vector, so borrowed memory *(see
+# `DeviceVectorView.from_array`)* and narrowed views *(e.g., after an in-place
+# `filter`)* are supported.
 SORT_TEMPLATE = '''
 from cythrust.thrust.sort cimport {% if stable %}stable_{% endif %}sort_by_key as c_sort_by_key, {% if stable %}stable_{% endif %}sort as c_sort
 from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
@@ -29,7 +33,7 @@ def sort_func(
         make_zip_iterator(make_tuple{{ key_modules|length }}(
         {%- endif %}
         {% for c in key_modules -%}
-        keys{{ loop.index }}._vector.begin()
+        keys{{ loop.index }}._begin
         {%- if not loop.last %}, {% endif -%}
         {% endfor -%}
         {% if key_modules|length > 1 -%}
@@ -39,7 +43,7 @@ def sort_func(
         make_zip_iterator(make_tuple{{ key_modules|length }}(
         {%- endif %}
         {% for k in key_modules -%}
-        keys{{ loop.index }}._vector.end()
+        keys{{ loop.index }}._end
         {%- if not loop.last %}, {% endif -%}
         {% endfor -%}
         {% if key_modules|length > 1 -%}
@@ -50,7 +54,7 @@ def sort_func(
         make_zip_iterator(make_tuple{{ value_modules|length }}(
         {%- endif -%}
         {%- for v in value_modules %}
-        values{{ loop.index }}._vector.begin()
+        values{{ loop.index }}._begin
         {%- if not loop.last %}, {% endif -%}
         {% endfor -%}
         {% if value_modules|length > 1 -%}
@@ -68,7 +72,7 @@ def sort_func(
         make_zip_iterator(make_tuple{{ key_modules|length }}(
         {%- endif %}
         {% for k in key_dtypes -%}
-        keys{{ loop.index }}._vector.begin()
+        keys{{ loop.index }}._begin
         {%- if not loop.last %}, {% endif -%}
         {% endfor -%}
         {% if key_modules|length > 1 -%}
@@ -78,7 +82,7 @@ def sort_func(
         make_zip_iterator(make_tuple{{ key_modules|length }}(
         {%- endif %}
         {% for k in key_dtypes -%}
-        keys{{ loop.index }}._vector.end()
+        keys{{ loop.index }}._end
         {%- if not loop.last %}, {% endif -%}
         {% endfor -%}
         {% if key_modules|length > 1 -%}
@@ -692,3 +696,631 @@ REDUCE_TEMPLATE = '''
     return result
     {% endif %}
 '''
+
+# Fused transform and reduce-by-key: reduce the output of each transform by
+# key, _without_ materializing transform outputs *(see
+# `GroupBy.agg_expressions`)*.
+TRANSFORM_REDUCE_BY_KEY_SETUP_TEMPLATE = '''
+from cython.operator cimport dereference as deref
+from cythrust.thrust.reduce cimport reduce_by_key as c_reduce_by_key
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator, zip_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9, tuple2, tuple3,
+                                    tuple4, tuple5, tuple6, tuple7, tuple8,
+                                    tuple9)
+
+ctypedef float float32_t
+ctypedef double float64_t
+
+{% for t in transforms %}
+from {{ t.functor_name }}.{{ t.functor_name }} cimport {{ t.functor_name }}
+{% endfor %}
+{% for m in key_modules -%}
+from {{ m }}.device_vector cimport Iterator as Key{{ loop.index }}Iterator
+{% endfor %}
+{% for m in value_out_modules -%}
+from {{ m }}.device_vector cimport Iterator as ValueOut{{ loop.index }}Iterator
+{% endfor %}
+
+# Functors
+from cythrust.thrust.functional cimport equal_to, {% for op in reduce_ops -%}
+{{ op }}
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}
+{%- if transforms|length > 1 %}, reduce{{ transforms|length }}{% endif %}
+
+ctypedef {% if key_modules|length > 1 %}zip_iterator[tuple{{ key_modules|length }}[{% endif %}
+{%- for m in key_modules -%}
+Key{{ loop.index }}Iterator
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}
+{% if key_modules|length > 1 %}]]{% endif %} keys_iterator
+ctypedef {% if transforms|length > 1 %}zip_iterator[tuple{{ transforms|length }}[{% endif %}
+{%- for t in transforms -%}
+{{ t.functor_name }}.iterator
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}
+{% if transforms|length > 1 %}]]{% endif %} values_iterator
+ctypedef {% if value_out_modules|length > 1 %}zip_iterator[tuple{{ value_out_modules|length }}[{% endif %}
+{%- for m in value_out_modules -%}
+ValueOut{{ loop.index }}Iterator
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}
+{% if value_out_modules|length > 1 %}]]{% endif %} values_out_iterator
+'''
+
+TRANSFORM_REDUCE_BY_KEY_TEMPLATE = '''
+{% for t in transforms %}
+    cdef {{ t.functor_name }} *op_{{ loop.index }} = new {{ t.functor_name }}(
+    {%- for column in t.thrust_code.graph_inputs -%}
+    <{{ t.functor_name }}.{{ column }}_t>{{ column }}._begin
+    {%- if not loop.last %}, {% endif -%}
+    {% endfor %})
+{% endfor %}
+
+    cdef
+{%- if transforms|length > 1 %} reduce{{ transforms|length }}[{% endif %}
+{%- for t in transforms %} {{ reduce_ops[loop.index0] }}[{{ value_ctypes[loop.index0] }}]
+    {%- if not loop.last %}, {% endif -%}
+{% endfor %}
+{%- if transforms|length > 1 %}]{% endif %} *reduce_op = new
+{%- if transforms|length > 1 %} reduce{{ transforms|length }}[{% endif %}
+{%- for t in transforms %} {{ reduce_ops[loop.index0] }}[{{ value_ctypes[loop.index0] }}]
+    {%- if not loop.last %}, {% endif -%}
+{% endfor %}
+{%- if transforms|length > 1 %}]{% endif %}()
+
+    {% if key_modules|length > 1 %}
+    cdef equal_to[tuple{{ key_modules|length }}[
+{%- for c_type in key_ctypes -%}
+{{ c_type }}
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}]] *compare_op = new equal_to[tuple{{ key_modules|length }}[
+{%- for c_type in key_ctypes -%}
+{{ c_type }}
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}]]()
+    {% else %}
+    cdef equal_to[{{ key_ctypes[0] }}] *compare_op = new equal_to[{{ key_ctypes[0] }}]()
+    {% endif %}
+
+    cdef size_t N = keys1._end - keys1._begin
+
+    {% for k in ('keys', 'keys_out') %}
+    cdef keys_iterator {{ k }}_begin =
+    {%- if key_modules|length > 1 %} make_zip_iterator(make_tuple{{ key_modules|length }}({% endif %}
+    {%- for m in key_modules %} <Key{{ loop.index }}Iterator>{{ k }}{{ loop.index }}._begin
+        {%- if not loop.last %},{% endif %}
+    {%- endfor %}
+    {%- if key_modules|length > 1 %})){% endif %}
+    {% endfor %}
+    cdef values_iterator values_begin =
+    {%- if transforms|length > 1 %} make_zip_iterator(make_tuple{{ transforms|length }}({% endif %}
+    {%- for t in transforms %} op_{{ loop.index }}.begin()
+        {%- if not loop.last %},{% endif %}
+    {%- endfor %}
+    {%- if transforms|length > 1 %})){% endif %}
+    cdef values_out_iterator values_out_begin =
+    {%- if value_out_modules|length > 1 %} make_zip_iterator(make_tuple{{ value_out_modules|length }}({% endif %}
+    {%- for m in value_out_modules %} <ValueOut{{ loop.index }}Iterator>values_out{{ loop.index }}._begin
+        {%- if not loop.last %},{% endif %}
+    {%- endfor %}
+    {%- if value_out_modules|length > 1 %})){% endif %}
+
+    cdef size_t count = <size_t>(
+        <keys_iterator>(c_reduce_by_key(keys_begin, keys_begin + N,
+                                        values_begin, keys_out_begin,
+                                        values_out_begin, deref(compare_op),
+                                        deref(reduce_op)).first) -
+                                        keys_out_begin)
+
+{% for t in transforms %}
+    del op_{{ loop.index }}
+{% endfor %}
+    del reduce_op
+    del compare_op
+    return count
+'''
+
+# Single functor computing all outputs of several operation graphs *(see
+# `FusedTransform`)*.
+FUSED_TRANSFORM_HEADER_TEMPLATE = '''
+#ifndef ___CYTHRUST__{{ functor_name|upper }}__HPP___
+#define ___CYTHRUST__{{ functor_name|upper }}__HPP___
+
+#include <stdint.h>
+#include <math.h>
+#include <thrust/tuple.h>
+
+
+namespace cythrust {
+  struct {{ functor_name }} {
+    typedef thrust::tuple<{{ output_ctypes|join(', ') }}> result_type;
+
+    template <typename Values>
+    __host__ __device__
+    result_type operator() (Values const &values) const {
+{%- for name, ctype in inputs %}
+      const {{ ctype }} {{ name }} = {% if inputs|length > 1 %}thrust::get<{{ loop.index0 }}>(values){% else %}values{% endif %};
+{%- endfor %}
+{%- for name, ctype, expression in temporaries %}
+      const {{ ctype }} {{ name }} = ({{ ctype }})({{ expression }});
+{%- endfor %}
+      return result_type({{ outputs|join(', ') }});
+    }
+  };
+}
+
+#endif  // #ifndef ___CYTHRUST__{{ functor_name|upper }}__HPP___
+'''
+
+FUSED_TRANSFORM_PXD_TEMPLATE = '''
+cdef extern from "{{ header }}" namespace "cythrust" nogil:
+    cdef cppclass {{ functor_name }}:
+        {{ functor_name }}()
+'''
+
+FUSED_TRANSFORM_SETUP_TEMPLATE = '''
+from cython.operator cimport dereference as deref
+from {{ t.functor_name }}.{{ t.functor_name }} cimport {{ t.functor_name }}
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
+from cythrust.thrust.iterator.transform_iterator cimport make_transform_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9)
+from cythrust.thrust.copy cimport copy_n
+'''
+
+FUSED_TRANSFORM_TEMPLATE = '''
+    cdef {{ t.functor_name }} *op = new {{ t.functor_name }}()
+    cdef size_t N = {{ out_views[0] }}._end - {{ out_views[0] }}._begin
+
+    copy_n(make_transform_iterator(
+    {%- if t.input_columns|length > 1 %}make_zip_iterator(make_tuple{{ t.input_columns|length }}({% endif %}
+    {%- for column in t.input_columns -%}
+    {{ column }}._begin
+    {%- if not loop.last %}, {% endif -%}
+    {% endfor -%}
+    {%- if t.input_columns|length > 1 %})){% endif %}, deref(op)),
+    N,
+    make_zip_iterator(make_tuple{{ out_views|length }}(
+{%- for v in out_views -%}
+    {{ v }}._begin
+{%- if not loop.last %}, {% endif -%}
+{% endfor -%}
+    )))
+    del op
+    return N
+'''
+
+# Compact rows selected by a mask column, either in place (stable partition)
+# or to output columns (copy if) *(see `DeviceDataFrame.filter`)*.  Columns
+# are zipped in groups of at most `MAX_ZIP_ARITY` columns.
+FILTER_SETUP_TEMPLATE = '''
+from cython.operator cimport dereference as deref
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9)
+from cythrust.thrust.functional cimport identity
+from cythrust.thrust.partition cimport stable_partition_w_stencil
+from cythrust.thrust.copy cimport copy_if_w_stencil
+'''
+
+FILTER_TEMPLATE = '''
+{%- macro zipped(prefix, group) -%}
+{%- if group|length > 1 %}make_zip_iterator(make_tuple{{ group|length }}({% endif %}
+{%- for i in group -%}
+{{ prefix }}{{ i }}._begin
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{%- if group|length > 1 %})){% endif %}
+{%- endmacro %}
+    cdef size_t N = mask._end - mask._begin
+    cdef identity[{{ mask_ctype }}] *pred = new identity[{{ mask_ctype }}]()
+    cdef size_t count = 0
+
+{% for group in column_groups %}
+    {% if inplace -%}
+    count = <size_t>(stable_partition_w_stencil({{ zipped('in', group) }},
+                                                {{ zipped('in', group) }} + N,
+                                                mask._begin, deref(pred)) -
+                     {{ zipped('in', group) }})
+    {%- else -%}
+    count = <size_t>(copy_if_w_stencil({{ zipped('in', group) }},
+                                       {{ zipped('in', group) }} + N,
+                                       mask._begin, {{ zipped('out', group) }},
+                                       deref(pred)) -
+                     {{ zipped('out', group) }})
+    {%- endif %}
+{% endfor %}
+    del pred
+    return count
+'''
+
+# Gather the rows of input columns selected by an index column to output
+# columns *(see `SelectionViewGroup.materialize`)*.  Columns are zipped in
+# groups of at most `MAX_ZIP_ARITY` columns.
+GATHER_SETUP_TEMPLATE = '''
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
+from cythrust.thrust.iterator.permutation_iterator cimport make_permutation_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9)
+from cythrust.thrust.copy cimport copy_n
+'''
+
+GATHER_TEMPLATE = '''
+{%- macro zipped(prefix, group) -%}
+{%- if group|length > 1 %}make_zip_iterator(make_tuple{{ group|length }}({% endif %}
+{%- for i in group -%}
+{{ prefix }}{{ i }}._begin
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{%- if group|length > 1 %})){% endif %}
+{%- endmacro %}
+    cdef size_t N = index._end - index._begin
+
+{% for group in column_groups %}
+    copy_n(make_permutation_iterator({{ zipped('in', group) }}, index._begin),
+           N, {{ zipped('out', group) }})
+{% endfor %}
+    return N
+'''
+
+# Reduce values by key on the host, using a hash table (`engine='hash'`) or
+# an array indexed by key (`engine='dense'`) rather than sorting *(see
+# `get_host_reduce_by_key_func`)*.  If `count` is set, the number of rows of
+# each key is computed and there are no input value views.
+HOST_REDUCE_BY_KEY_SETUP_TEMPLATE = '''
+from cython.operator cimport dereference as deref
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
+from cythrust.thrust.iterator.constant_iterator cimport constant_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9, tuple2, tuple3,
+                                    tuple4, tuple5, tuple6, tuple7, tuple8,
+                                    tuple9)
+from cythrust.thrust.functional cimport {{ functors|join(', ') }}
+{% if engine == 'hash' -%}
+from cythrust.thrust.hash_reduce cimport (hash_reduce_by_key, key_hash,
+                                          tuple_hash)
+{%- else -%}
+from cythrust.thrust.dense_reduce cimport dense_reduce_by_key
+{%- endif %}
+'''
+
+HOST_REDUCE_BY_KEY_TEMPLATE = '''
+{%- macro zipped(prefix, count) -%}
+{%- if count > 1 %}make_zip_iterator(make_tuple{{ count }}({% endif %}
+{%- for i in range(count) -%}
+{{ prefix }}{{ i + 1 }}._begin
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{%- if count > 1 %})){% endif %}
+{%- endmacro %}
+    cdef size_t N = keys1._end - keys1._begin
+    cdef {{ reduce_type }} *op = new {{ reduce_type }}()
+{%- if engine == 'hash' %}
+    cdef {{ hash_type }} *hash_op = new {{ hash_type }}()
+{%- endif %}
+    cdef size_t reduced_key_count
+
+    try:
+{%- if engine == 'hash' %}
+        reduced_key_count = hash_reduce_by_key(
+            {{ zipped('keys', key_count) }}, N,
+            {% if count %}constant_iterator[uint32_t](1){% else %}{{ zipped('values', value_count) }}{% endif %},
+            {{ zipped('keys_out', key_count) }},
+            {{ zipped('values_out', value_count) }}, deref(hash_op), deref(op))
+{%- else %}
+        # Raises `ValueError` if the key range exceeds `max_key_range`.
+        reduced_key_count = dense_reduce_by_key(
+            keys1._begin, N,
+            {% if count %}constant_iterator[uint32_t](1){% else %}{{ zipped('values', value_count) }}{% endif %},
+            keys_out1._begin, {{ zipped('values_out', value_count) }},
+            deref(op), max_key_range)
+{%- endif %}
+    finally:
+        del op
+{%- if engine == 'hash' %}
+        del hash_op
+{%- endif %}
+    return reduced_key_count
+'''
+
+# Sort rows by integer key columns packed into a single `uint64_t` key,
+# which Thrust sorts using radix sort, and then gather each key and value
+# column through the sorted row permutation *(see `get_packed_sort_func`)*.
+PACKED_SORT_SETUP_TEMPLATE = '''
+from cython.operator cimport dereference as deref
+from cythrust.thrust.device_vector cimport device_vector
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9, tuple2, tuple3,
+                                    tuple4, tuple5, tuple6, tuple7, tuple8,
+                                    tuple9)
+from cythrust.thrust.packed_sort cimport (pack_tuple, packed_sort_index,
+                                          gather_in_place)
+'''
+
+PACKED_SORT_TEMPLATE = '''
+    cdef size_t N = keys1._end - keys1._begin
+    if N > 0xFFFFFFFF:
+        raise ValueError('Packed sort supports at most 2 ** 32 - 1 rows.')
+    cdef pack_tuple[tuple{{ key_ctypes|length }}[{{ key_ctypes|join(', ') }}]] *packer = new pack_tuple[tuple{{ key_ctypes|length }}[{{ key_ctypes|join(', ') }}]]()
+    cdef device_vector[uint32_t] *index = new device_vector[uint32_t](N)
+
+    try:
+        packed_sort_index(make_zip_iterator(make_tuple{{ key_ctypes|length }}(
+            {%- for i in range(key_ctypes|length) -%}
+            keys{{ i + 1 }}._begin
+            {%- if not loop.last %}, {% endif -%}
+            {%- endfor -%})), N, deref(packer), index.begin())
+{% for i in range(key_ctypes|length) %}
+        gather_in_place(keys{{ i + 1 }}._begin, N, index.begin())
+{%- endfor %}
+{%- for i in range(value_count) %}
+        gather_in_place(values{{ i + 1 }}._begin, N, index.begin())
+{%- endfor %}
+    finally:
+        del packer
+        del index
+'''
+
+# Count and expand the matching rows of a key-based join or of key range
+# lookups *(see `get_join_count_func`, `get_range_count_func`,
+# `get_join_expand_func`)*.  Right *(or indexed)* keys must be sorted.  Key
+# columns are zipped into a single iterator.
+JOIN_SETUP_TEMPLATE = '''
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator
+from cythrust.thrust.iterator.discard_iterator cimport make_discard_iterator
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9)
+from cythrust.thrust.join cimport (join_count, join_expand, range_count,
+                                   INNER_JOIN, LEFT_JOIN, SEMI_JOIN)
+'''
+
+JOIN_COUNT_TEMPLATE = '''
+{%- macro zipped(prefix, count) -%}
+{%- if count > 1 %}make_zip_iterator(make_tuple{{ count }}({% endif %}
+{%- for i in range(count) -%}
+{{ prefix }}{{ i + 1 }}._begin
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{%- if count > 1 %})){% endif %}
+{%- endmacro %}
+    cdef size_t N = left1._end - left1._begin
+    cdef size_t M = right1._end - right1._begin
+    if N > 0xFFFFFFFF or M > 0xFFFFFFFF:
+        raise ValueError('Joins support at most 2 ** 32 - 1 rows per side.')
+    return join_count({{ zipped('left', key_count) }}, N,
+                      {{ zipped('right', key_count) }}, M, {{ how|upper }}_JOIN,
+                      lower._begin, upper._begin, offset._begin)
+'''
+
+RANGE_COUNT_TEMPLATE = '''
+{%- macro zipped(prefix, count) -%}
+{%- if count > 1 %}make_zip_iterator(make_tuple{{ count }}({% endif %}
+{%- for i in range(count) -%}
+{{ prefix }}{{ i + 1 }}._begin
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{%- if count > 1 %})){% endif %}
+{%- endmacro %}
+    cdef size_t N = lo1._end - lo1._begin
+    cdef size_t M = sorted1._end - sorted1._begin
+    if N > 0xFFFFFFFF or M > 0xFFFFFFFF:
+        raise ValueError('Range lookups support at most 2 ** 32 - 1 rows and '
+                         'ranges.')
+    return range_count({{ zipped('sorted', key_count) }}, M,
+                       {{ zipped('lo', key_count) }},
+                       {{ zipped('hi', key_count) }}, N,
+                       lower._begin, upper._begin, offset._begin)
+'''
+
+JOIN_EXPAND_TEMPLATE = '''
+    cdef size_t N = lower._end - lower._begin
+    join_expand(lower._begin, upper._begin, offset._begin, N,
+                {{ how|upper }}_JOIN, left_index._begin,
+                {% if how == 'semi' %}make_discard_iterator(){% else %}right_index._begin{% endif %},
+                {% if how == 'left' %}unmatched._begin{% else %}make_discard_iterator(){% endif %})
+'''
+
+# Replace the rows of columns where a mask is non-zero by a fill value per
+# column *(e.g., right columns of unmatched rows of a left join)*.  Fill
+# values are passed after the views.
+REPLACE_WHERE_SETUP_TEMPLATE = '''
+from cython.operator cimport dereference as deref
+from cythrust.thrust.functional cimport identity
+from cythrust.thrust.replace cimport replace_if_w_stencil
+'''
+
+REPLACE_WHERE_TEMPLATE = '''
+    cdef size_t N = mask._end - mask._begin
+    cdef identity[uint8_t] *pred = new identity[uint8_t]()
+
+{% for ctype in ctypes %}
+    replace_if_w_stencil(column{{ loop.index }}._begin,
+                         column{{ loop.index }}._begin + N, mask._begin,
+                         deref(pred), <{{ ctype }}>fill{{ loop.index }})
+{%- endfor %}
+    del pred
+'''
+
+# Compute the minimum and maximum of each block of rows of several columns
+# *(see `get_zone_map_func`)*, in a single `reduce_by_key` pass per column.
+ZONE_MAP_SETUP_TEMPLATE = '''
+from cythrust.thrust.zone_map cimport block_minmax
+'''
+
+ZONE_MAP_TEMPLATE = '''
+    cdef size_t N = values1._end - values1._begin
+
+{% for i in range(column_count) %}
+    block_minmax(values{{ i + 1 }}._begin, N, block_size, mins{{ i + 1 }}._begin,
+                 maxs{{ i + 1 }}._begin)
+{%- endfor %}
+'''
+
+# Reduce several accumulators of value columns by key in a single
+# `reduce_by_key` pass, e.g., sums, counts and sums of squares for means and
+# variances, or `(value, position)` tuples for arg min/max *(see
+# `get_agg_reduce_by_key_func`)*.  Each accumulator is a `kind`:
+#
+#  - `value`: values of a column.
+#  - `float`/`square`: values *(or squared values)* of a column, as `double`.
+#  - `count`: constant `1`.
+#  - `position`: `(value, row position)` tuples, of which only the position
+#    is written to the output column.
+AGG_REDUCE_BY_KEY_SETUP_TEMPLATE = '''
+{%- macro accumulator_iterator(c) -%}
+{%- if c.kind == 'count' -%}
+constant_iterator[uint32_t]
+{%- elif c.kind == 'float' -%}
+transform_iterator[identity[double], Value{{ c.value }}Iterator]
+{%- elif c.kind == 'square' -%}
+transform_iterator[square[double], Value{{ c.value }}Iterator]
+{%- elif c.kind == 'position' -%}
+zip_iterator[tuple2[Value{{ c.value }}Iterator, RowIterator]]
+{%- else -%}
+Value{{ c.value }}Iterator
+{%- endif -%}
+{%- endmacro %}
+{%- macro output_iterator(c, i) -%}
+{%- if c.kind == 'position' -%}
+zip_iterator[tuple2[discard_iterator, ValueOut{{ i }}Iterator]]
+{%- else -%}
+ValueOut{{ i }}Iterator
+{%- endif -%}
+{%- endmacro %}
+from cython.operator cimport dereference as deref
+from cythrust.thrust.reduce cimport reduce_by_key as c_reduce_by_key
+from cythrust.thrust.iterator.zip_iterator cimport make_zip_iterator, zip_iterator
+from cythrust.thrust.iterator.transform_iterator cimport (make_transform_iterator,
+                                                          transform_iterator)
+from cythrust.thrust.iterator.constant_iterator cimport constant_iterator
+from cythrust.thrust.iterator.counting_iterator cimport counting_iterator
+from cythrust.thrust.iterator.discard_iterator cimport (make_discard_iterator,
+                                                        discard_iterator)
+from cythrust.thrust.tuple cimport (make_tuple2, make_tuple3, make_tuple4,
+                                    make_tuple5, make_tuple6, make_tuple7,
+                                    make_tuple8, make_tuple9, tuple2, tuple3,
+                                    tuple4, tuple5, tuple6, tuple7, tuple8,
+                                    tuple9)
+from cythrust.thrust.functional cimport (equal_to, identity, square, plus,
+                                         multiplies, minimum, maximum,
+                                         take_first, take_last, arg_minimum,
+                                         arg_maximum
+{%- if components|length > 1 %}, reduce{{ components|length }}{% endif %})
+
+{% for m in key_modules -%}
+from {{ m }}.device_vector cimport Iterator as Key{{ loop.index }}Iterator
+{% endfor %}
+{% for m in value_modules -%}
+from {{ m }}.device_vector cimport Iterator as Value{{ loop.index }}Iterator
+{% endfor %}
+{% for m in value_out_modules -%}
+from {{ m }}.device_vector cimport Iterator as ValueOut{{ loop.index }}Iterator
+{% endfor %}
+{%- if row_module %}
+from {{ row_module }}.device_vector cimport Iterator as RowIterator
+{%- else %}
+ctypedef counting_iterator[uint32_t] RowIterator
+{%- endif %}
+
+ctypedef {% if key_modules|length > 1 %}zip_iterator[tuple{{ key_modules|length }}[{% endif %}
+{%- for m in key_modules -%}
+Key{{ loop.index }}Iterator
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{% if key_modules|length > 1 %}]]{% endif %} keys_iterator
+ctypedef {% if components|length > 1 %}zip_iterator[tuple{{ components|length }}[{% endif %}
+{%- for c in components -%}
+{{ accumulator_iterator(c) }}
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{% if components|length > 1 %}]]{% endif %} values_iterator
+ctypedef {% if components|length > 1 %}zip_iterator[tuple{{ components|length }}[{% endif %}
+{%- for c in components -%}
+{{ output_iterator(c, loop.index) }}
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{% if components|length > 1 %}]]{% endif %} values_out_iterator
+ctypedef {% if components|length > 1 %}reduce{{ components|length }}[{% endif %}
+{%- for c in components -%}
+{{ c.op }}[{{ c.ctype }}]
+{%- if not loop.last %}, {% endif -%}
+{%- endfor -%}
+{% if components|length > 1 %}]{% endif %} reduce_op_t
+'''
+
+AGG_REDUCE_BY_KEY_TEMPLATE = '''
+{%- macro accumulator_begin(c) -%}
+{%- if c.kind == 'count' -%}
+constant_iterator[uint32_t](1)
+{%- elif c.kind == 'float' -%}
+make_transform_iterator(<Value{{ c.value }}Iterator>values{{ c.value }}._begin, deref(as_double))
+{%- elif c.kind == 'square' -%}
+make_transform_iterator(<Value{{ c.value }}Iterator>values{{ c.value }}._begin, deref(squared))
+{%- elif c.kind == 'position' -%}
+make_zip_iterator(make_tuple2(<Value{{ c.value }}Iterator>values{{ c.value }}._begin, rows_begin))
+{%- else -%}
+<Value{{ c.value }}Iterator>values{{ c.value }}._begin
+{%- endif -%}
+{%- endmacro %}
+{%- macro output_begin(c, i) -%}
+{%- if c.kind == 'position' -%}
+make_zip_iterator(make_tuple2(make_discard_iterator(), <ValueOut{{ i }}Iterator>values_out{{ i }}._begin))
+{%- else -%}
+<ValueOut{{ i }}Iterator>values_out{{ i }}._begin
+{%- endif -%}
+{%- endmacro %}
+    cdef identity[double] *as_double = new identity[double]()
+    cdef square[double] *squared = new square[double]()
+    cdef reduce_op_t *reduce_op = new reduce_op_t()
+    {% if key_ctypes|length > 1 %}
+    cdef equal_to[tuple{{ key_ctypes|length }}[{{ key_ctypes|join(', ') }}]] *compare_op = \\
+        new equal_to[tuple{{ key_ctypes|length }}[{{ key_ctypes|join(', ') }}]]()
+    {% else %}
+    cdef equal_to[{{ key_ctypes[0] }}] *compare_op = new equal_to[{{ key_ctypes[0] }}]()
+    {% endif %}
+
+    cdef size_t N = keys1._end - keys1._begin
+    cdef RowIterator rows_begin = {% if row_module %}<RowIterator>rows._begin{% else %}RowIterator(0){% endif %}
+{% for k in ('keys', 'keys_out') %}
+    cdef keys_iterator {{ k }}_begin =
+    {%- if key_modules|length > 1 %} make_zip_iterator(make_tuple{{ key_modules|length }}({% endif %}
+    {%- for m in key_modules %} <Key{{ loop.index }}Iterator>{{ k }}{{ loop.index }}._begin
+        {%- if not loop.last %},{% endif %}
+    {%- endfor %}
+    {%- if key_modules|length > 1 %})){% endif %}
+{%- endfor %}
+    cdef values_iterator values_begin =
+    {%- if components|length > 1 %} make_zip_iterator(make_tuple{{ components|length }}({% endif %}
+    {%- for c in components %} {{ accumulator_begin(c) }}
+        {%- if not loop.last %},{% endif %}
+    {%- endfor %}
+    {%- if components|length > 1 %})){% endif %}
+    cdef values_out_iterator values_out_begin =
+    {%- if components|length > 1 %} make_zip_iterator(make_tuple{{ components|length }}({% endif %}
+    {%- for c in components %} {{ output_begin(c, loop.index) }}
+        {%- if not loop.last %},{% endif %}
+    {%- endfor %}
+    {%- if components|length > 1 %})){% endif %}
+
+    cdef size_t count = <size_t>(
+        <keys_iterator>(c_reduce_by_key(keys_begin, keys_begin + N,
+                                        values_begin, keys_out_begin,
+                                        values_out_begin, deref(compare_op),
+                                        deref(reduce_op)).first) -
+                                        keys_out_begin)
+    del as_double
+    del squared
+    del reduce_op
+    del compare_op
+    return count
+'''
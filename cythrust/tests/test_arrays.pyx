@@ -0,0 +1,53 @@
+# distutils: language = c++
+'''
+Test `numpy` arrays wrapping device vector data on host backends, without
+copying *(see `DeviceVector.asarray`)*.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import Context, DeviceDataFrame
+
+
+def test_vector_asarray():
+    context = Context()
+    assert(context.host_memory)
+    vector = context.from_array(np.arange(10, dtype=np.int32))
+    a = vector.asarray(copy=False)
+    assert((a == np.arange(10)).all())
+    # Writes to the array modify the vector, and vice versa.
+    a[0] = 42
+    assert(vector[0] == 42)
+    vector[1:2] = 7
+    assert(a[1] == 7)
+
+    # Copies do not share memory with the vector.
+    b = vector.asarray()
+    b[0] = 0
+    assert(vector[0] == 42)
+    assert(not np.may_share_memory(a, b))
+
+
+def test_view_asarray():
+    context = Context()
+    vector = context.from_array(np.arange(10, dtype=np.int32))
+    view = vector.view(2, 5)
+    a = view.asarray(copy=False)
+    # Views wrap only the viewed range of the vector data.
+    assert((a == np.arange(2, 6)).all())
+    assert(np.may_share_memory(a, vector.asarray(copy=False)))
+    a[:] = 0
+    assert((vector.asarray() == [0, 1, 0, 0, 0, 0, 6, 7, 8, 9]).all())
+
+
+def test_frame_as_arrays():
+    df = pd.DataFrame(OrderedDict([('a', np.arange(10, dtype=np.int32)),
+                                   ('b', np.linspace(0, 1, 10))]))
+    ddf = DeviceDataFrame(df)
+    arrays = ddf.as_arrays(copy=False)
+    arrays['a'][:] = -1
+    assert((ddf.v['a'].asarray() == -1).all())
+    assert_frame_equal(ddf.as_dataframe(copy=False), ddf.df)
@@ -0,0 +1,73 @@
+# distutils: language = c++
+'''
+Test frames wrapping existing `numpy` memory, without copying *(see
+`DeviceVectorView.from_array`)*.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import Context, DeviceDataFrame, GroupBy
+
+
+def _arrays(size=1000, key_range=13, seed=0):
+    np.random.seed(seed)
+    return OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64))])
+
+
+def test_borrow_array():
+    context = Context()
+    a = np.arange(10, dtype=np.int32)
+    view = context.borrow_array(a)
+    assert(view.borrowed)
+    assert(not view.read_only)
+    # Writes through the view modify the array.
+    view[:3] = 7
+    assert((a[:3] == 7).all())
+    # Host views of borrowed memory share the memory of the array.
+    assert(np.may_share_memory(view.asarray(copy=False), a))
+
+    a.flags.writeable = False
+    view = context.borrow_array(a)
+    assert(view.read_only)
+    assert(not view.asarray(copy=False).flags.writeable)
+    try:
+        view[0] = 1
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Expected `ValueError`.')
+
+
+def test_empty_view():
+    context = Context()
+    view_class = context.get_device_vector_view_class(np.int32)
+    view = view_class()
+    assert(view.size == 0)
+
+
+def test_borrowed_sort():
+    arrays = _arrays()
+    df = pd.DataFrame(arrays).copy()
+    ddf = DeviceDataFrame(arrays, borrow=True)
+    ddf.sort(column='a', key='k', stable=True)
+    expected = (df.sort_values('k', kind='mergesort')
+                .reset_index(drop=True))
+    assert_frame_equal(ddf.df, expected)
+    # Rows were sorted in the borrowed memory.
+    assert((arrays['k'] == expected['k'].values).all())
+
+
+def test_borrowed_groupby():
+    arrays = _arrays()
+    df = pd.DataFrame(arrays).copy()
+    ddf = DeviceDataFrame(arrays, borrow=True)
+    groupby = GroupBy(ddf, ['k'])
+    result = groupby.agg('sum').df
+    expected = (df.groupby('k').agg('sum').add_suffix('_sum')
+                .reset_index())
+    assert_frame_equal(result, expected, check_dtype=False)
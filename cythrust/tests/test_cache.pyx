@@ -0,0 +1,71 @@
+# distutils: language = c++
+'''
+Test in-process caches *(see `LRUCache`)*, and the kernel caches shared by
+view groups with the same column layout *(e.g., `get_scatter_func`)*.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import theano.tensor as T
+
+from cythrust import (Context, DeviceDataFrame, LRUCache, get_describe_transforms,
+                      get_scatter_func)
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=3)
+    for i in xrange(3):
+        cache[i] = 10 * i
+    # Item access and `OrderedDict` accessors do not reorder items.
+    assert(cache[0] == 0)
+    assert(cache.values() == [0, 10, 20])
+    assert(cache.items() == [(0, 0), (1, 10), (2, 20)])
+    assert(cache.copy().keys() == [0, 1, 2])
+    assert(repr(cache))
+
+    # `lookup` marks the item as most recently used, so the least recently
+    # used item is discarded when the cache is full.
+    assert(cache.lookup(0) == 0)
+    assert(cache.keys() == [1, 2, 0])
+    cache[3] = 30
+    assert(cache.keys() == [2, 0, 3])
+    try:
+        cache.lookup(1)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError('Expected `KeyError`.')
+
+
+def _frame(size=100, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('c', np.random.randint(0, 100, size).astype(np.int32)),
+        ('d', np.zeros(size, dtype=np.int32))]))
+
+
+def test_scatter_cache():
+    context = Context()
+    for i in xrange(2):
+        df = _frame(seed=i)
+        ddf = DeviceDataFrame(df, context=context)
+        c, d = ddf.tensor(['c', 'd'])
+        hits = get_scatter_func.cache_info().hits
+        # d[:] = c[:]
+        ddf.scatter(ddf.size, c.take(T.arange(0)), d.take(T.arange(0)))
+        assert((ddf.df.d.values == df.c.values).all())
+        if i > 0:
+            # Graphs are keyed by fingerprint, so the function compiled for
+            # the first frame *(with the same context and layout)* is reused.
+            assert(get_scatter_func.cache_info().hits == hits + 1)
+
+
+def test_describe_cache():
+    context = Context()
+    for i in xrange(2):
+        ddf = DeviceDataFrame(_frame(seed=i), context=context)
+        hits = get_describe_transforms.cache_info().hits
+        ddf.describe()
+        if i > 0:
+            assert(get_describe_transforms.cache_info().hits == hits + 1)
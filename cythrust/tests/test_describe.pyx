@@ -0,0 +1,54 @@
+# distutils: language = c++
+'''
+Test summary statistics of columns *(see `DeviceViewGroup.describe`)* and of
+the values of each key *(see `GroupBy.describe`)*, comparing against the
+equivalent `pandas` operations.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from cythrust import DeviceDataFrame, GroupBy, GROUPBY_DESCRIBE_OPS
+
+
+def _frame(size=2000, key_range=13, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.randint(0, 1000, size).astype(np.uint32))]))
+
+
+def test_describe():
+    df = _frame()
+    result = DeviceDataFrame(df).describe()
+    for column in df.columns:
+        # Sums are reduced as `float32` *(see `get_describe_transforms`)*.
+        for stat, expected in (('count', len(df)),
+                               ('sum', df[column].sum()),
+                               ('mean', df[column].mean()),
+                               ('std', df[column].std()),
+                               ('min', df[column].min()),
+                               ('max', df[column].max())):
+            assert(np.isclose(result[column, stat], expected, rtol=1e-3))
+
+
+def test_groupby_describe():
+    df = _frame()
+    grouped = df.groupby('k')
+    for engine in ('sort', 'argsort'):
+        result = GroupBy(DeviceDataFrame(df), ['k'], engine=engine).describe()
+        assert(result.columns.tolist() == ['a', 'b'])
+        assert(result.index.names[0] == 'k')
+        # One row per key and statistic, with statistics of each key in
+        # the order of `GROUPBY_DESCRIBE_OPS`.
+        assert(len(result) == len(grouped) * len(GROUPBY_DESCRIBE_OPS))
+        assert((result.index.get_level_values(1)[:len(GROUPBY_DESCRIBE_OPS)]
+                == list(GROUPBY_DESCRIBE_OPS)).all())
+        for op in GROUPBY_DESCRIBE_OPS:
+            stats = result.xs(op, level=1)
+            assert((stats.index.values == np.unique(df.k.values)).all())
+            for column in ('a', 'b'):
+                assert(np.allclose(stats[column].values,
+                                   grouped[column].agg(op).values))
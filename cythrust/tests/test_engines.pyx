@@ -0,0 +1,169 @@
+# distutils: language = c++
+'''
+Compare the results of each `GroupBy` engine, packed sorts, joins, and zone
+map pruning against the equivalent `pandas` operations.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import (DeviceDataFrame, GroupBy, GROUPBY_ENGINES, merge,
+                      packed_sort_supported)
+
+
+def _frame(size=5000, key_range=23, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('j', np.random.randint(0, 3, size).astype(np.uint8)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.randint(0, 1000, size).astype(np.uint32))]))
+
+
+def _sorted_by(df, columns):
+    # The `hash` engine returns keys in order of first appearance.
+    return (df.sort_values(columns, kind='mergesort')
+            .reset_index(drop=True))
+
+
+def _assert_groupby_equal(df, key_columns, engine, reduce_op):
+    ddf = DeviceDataFrame(df)
+    groupby = GroupBy(ddf, key_columns, engine=engine)
+    if reduce_op == 'count':
+        result, expected = groupby.count().df, groupby.ref_count()
+    else:
+        # `agg` names each reduced column `<column>_<operation>`, like the
+        # flattened `pandas` result for a list of operations.
+        result, expected = (groupby.agg(reduce_op).df,
+                            groupby.ref_agg([reduce_op]))
+    assert_frame_equal(_sorted_by(result, key_columns),
+                       _sorted_by(expected, key_columns),
+                       check_dtype=False)
+
+
+def test_groupby_engines():
+    df = _frame()
+    for engine in GROUPBY_ENGINES:
+        for reduce_op in ('sum', 'min', 'max', 'count'):
+            _assert_groupby_equal(df, ['k'], engine, reduce_op)
+            if engine != 'dense':
+                # The `dense` engine only supports a single key column.
+                _assert_groupby_equal(df, ['k', 'j'], engine, reduce_op)
+
+
+def test_groupby_prepared():
+    df = _frame()
+    for engine in GROUPBY_ENGINES:
+        groupby = GroupBy(DeviceDataFrame(df), ['k'], engine=engine)
+        ddf = DeviceDataFrame(df)
+        result = groupby.prepare_agg('sum')(ddf).df
+        assert_frame_equal(_sorted_by(result, ['k']),
+                           _sorted_by(groupby.ref_agg(['sum']), ['k']),
+                           check_dtype=False)
+        result = groupby.prepare_count()(ddf).df
+        assert_frame_equal(_sorted_by(result, ['k']),
+                           _sorted_by(groupby.ref_count(), ['k']),
+                           check_dtype=False)
+        if engine != 'sort':
+            # Only the `sort` engine modifies the grouped rows.
+            assert_frame_equal(ddf.df, df)
+
+
+def test_agg_accumulated():
+    df = _frame()
+    ops = ['mean', 'var', 'std', 'first', 'last', 'count', 'sum']
+    expected = df.groupby('k').agg(ops)
+    expected.columns = ['_'.join(c) for c in expected.columns.values]
+    expected = expected.reset_index()
+    for engine in ('sort', 'argsort'):
+        # Rows must be sorted stably for `first` and `last` to match
+        # `pandas`.
+        groupby = GroupBy(DeviceDataFrame(df), ['k'], engine=engine,
+                          stable=True)
+        result = groupby.agg(ops).df
+        assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_agg_position():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    # Positions within the unmodified rows, i.e., like `pandas` `idxmin`.
+    result = GroupBy(ddf, ['k'], engine='argsort').agg(['argmin',
+                                                        'argmax']).df
+    grouped = df.groupby('k')
+    for column in ('a', 'b'):
+        assert((result['%s_argmin' % column].values ==
+                grouped[column].idxmin().values).all())
+        assert((result['%s_argmax' % column].values ==
+                grouped[column].idxmax().values).all())
+
+    # Positions within the sorted rows for the `sort` engine.
+    result = GroupBy(ddf, ['k'], engine='sort').agg(['argmin', 'argmax']).df
+    sorted_df = ddf.df
+    for column in ('a', 'b'):
+        values = sorted_df[column].values
+        assert((values[result['%s_argmin' % column].values] ==
+                grouped[column].min().values).all())
+        assert((values[result['%s_argmax' % column].values] ==
+                grouped[column].max().values).all())
+
+
+def test_packed_sort():
+    df = _frame()
+    assert(packed_sort_supported(df[['k', 'j']].dtypes))
+    ddf = DeviceDataFrame(df)
+    ddf.sort(column=['a', 'b'], key=['k', 'j'])
+    # Packed sorts are stable.
+    assert_frame_equal(ddf.df, _sorted_by(df, ['k', 'j']))
+
+
+def test_merge():
+    left = _frame(size=500, seed=1)
+    right = _frame(size=200, seed=2)[['k', 'j', 'b']]
+    for how in ('inner', 'left'):
+        result = merge(DeviceDataFrame(left), DeviceDataFrame(right), 'k',
+                       how=how, fill_value=0).df
+        expected = pd.merge(left, right, on='k', how=how).fillna(0)
+        columns = list(expected.columns)
+        assert_frame_equal(_sorted_by(result[columns], columns),
+                           _sorted_by(expected, columns), check_dtype=False)
+
+
+def test_merge_semi():
+    left = _frame(size=500, seed=1)
+    right = _frame(size=50, seed=2)[['k', 'j', 'b']]
+    # Rows of `left` are kept in order, once each, with `left` columns only.
+    result = merge(DeviceDataFrame(left), DeviceDataFrame(right), 'k',
+                   how='semi').df
+    expected = left[left.k.isin(right.k)].reset_index(drop=True)
+    assert_frame_equal(result, expected, check_dtype=False)
+
+    result = merge(DeviceDataFrame(left), DeviceDataFrame(right), ['k', 'j'],
+                   how='semi').df
+    keys = set(zip(right.k, right.j))
+    expected = left[[key in keys for key in zip(left.k, left.j)]]
+    assert_frame_equal(result, expected.reset_index(drop=True),
+                       check_dtype=False)
+
+
+def test_zone_map_filter():
+    df = _sorted_by(_frame(), ['k'])
+    ddf = DeviceDataFrame(df)
+    ddf.build_zone_map(block_size=64)
+    # Products of comparisons are logical and *(see `predicate_ranges`)*.
+    result = ddf.filter((ddf.expr('k') >= 5) * (ddf.expr('k') <= 9),
+                        inplace=False)
+    expected = df[(df.k >= 5) & (df.k <= 9)].reset_index(drop=True)
+    assert_frame_equal(result.df, expected)
+
+
+def test_zone_map_reduce():
+    # Sums are accumulated in the column type, so narrow columns are skipped.
+    df = _sorted_by(_frame(), ['k'])[['k', 'a']]
+    ddf = DeviceDataFrame(df)
+    ddf.build_zone_map(block_size=64)
+    result = ddf.reduce('plus', ranges={'k': (5, 9)})
+    expected = df[(df.k >= 5) & (df.k <= 9)].sum()
+    assert(np.allclose(result, expected.values))
@@ -0,0 +1,54 @@
+# distutils: language = c++
+'''
+Test lazy column expressions *(see `ColumnExpression`)*, comparing against
+the equivalent `pandas` operations.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import DeviceDataFrame
+
+
+def _frame(size=1000, key_range=7, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.rand(size))]))
+
+
+def test_expression_reduce():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    a, b = ddf.expr(['a', 'b'])
+    assert(np.allclose((a * b + 1).sum(), (df.a * df.b + 1).sum()))
+    assert(np.allclose((a - b).min(), (df.a - df.b).min()))
+    assert(np.allclose((a - b).max(), (df.a - df.b).max()))
+    assert(a.sum() == df.a.sum())
+    # Expressions are lazy, so the frame is not modified.
+    assert_frame_equal(ddf.df, df)
+
+
+def test_expression_assign():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    a, b = ddf.expr(['a', 'b'])
+    ddf['c'] = (a - b) ** 2
+    assert(ddf.columns == ['k', 'a', 'b', 'c'])
+    assert(np.allclose(ddf.df.c.values, (df.a - df.b) ** 2))
+    # Existing columns are overwritten in place.
+    ddf['a'] = a * 3 + 1
+    assert((ddf.df.a.values == df.a.values * 3 + 1).all())
+
+
+def test_expression_agg():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    a, b = ddf.expr(['a', 'b'])
+    result = (a * 2 - 1).agg(['k'], 'sum', name='value').df
+    expected = ((df.a * 2 - 1).groupby(df.k).sum().rename('value')
+                .reset_index())
+    assert_frame_equal(result, expected, check_dtype=False)
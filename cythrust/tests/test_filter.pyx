@@ -0,0 +1,56 @@
+# distutils: language = c++
+'''
+Test row filtering *(see `DeviceDataFrame.filter`)*, comparing against the
+equivalent `pandas` operations.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import DeviceDataFrame, GroupBy
+
+
+def _frame(size=2000, key_range=17, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.rand(size))]))
+
+
+def test_filter():
+    df = _frame()
+    expected = df[(df.a > 0) & (df.b < .5)].reset_index(drop=True)
+    for inplace in (True, False):
+        ddf = DeviceDataFrame(df)
+        result = ddf.filter((ddf.expr('a') > 0) * (ddf.expr('b') < .5),
+                            inplace=inplace)
+        assert((result is ddf) == inplace)
+        assert_frame_equal(result.df, expected)
+
+
+def test_filter_none():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    ddf.filter(ddf.expr('a') > 1000)
+    assert(ddf.size == 0)
+
+
+def test_filter_groupby():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    ddf.filter(ddf.expr('a') > 0)
+    filtered = df[df.a > 0]
+    # Rows dropped by the filter must not be grouped *(or sorted back into
+    # the views)*.
+    result = GroupBy(ddf, ['k']).agg('sum').df
+    expected = (filtered.groupby('k').agg('sum').add_suffix('_sum')
+                .reset_index())
+    assert_frame_equal(result, expected, check_dtype=False)
+    assert(ddf.is_sorted(['k']))
+    # The views contain the filtered rows, sorted by key.
+    assert((ddf.df.k.values == np.sort(filtered.k.values)).all())
+    assert((ddf.df.sort_values(['k', 'a', 'b']).values ==
+            filtered.sort_values(['k', 'a', 'b']).values).all())
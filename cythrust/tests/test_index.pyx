@@ -0,0 +1,83 @@
+# distutils: language = c++
+'''
+Test batched point and range lookups by key *(see `SortedIndex`)*,
+comparing against the equivalent `pandas` selections.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import DeviceDataFrame
+
+
+def _frame(size=2000, key_range=50, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('j', np.random.randint(0, 3, size).astype(np.uint8)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64))]))
+
+
+def _ranges(df, lo, hi):
+    # Rows with keys within each inclusive range, grouped by range, sorted
+    # by key, and otherwise in the order of `df`.
+    return pd.concat([df[(df.k >= lo_i) & (df.k <= hi_i)]
+                      .sort_values('k', kind='mergesort')
+                      for lo_i, hi_i in zip(lo, hi)]).reset_index(drop=True)
+
+
+def _assert_rows_equal(result, expected):
+    assert_frame_equal(result.df.reset_index(drop=True), expected)
+
+
+def test_get():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    index = ddf.create_index('k')
+    keys = np.array([17, 3, 17, 42])
+    _assert_rows_equal(index.get(keys), _ranges(df, keys, keys))
+    _assert_rows_equal(index.get(5), _ranges(df, [5], [5]))
+    # Keys without rows are skipped.
+    assert(index.get(np.array([1000])).size == 0)
+    # The group is not modified.
+    assert_frame_equal(ddf.df, df)
+
+
+def test_between():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    index = ddf.create_index('k')
+    lo, hi = np.array([10, 2, 40]), np.array([10, 7, 1000])
+    _assert_rows_equal(index.between(lo, hi), _ranges(df, lo, hi))
+    lower, upper = index.bounds(lo, hi)
+    sorted_keys = np.sort(df.k.values)
+    assert((lower == np.searchsorted(sorted_keys, lo, 'left')).all())
+    assert((upper == np.searchsorted(sorted_keys, hi, 'right')).all())
+
+
+def test_sorted_group():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    ddf.sort(column=['j', 'a'], key='k', stable=True)
+    index = ddf.create_index('k')
+    # Key columns of sorted rows are used in place.
+    assert(index.order is None)
+    sorted_df = df.sort_values('k', kind='mergesort').reset_index(drop=True)
+    _assert_rows_equal(index.between(5, 9), _ranges(sorted_df, [5], [9]))
+    lo, hi = np.array([30, 5]), np.array([35, 9])
+    _assert_rows_equal(index.between(lo, hi), _ranges(sorted_df, lo, hi))
+
+
+def test_multiple_keys():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    index = ddf.create_index(['k', 'j'])
+    result = index.get((np.int32(17), np.uint8(2)))
+    expected = df[(df.k == 17) & (df.j == 2)].reset_index(drop=True)
+    _assert_rows_equal(result, expected)
+    result = index.get({'k': [3, 17], 'j': [0, 2]})
+    expected = pd.concat([df[(df.k == 3) & (df.j == 0)],
+                          df[(df.k == 17) & (df.j == 2)]])
+    _assert_rows_equal(result, expected.reset_index(drop=True))
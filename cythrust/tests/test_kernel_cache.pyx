@@ -0,0 +1,71 @@
+# distutils: language = c++
+'''
+Test the content-addressed kernel cache *(see `Context.kernel_hash`,
+`Context.inline_cached_pyx_module`, `Context.submit_pyx_module` and
+`prebuild`)*.
+'''
+import importlib
+import sys
+
+import numpy as np
+
+from cythrust import Context, prebuild
+
+
+KERNEL_CODE = '''
+def answer():
+    return %d
+'''
+
+
+def test_kernel_hash():
+    context = Context()
+    code = KERNEL_CODE % 42
+    # Hashes are stable, e.g., across contexts and processes.
+    assert(context.kernel_hash(code) == Context().kernel_hash(code))
+    assert(context.kernel_hash(code) != context.kernel_hash(KERNEL_CODE % 7))
+    assert(context.kernel_hash(code) != Context(tag='debug')
+           .kernel_hash(code))
+    assert(context.kernel_hash(code) !=
+           context.kernel_hash(code, extra_compile_args=['-O0']))
+
+
+def test_inline_cached_pyx_module():
+    context = Context()
+    code = KERNEL_CODE % 42
+    module_dir, module_name = context.inline_cached_pyx_module(code)
+    assert(module_name.endswith('kernel_%s' % context.kernel_hash(code)))
+    assert(module_dir.joinpath('%s.pyx' % module_name.split('.')[-1])
+           .isfile())
+    assert(importlib.import_module(module_name).answer() == 42)
+    # Cached modules are imported, rather than built again.
+    assert((module_dir, module_name) ==
+           context.inline_cached_pyx_module(code))
+    assert(module_name in sys.modules)
+
+
+def test_prebuild():
+    dtypes = [np.int32, np.float64]
+    result = prebuild(['THRUST_DEVICE_SYSTEM_CPP'], dtypes)
+    assert(result.keys() == ['THRUST_DEVICE_SYSTEM_CPP'])
+    context = Context()
+    # Prebuilt modules are the modules used by contexts of the same backend.
+    assert(result['THRUST_DEVICE_SYSTEM_CPP'] ==
+           [context.get_device_vector_module(d) for d in dtypes])
+    for module_name in result['THRUST_DEVICE_SYSTEM_CPP']:
+        importlib.import_module(module_name)
+
+
+def test_submit_pyx_module():
+    context = Context()
+    try:
+        futures = [context.submit_pyx_module(KERNEL_CODE % i)
+                   for i in xrange(3)]
+        for i, future in enumerate(futures):
+            module_dir, module_name = future.result()
+            # Modules built by the compile pool are in the kernel cache.
+            assert(module_name.endswith('kernel_%s' % context.kernel_hash(
+                KERNEL_CODE % i)))
+            assert(importlib.import_module(module_name).answer() == i)
+    finally:
+        context.shutdown_compile_pool()
@@ -0,0 +1,92 @@
+# distutils: language = c++
+'''
+Test on-disk frames, with columns memory-mapped from files *(see
+`DeviceDataFrame.to_directory` and `DeviceDataFrame.from_directory`)*.
+'''
+import shutil
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import DeviceDataFrame, GroupBy
+
+
+def _frame(size=1000, key_range=13, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64))]))
+
+
+def _assert_raises(exception, func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except exception:
+        pass
+    else:
+        raise AssertionError('Expected `%s`.' % exception.__name__)
+
+
+def test_round_trip():
+    df = _frame()
+    frame_dir = tempfile.mkdtemp(prefix='cythrust__')
+    try:
+        DeviceDataFrame(df).to_directory(frame_dir)
+        frame = DeviceDataFrame.from_directory(frame_dir)
+        assert_frame_equal(frame.df, df)
+
+        # In-place sorts are written to the column files.
+        frame.sort(column='a', key='k', stable=True)
+        frame.flush()
+        del frame
+        frame = DeviceDataFrame.from_directory(frame_dir, mode='r')
+        expected = (df.sort_values('k', kind='mergesort')
+                    .reset_index(drop=True))
+        assert_frame_equal(frame.df, expected)
+    finally:
+        shutil.rmtree(frame_dir)
+
+
+def test_mapped_groupby():
+    df = _frame()
+    frame_dir = tempfile.mkdtemp(prefix='cythrust__')
+    try:
+        DeviceDataFrame(df).to_directory(frame_dir)
+        frame = DeviceDataFrame.from_directory(frame_dir)
+        result = GroupBy(frame, ['k']).agg('sum').df
+        expected = (df.groupby('k').agg('sum').add_suffix('_sum')
+                    .reset_index())
+        assert_frame_equal(result, expected, check_dtype=False)
+    finally:
+        shutil.rmtree(frame_dir)
+
+
+def test_read_only():
+    df = _frame()
+    frame_dir = tempfile.mkdtemp(prefix='cythrust__')
+    try:
+        DeviceDataFrame(df).to_directory(frame_dir)
+        frame = DeviceDataFrame.from_directory(frame_dir, mode='r')
+        assert(frame.read_only)
+        assert(frame.view(0, 10).read_only)
+        assert(frame[['k']].read_only)
+        _assert_raises(ValueError, frame.sort, column='a', key='k')
+        _assert_raises(ValueError, frame.filter, frame.expr('k') > 3)
+        _assert_raises(ValueError, GroupBy, frame, ['k'])
+
+        # Non-mutating alternatives are supported.
+        expected = (df.groupby('k').agg('sum').add_suffix('_sum')
+                    .reset_index())
+        for engine in ('argsort', 'hash'):
+            result = GroupBy(frame, ['k'], engine=engine).agg('sum').df
+            assert_frame_equal(result.sort_values('k')
+                               .reset_index(drop=True), expected,
+                               check_dtype=False)
+        result = frame.filter(frame.expr('k') > 3, inplace=False)
+        assert_frame_equal(result.df, df[df.k > 3].reset_index(drop=True))
+        assert_frame_equal(frame.df, df)
+    finally:
+        shutil.rmtree(frame_dir)
@@ -0,0 +1,66 @@
+# distutils: language = c++
+'''
+Test prepared reductions and group-by operations *(see
+`DeviceViewGroup.prepare_reduce` and `GroupBy.prepare_agg`)*, which are
+compiled once and called with view groups of the same layout.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import Context, DeviceDataFrame, GroupBy
+
+
+def _frame(size=1000, key_range=11, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.rand(size))]))
+
+
+def test_prepare_reduce():
+    context = Context()
+    frames = [_frame(seed=i) for i in xrange(3)]
+    prepared = DeviceDataFrame(frames[0],
+                               context=context).prepare_reduce('plus')
+    for df in frames:
+        result = prepared(DeviceDataFrame(df, context=context))
+        assert(np.allclose(result, df.sum().values))
+
+    prepared = (DeviceDataFrame(frames[0], context=context)
+                .prepare_reduce(['minimum', 'maximum', 'maximum']))
+    for df in frames:
+        result = prepared(DeviceDataFrame(df, context=context))
+        assert(np.allclose(result, [df.k.min(), df.a.max(), df.b.max()]))
+
+
+def test_prepare_reduce_combine():
+    df = _frame()
+    prepared = DeviceDataFrame(df).prepare_reduce(['plus', 'minimum',
+                                                   'maximum'])
+    # Partial results of chunks combine to the result for all rows.
+    partials = [prepared(DeviceDataFrame(df.iloc[i:i + 300]
+                                         .reset_index(drop=True)))
+                for i in xrange(0, len(df), 300)]
+    result = reduce(prepared.combine, partials)
+    assert(np.allclose(result, [df.k.sum(), df.a.min(), df.b.max()]))
+
+
+def test_prepare_agg():
+    context = Context()
+    frames = [_frame(seed=i) for i in xrange(3)]
+    groupby = GroupBy(DeviceDataFrame(frames[0], context=context), ['k'])
+    prepared_agg = groupby.prepare_agg('sum')
+    prepared_count = groupby.prepare_count()
+    for df in frames:
+        result = prepared_agg(DeviceDataFrame(df, context=context)).df
+        expected = (df.groupby('k').agg('sum').add_suffix('_sum')
+                    .reset_index())
+        assert_frame_equal(result, expected, check_dtype=False)
+        result = prepared_count(DeviceDataFrame(df, context=context)).df
+        expected = (df.groupby('k').agg({'a': 'count'})
+                    .rename(columns={'a': 'count'}).reset_index())
+        assert_frame_equal(result, expected, check_dtype=False)
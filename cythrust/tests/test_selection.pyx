@@ -0,0 +1,75 @@
+# distutils: language = c++
+'''
+Test selection views, which filter and sort rows through an index column
+*(see `DeviceViewGroup.select`)*, comparing against the equivalent `pandas`
+operations.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+import theano.tensor as T
+
+from cythrust import DeviceDataFrame
+
+
+def _frame(size=2000, key_range=17, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.rand(size))]))
+
+
+def test_select_filter_sort():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    selection = ddf.select()
+    selection.filter(selection.expr('a') > 0)
+    selection.sort(key='k', stable=True)
+    # The index of the result holds the positions of the selected rows.
+    expected = df[df.a > 0].sort_values('k', kind='mergesort')
+    assert_frame_equal(selection.as_dataframe(), expected,
+                       check_index_type=False)
+    assert_frame_equal(selection.materialize(['b', 'k']).df,
+                       expected[['b', 'k']].reset_index(drop=True))
+    # Column data is never modified.
+    assert_frame_equal(ddf.df, df)
+
+
+def test_select_index():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    index = np.arange(0, len(df), 3)
+    selection = ddf.select(index)
+    assert_frame_equal(selection.materialize().df,
+                       df.iloc[index].reset_index(drop=True))
+    # Indexes of selections are composed with the selection index.
+    composed = selection.select(np.array([4, 0, 2]))
+    assert_frame_equal(composed.materialize().df,
+                       df.iloc[index[[4, 0, 2]]].reset_index(drop=True))
+
+
+def test_selection_reduce():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    selection = ddf.select()
+    selection.filter(selection.expr('k') < 5)
+    expected = df[df.k < 5]
+    assert(np.allclose(selection.reduce('plus'), expected.sum().values))
+    # Prepared reductions only reduce the selected rows.
+    prepared = ddf.prepare_reduce('plus')
+    assert(np.allclose(prepared(selection), expected.sum().values))
+    result = selection.groupby(['k']).agg('sum').df
+    assert_frame_equal(result, expected.groupby('k').agg('sum')
+                       .add_suffix('_sum').reset_index(), check_dtype=False)
+
+    a = selection.tensor('a')
+    try:
+        selection.scatter(selection.size, a.take(T.arange(0)),
+                          a.take(T.arange(0)))
+    except NotImplementedError:
+        pass
+    else:
+        raise AssertionError('Expected `NotImplementedError`.')
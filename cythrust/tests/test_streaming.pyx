@@ -0,0 +1,102 @@
+# distutils: language = c++
+'''
+Test streaming operations over chunks of rows *(see `chunk_view_group`)*,
+comparing against the equivalent `pandas` operations for all rows.
+'''
+import shutil
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from cythrust import (Context, DeviceDataFrame, stream_describe,
+                      stream_groupby, stream_reduce)
+
+
+def _frame(size=3000, key_range=29, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('k', np.random.randint(0, key_range, size).astype(np.int32)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int64)),
+        ('b', np.random.randint(0, 1000, size).astype(np.uint32))]))
+
+
+def _chunks(df, chunk_size):
+    return [df.iloc[i:i + chunk_size].reset_index(drop=True)
+            for i in xrange(0, len(df), chunk_size)]
+
+
+def test_stream_reduce():
+    df = _frame()
+    context = Context()
+    for chunk_size in (700, len(df)):
+        result = stream_reduce(_chunks(df, chunk_size), ['plus', 'minimum',
+                                                         'maximum'],
+                               context=context)
+        assert(np.allclose(result, [df.k.sum(), df.a.min(), df.b.max()]))
+    try:
+        stream_reduce([], context=context)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Expected `ValueError`.')
+
+
+def test_stream_describe():
+    df = _frame()
+    context = Context()
+    result = stream_describe(_chunks(df, 700), context=context)
+    # Same summary as describing all rows at once, up to rounding of the
+    # `float32` partial sums *(see `get_describe_transforms`)*.
+    expected = DeviceDataFrame(df, context=context).describe()
+    assert((result.index == expected.index).all())
+    assert(np.allclose(result.values, expected.values, rtol=1e-3))
+    for column in df.columns:
+        assert(np.isclose(result[column, 'mean'], df[column].mean(),
+                          rtol=1e-3))
+        assert(np.isclose(result[column, 'std'], df[column].std(),
+                          rtol=1e-3))
+
+
+def test_stream_groupby():
+    df = _frame()
+    context = Context()
+    chunks = _chunks(df, 700)
+    as_arrays = [OrderedDict([(c, chunk[c].values) for c in chunk.columns])
+                 for chunk in chunks]
+    as_frames = [DeviceDataFrame(chunk, context=context) for chunk in chunks]
+    for chunk_list in (chunks, as_arrays, as_frames):
+        result = stream_groupby(chunk_list, ['k'], 'sum',
+                                context=context).df
+        expected = (df.groupby('k').agg('sum').add_suffix('_sum')
+                    .reset_index())
+        assert_frame_equal(result, expected, check_dtype=False)
+
+    result = stream_groupby(chunks, ['k'], context=context).df
+    expected = (df.groupby('k').agg({'a': 'count'})
+                .rename(columns={'a': 'count'}).reset_index())
+    assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_stream_groupby_directories():
+    df = _frame()
+    root = tempfile.mkdtemp(prefix='cythrust__')
+    try:
+        frame_dirs = []
+        for i, chunk in enumerate(_chunks(df, 700)):
+            frame_dir = '%s/chunk%d' % (root, i)
+            DeviceDataFrame(chunk).to_directory(frame_dir)
+            frame_dirs.append(frame_dir)
+        result = stream_groupby(frame_dirs, ['k'], ('sum', 'max')).df
+        expected = df.groupby('k').agg(['sum', 'max'])
+        expected.columns = ['_'.join(c) for c in expected.columns.values]
+        assert_frame_equal(result, expected.reset_index(), check_dtype=False)
+        # On-disk chunks are mapped copy-on-write, and are not modified.
+        for frame_dir, chunk in zip(frame_dirs, _chunks(df, 700)):
+            assert_frame_equal(DeviceDataFrame.from_directory(frame_dir,
+                                                              mode='r').df,
+                               chunk)
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,102 @@
+# distutils: language = c++
+'''
+Test transforms of `theano` operation graphs, the caching of the compiled
+functions *(see `graph_fingerprint`)*, and multi-output transforms computed
+by a single functor *(see `FusedTransform`)*.
+'''
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import theano.tensor as T
+
+from cythrust import (DeviceDataFrame, fused_transform_code, graph_fingerprint,
+                      transform_name)
+
+
+def _frame(size=1000, seed=0):
+    np.random.seed(seed)
+    return pd.DataFrame(OrderedDict([
+        ('x', np.random.randint(0, 10, size).astype(np.uint8)),
+        ('a', np.random.randint(-100, 100, size).astype(np.int32)),
+        ('b', np.random.randint(-100, 100, size).astype(np.int32))]))
+
+
+def _graph(a, b, factor=2):
+    return a * factor + b
+
+
+def test_graph_fingerprint():
+    a, b = [T.vector(c, dtype='int32') for c in 'ab']
+    a2, b2 = [T.vector(c, dtype='int32') for c in 'ab']
+    # Structurally identical graphs have the same fingerprint.
+    assert(graph_fingerprint(_graph(a, b)) == graph_fingerprint(_graph(a2,
+                                                                       b2)))
+    assert(transform_name('foo', _graph(a, b)) ==
+           transform_name('foo', _graph(a2, b2)))
+    # Constants, input names, and input types are part of the fingerprint.
+    assert(graph_fingerprint(_graph(a, b)) !=
+           graph_fingerprint(_graph(a, b, factor=3)))
+    assert(graph_fingerprint(_graph(a, b)) != graph_fingerprint(_graph(b,
+                                                                       a)))
+    assert(graph_fingerprint(_graph(a, b)) !=
+           graph_fingerprint(_graph(T.vector('a', dtype='int64'), b)))
+
+
+def test_transform_layouts():
+    df = _frame()
+    expected = df.a.values * 2 + df.b.values
+    # Functions are compiled for the layout of the transformed views, so
+    # frames with the same graph but different columns do not share them.
+    for columns in (['a', 'b'], ['b', 'a'], ['x', 'a', 'b']):
+        ddf = DeviceDataFrame(df[columns])
+        a, b = ddf.tensor(['a', 'b'])
+        result = ddf.transform({'c': _graph(a, b)})
+        assert((result.df.c.values == expected).all())
+
+
+def test_fused_transform_code():
+    a, b, c = [T.vector(name, dtype='int64') for name in 'abc']
+    inputs, temporaries, outputs = fused_transform_code([a * b + c,
+                                                         (a * b) ** 2])
+    assert([name for name, dtype in inputs] == ['a', 'b', 'c'])
+    # The shared subexpression `a * b` is only computed once.
+    assert(len([t for t in temporaries if t[2] == '_in0 * _in1']) == 1)
+    assert(len(outputs) == 2)
+    # `arange` is only supported as the indices of an identity `take`.
+    fused_transform_code([a.take(T.arange(0, 10, 1))])
+    for graph in (a.take(T.arange(1, 10, 1)), a + T.arange(10)):
+        try:
+            fused_transform_code([graph])
+        except NotImplementedError:
+            pass
+        else:
+            raise AssertionError('Expected `NotImplementedError`.')
+
+
+def test_fused_transform():
+    np.random.seed(0)
+    size = 1000
+    a = np.random.randint(-100, 100, size).astype(np.int64)
+    b = np.random.randint(1, 10, size) * np.random.choice([-1, 1], size)
+    df = pd.DataFrame(OrderedDict([('a', a), ('b', b.astype(np.int64))]))
+    ddf = DeviceDataFrame(df)
+    a_, b_ = ddf.tensor(['a', 'b'])
+    result = ddf.transform(OrderedDict([('q', a_ // b_), ('r', a_ % b_),
+                                        ('s', a_ * b_ + a_)])).df
+    # Floor division and modulo round like Python and `numpy`, rather than
+    # C++ *(i.e., towards zero)*.
+    assert((result.q.values == np.floor_divide(df.a, df.b)).all())
+    assert((result.r.values == np.mod(df.a, df.b)).all())
+    assert((result.s.values == df.a * df.b + df.a).all())
+
+
+def test_fused_transform_fallback():
+    df = _frame()
+    ddf = DeviceDataFrame(df)
+    a, b = ddf.tensor(['a', 'b'])
+    # `arange` cannot be fused, so one functor is built per output.
+    result = ddf.transform(OrderedDict([('c', _graph(a, b)),
+                                        ('i', a - a + T.arange(ddf.size))]))
+    assert((result.df.c.values == df.a.values * 2 + df.b.values).all())
+    assert((result.df.i.values == np.arange(ddf.size)).all())
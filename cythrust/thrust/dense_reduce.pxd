@@ -0,0 +1,6 @@
+cdef extern from "src/dense_reduce.hpp" namespace "cythrust" nogil:
+    size_t dense_reduce_by_key[KeyIterator, ValueIterator, KeyOutIterator,
+                               ValueOutIterator, BinaryFunction] \
+        (KeyIterator keys, size_t n, ValueIterator values,
+         KeyOutIterator keys_out, ValueOutIterator values_out,
+         BinaryFunction op, size_t max_key_range) except +
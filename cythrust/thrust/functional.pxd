@@ -99,6 +99,18 @@ cdef extern from "src/functional.hpp" namespace "cythrust" nogil:
     cdef cppclass minmax[T]:
         pass
 
+    cdef cppclass take_first[T]:
+        pass
+
+    cdef cppclass take_last[T]:
+        pass
+
+    cdef cppclass arg_minimum[T]:
+        pass
+
+    cdef cppclass arg_maximum[T]:
+        pass
+
     cdef cppclass absolute[T]:
         pass
 
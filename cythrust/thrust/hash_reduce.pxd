@@ -0,0 +1,12 @@
+cdef extern from "src/hash_reduce.hpp" namespace "cythrust" nogil:
+    cdef cppclass key_hash[T]:
+        pass
+
+    cdef cppclass tuple_hash[T]:
+        pass
+
+    size_t hash_reduce_by_key[KeyIterator, ValueIterator, KeyOutIterator,
+                              ValueOutIterator, Hash, BinaryFunction] \
+        (KeyIterator keys, size_t n, ValueIterator values,
+         KeyOutIterator keys_out, ValueOutIterator values_out, Hash hash,
+         BinaryFunction op) except +
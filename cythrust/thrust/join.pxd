@@ -0,0 +1,22 @@
+cdef extern from "src/join.hpp" namespace "cythrust" nogil:
+    cdef enum join_type:
+        INNER_JOIN
+        LEFT_JOIN
+        SEMI_JOIN
+
+    size_t join_count[LeftKeyIterator, RightKeyIterator, BoundIterator,
+                      OffsetIterator] \
+        (LeftKeyIterator left_keys, size_t n, RightKeyIterator right_keys,
+         size_t m, int how, BoundIterator lower, BoundIterator upper,
+         OffsetIterator offset) except +
+    void join_expand[BoundIterator, OffsetIterator, LeftIndexIterator,
+                     RightIndexIterator, UnmatchedIterator] \
+        (BoundIterator lower, BoundIterator upper, OffsetIterator offset,
+         size_t n, int how, LeftIndexIterator left_index,
+         RightIndexIterator right_index, UnmatchedIterator unmatched) \
+        except +
+    size_t range_count[SortedKeyIterator, QueryIterator, BoundIterator,
+                       OffsetIterator] \
+        (SortedKeyIterator sorted_keys, size_t m, QueryIterator lo,
+         QueryIterator hi, size_t n, BoundIterator lower, BoundIterator upper,
+         OffsetIterator offset) except +
@@ -0,0 +1,7 @@
+from libc.stdint cimport uintptr_t
+from cythrust.thrust.device_vector cimport device_vector
+
+
+cdef extern from "src/memory.hpp" namespace "cythrust" nogil:
+    uintptr_t raw_address 'cythrust::raw_address' [Iterator](Iterator it)
+    device_vector[T].iterator device_iterator 'cythrust::device_iterator' [T](T *data)
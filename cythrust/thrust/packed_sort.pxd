@@ -0,0 +1,10 @@
+cdef extern from "src/packed_sort.hpp" namespace "cythrust" nogil:
+    cdef cppclass pack_tuple[T]:
+        pass
+
+    void packed_sort_index[KeyIterator, Packer, IndexIterator] \
+        (KeyIterator keys, size_t n, Packer packer, IndexIterator index) \
+        except +
+    void gather_in_place[Iterator, IndexIterator](Iterator values, size_t n,
+                                                  IndexIterator index) \
+        except +
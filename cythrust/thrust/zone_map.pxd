@@ -0,0 +1,4 @@
+cdef extern from "src/zone_map.hpp" namespace "cythrust" nogil:
+    void block_minmax[Iterator, MinIterator, MaxIterator] \
+        (Iterator values, size_t n, size_t block_size, MinIterator mins,
+         MaxIterator maxs) except +
@@ -29,6 +29,61 @@ INTEGRAL_DEVICE_VECTOR_TYPES = DEVICE_VECTOR_TYPES[:-2]
 FLOAT_DEVICE_VECTOR_TYPES = DEVICE_VECTOR_TYPES[-2:]
 
 
+# Compile arguments for each host Thrust device backend that may be shipped as
+# prebuilt `DeviceVector` package extensions.  These match the arguments used
+# by `cythrust.Context` for the respective backend.
+DEVICE_SYSTEM_EXTENSION_KWARGS = {
+    'THRUST_DEVICE_SYSTEM_CPP': {'extra_compile_args': ['-O3']},
+    'THRUST_DEVICE_SYSTEM_OMP': {'extra_compile_args': ['-O3', '-fopenmp'],
+                                 'extra_link_args': ['-fopenmp']},
+    'THRUST_DEVICE_SYSTEM_TBB': {'extra_compile_args': ['-O3'],
+                                 'extra_link_args': ['-ltbb']}}
+
+# Comma-separated list of device backends *(e.g.,
+# `THRUST_DEVICE_SYSTEM_CPP,THRUST_DEVICE_SYSTEM_OMP`)* to build `DeviceVector`
+# extensions for as part of the package.  By default, no device vector
+# extensions are prebuilt, and they are compiled on first use instead.
+PREBUILT_DEVICE_SYSTEMS = [s.strip() for s in
+                           os.environ.get('CYTHRUST_DEVICE_SYSTEMS',
+                                          '').split(',') if s.strip()]
+
+
+def generate_device_vector_sources(device_system):
+    '''
+    Render `DeviceVector` Cython sources for each type in
+    `DEVICE_VECTOR_TYPES` into the `cythrust.device_vector.<system>.<dtype>`
+    package, using the same layout as `cythrust.Context` uses for dynamically
+    compiled device vector modules.
+
+    Returns a list of paths to the generated `.pyx` files.
+    '''
+    template_dir = path('cythrust').joinpath('template')
+    pyx_template = jinja2.Template(template_dir.joinpath('device_vector.pyxt')
+                                   .bytes())
+    pxd_template = jinja2.Template(template_dir.joinpath('device_vector.pxdt')
+                                   .bytes())
+    system_key = device_system.split('_')[-1].lower()
+
+    pyx_files = []
+    for c_dtype, np_dtype in DEVICE_VECTOR_TYPES:
+        pyx_dir = path('cythrust').joinpath('device_vector', system_key,
+                                            np_dtype[3:])
+        pyx_dir.makedirs_p()
+        for d in (pyx_dir.parent.parent, pyx_dir.parent, pyx_dir):
+            d.joinpath('__init__.pxd').write_bytes('')
+            d.joinpath('__init__.py').write_bytes('')
+        pyx_dir.joinpath('__init__.py').write_bytes(
+            'from device_vector import *')
+        pyx_dir.joinpath('device_vector.pyx').write_bytes(
+            pyx_template.render(C_DTYPE=c_dtype, NP_DTYPE=np_dtype,
+                                HOST_MEMORY=True))
+        pyx_dir.joinpath('device_vector.pxd').write_bytes(
+            pxd_template.render(C_DTYPE=c_dtype, NP_DTYPE=np_dtype,
+                                HOST_MEMORY=True))
+        pyx_files.append(str(pyx_dir.joinpath('device_vector.pyx')))
+    return pyx_files
+
+
 pyx_files = ['cythrust/si_prefix.pyx']
 
 
@@ -37,8 +92,30 @@ ext_modules = [Extension(f[:-4].replace('/', '.'), [f],
                          include_dirs=['cythrust'])
                for f in pyx_files]
 
+for device_system in PREBUILT_DEVICE_SYSTEMS:
+    if device_system not in DEVICE_SYSTEM_EXTENSION_KWARGS:
+        raise ValueError('Prebuilt device vectors are not supported for: %s'
+                         % device_system)
+    ext_modules += [Extension(f[:-4].replace('/', '.'), [f],
+                              language='c++',
+                              define_macros=[('THRUST_DEVICE_SYSTEM',
+                                              device_system)],
+                              include_dirs=['cythrust', numpy.get_include()],
+                              **DEVICE_SYSTEM_EXTENSION_KWARGS[device_system])
+                    for f in generate_device_vector_sources(device_system)]
+
 ext_modules = cythonize(ext_modules)
 
+prebuilt_packages = sorted(set(
+    ['cythrust.device_vector'] +
+    ['cythrust.device_vector.%s' % device_system.split('_')[-1].lower()
+     for device_system in PREBUILT_DEVICE_SYSTEMS] +
+    ['cythrust.device_vector.%s.%s' % (device_system.split('_')[-1].lower(),
+                                       np_dtype[3:])
+     for device_system in PREBUILT_DEVICE_SYSTEMS
+     for c_dtype, np_dtype in DEVICE_VECTOR_TYPES])) \
+    if PREBUILT_DEVICE_SYSTEMS else []
+
 
 setup(name='cythrust',
       version=version.getVersion(),
@@ -47,11 +124,12 @@ setup(name='cythrust',
       author='Christian Fobel',
       url='https://github.com/cfobel/cythrust',
       license='GPL',
-      packages=['cythrust'],
+      packages=['cythrust'] + prebuilt_packages,
       package_data=find_package_data('cythrust', package='cythrust',
                                      only_in_packages=False),
       ext_modules=ext_modules,
-      install_requires=['pandas', 'Cybuild', 'jinja2', 'theano-helpers'])
+      install_requires=['pandas', 'Cybuild', 'jinja2', 'theano-helpers',
+                        'futures'])
 
 
 @task
@@ -59,6 +137,25 @@ def build_ext():
     pass
 
 
+@task
+@cmdopts([make_option('-s', '--device-system', action='append',
+                      dest='device_systems',
+                      help='Thrust device backend to build device vectors '
+                      'for (may be specified multiple times).  Default: all '
+                      'backends.')])
+def prebuild_device_vectors(options):
+    '''
+    Build device vector modules for all data types into the `cythrust`
+    runtime library cache *(see `cythrust.prebuild`)*.
+    '''
+    import cythrust
+
+    device_systems = options.prebuild_device_vectors.get('device_systems')
+    for device_system, module_names in (cythrust.prebuild(device_systems)
+                                        .iteritems()):
+        print '%s: %d modules' % (device_system, len(module_names))
+
+
 @task
 @needs('build_ext', 'generate_setup', 'minilib', 'setuptools.command.sdist')
 def sdist():